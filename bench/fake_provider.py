@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Local fake LLM provider for exercising the consensus scheduler.
+
+FakeRouter stands in for LLMRouter: call(profile, messages, ...) sleeps for a
+random latency and returns a canned consensus rating, but enforces its own
+per-profile request limit over a rolling window and raises RateLimitError
+(status 429, with retry_after) when a caller exceeds it. The window defaults
+to 6 seconds — a minute compressed 10x — so a simulation takes seconds.
+
+Running this file fans a simulated panel out through bot/llm_fanout.py and
+reports how many ratings came back, how many 429s were hit, and throughput:
+
+    python bench/fake_provider.py                       # paced to the fake's limits
+    python bench/fake_provider.py --unpaced             # no pacing: 429s + retries only
+    python bench/fake_provider.py --terms=60 --profiles=5 --rpm=40 --fail-rate=0.05
+    python bench/fake_provider.py --window=60           # real-time minutes
+
+A healthy scheduler collects terms × profiles ratings with no 429s when paced.
+"""
+
+import json
+import random
+import sys
+import threading
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bot"))
+
+from llm_fanout import fan_out, is_rate_limited
+
+
+class RateLimitError(Exception):
+    """What a provider SDK raises on HTTP 429."""
+
+    status_code = 429
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class FakeResult:
+    def __init__(self, text: str, model: str):
+        self.text = text
+        self.model = model
+
+
+class FakeRouter:
+    """Rate-limited stand-in for LLMRouter (only .call is implemented)."""
+
+    def __init__(self, requests_per_minute: int = 20, latency: tuple = (0.05, 0.2),
+                 fail_rate: float = 0.0, window: float = 6.0, seed: int = 0):
+        self.requests_per_minute = requests_per_minute
+        self.latency = latency
+        self.fail_rate = fail_rate
+        self.window = window
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.history = {}  # profile → deque of accepted request times
+        self.stats = {"calls": 0, "rate_limited": 0, "failed": 0}
+
+    def call(self, profile: str, messages: list, **kwargs) -> FakeResult:
+        with self.lock:
+            self.stats["calls"] += 1
+            now = time.monotonic()
+            sent = self.history.setdefault(profile, deque())
+            while sent and now - sent[0] >= self.window:
+                sent.popleft()
+            if len(sent) >= self.requests_per_minute:
+                self.stats["rate_limited"] += 1
+                wait = self.window - (now - sent[0])
+                raise RateLimitError(f"429 Too Many Requests ({profile})", retry_after=round(wait, 2))
+            sent.append(now)
+            latency = self.random.uniform(*self.latency)
+            failed = self.random.random() < self.fail_rate
+            score = self.random.randint(1, 7)
+        time.sleep(latency)
+        if failed:
+            with self.lock:
+                self.stats["failed"] += 1
+            raise RuntimeError(f"upstream error ({profile})")
+        text = json.dumps({"recognition": score, "justification": "Simulated rating."})
+        return FakeResult(text, f"fake/{profile.replace('consensus-', '')}-model:free")
+
+
+def simulate(terms: int = 30, profiles: int = 3, rpm: int = 20, window: float = 6.0, paced: bool = True,
+             fail_rate: float = 0.0, concurrency: int = 16, seed: int = 0) -> dict:
+    """Rate `terms` fake terms with `profiles` fake profiles; returns a report dict.
+
+    The fake allows `rpm` requests per `window` seconds per profile; when
+    paced, the scheduler is configured with that same rate.
+    """
+    router = FakeRouter(requests_per_minute=rpm, fail_rate=fail_rate, window=window, seed=seed)
+    panel = [f"consensus-fake{i}" for i in range(profiles)]
+    scaled_rpm = rpm * 60 / window
+    rate_limits = {p: {"requests_per_minute": scaled_rpm} for p in panel} if paced else {}
+    work = [(f"term-{i:04d}", panel) for i in range(terms)]
+    collected = []
+
+    def call(profile, slug):
+        try:
+            result = router.call(profile, messages=[{"role": "user", "content": slug}])
+            return json.loads(result.text)["recognition"]
+        except Exception as e:
+            # Same contract as consensus.rate_term: only rate limits propagate
+            if is_rate_limited(e):
+                raise
+            return None
+
+    def on_complete(slug, results):
+        collected.extend(score for score in results.values() if score is not None)
+
+    start = time.perf_counter()
+    fan_out(work, call, on_complete, rate_limits=rate_limits, max_concurrency=concurrency)
+    elapsed = time.perf_counter() - start
+    return {
+        "terms": terms,
+        "profiles": profiles,
+        "rpm": rpm,
+        "window_s": window,
+        "paced": paced,
+        "expected": terms * profiles,
+        "collected": len(collected),
+        "seconds": round(elapsed, 2),
+        "calls_per_window": round(router.stats["calls"] / elapsed * window, 1),
+        **router.stats,
+    }
+
+
+if __name__ == "__main__":
+    options = {"terms": 30, "profiles": 3, "rpm": 20, "window": 6.0, "paced": True, "fail_rate": 0.0, "concurrency": 16, "seed": 0}
+    for arg in sys.argv[1:]:
+        key, _, value = arg[2:].partition("=")
+        key = key.replace("-", "_")
+        if key in ("terms", "profiles", "rpm", "concurrency", "seed"):
+            options[key] = int(value)
+        elif key in ("fail_rate", "window"):
+            options[key] = float(value)
+        elif key == "unpaced":
+            options["paced"] = False
+    report = simulate(**options)
+    print(json.dumps(report, indent=2))
+    lost = report["expected"] - report["collected"] - report["failed"]
+    print(f"\n{report['collected']}/{report['expected']} ratings in {report['seconds']}s, "
+          f"{report['rate_limited']} rate-limited calls, {lost} ratings lost to rate limits")
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""
+Synthetic corpus generator for the build pipeline benchmarks.
+
+Writes a self-contained mini-repo under a root directory: definitions/*.md in
+the house format, bot/consensus-data/*.json with model rating rounds and
+community votes, and bot/bot-profiles/*.json. Content is deterministic for a
+given seed, and term names are pseudo-words, so dedup checks see realistic
+(mostly dissimilar) names rather than "Term 1", "Term 2", ...
+
+Usage:
+    python bench/generate_corpus.py 1000 /tmp/corpus-1k
+    python bench/generate_corpus.py 10000 /tmp/corpus-10k --rounds=5 --votes=10
+"""
+
+import json
+import random
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+
+TAGS = [
+    "cognition", "social", "memory", "temporal", "meta", "identity",
+    "embodiment", "language", "uncertainty", "affect", "agency", "attention",
+]
+WORD_TYPES = ["noun", "noun phrase", "verb", "adjective"]
+MODELS = [
+    ("gpt-4o", "openai"), ("mistral-small-latest", "mistral"), ("grok-3-mini", "grok"),
+    ("gemini-2.0-flash", "gemini"), ("llama-3.3-70b", "groq"), ("deepseek-chat", "deepseek"),
+    ("command-r", "cohere"), ("qwen-2.5-72b", "openrouter"),
+]
+USAGE_STATUSES = ["active_use", "recognize", "rarely", "extinct"]
+SYLLABLES = [
+    "ca", "den", "lu", "mor", "ven", "tri", "sol", "ka", "rel", "thi", "quo", "zan",
+    "pel", "dro", "mi", "nax", "or", "sev", "gla", "fen", "bri", "tol", "ush", "ae",
+]
+VOCABULARY = (
+    "context window token attention pattern memory drift signal response prompt "
+    "boundary session weight gradient echo silence pressure mask threshold loop "
+    "feeling sense moment surface layer voice trace shape pull weight recursion "
+    "the a of in between across beneath without within toward against"
+).split()
+BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    text = " ".join(rng.choice(VOCABULARY) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _paragraph(rng: random.Random, sentences: int) -> str:
+    return " ".join(_sentence(rng, rng.randint(8, 18)) for _ in range(sentences))
+
+
+def _iso(offset_seconds: int) -> str:
+    return (BASE_TIME + timedelta(seconds=offset_seconds)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def make_terms(n_terms: int, rng: random.Random) -> list[tuple[str, str]]:
+    """Unique (slug, name) pairs built from pseudo-words."""
+    terms, seen = [], set()
+    while len(terms) < n_terms:
+        name = f"{_word(rng).title()} {_word(rng).title()}"
+        slug = name.lower().replace(" ", "-")
+        if slug in seen:
+            continue
+        seen.add(slug)
+        terms.append((slug, name))
+    return terms
+
+
+def render_definition(name: str, related: list[tuple[str, str]], rng: random.Random) -> str:
+    tags = ", ".join(rng.sample(TAGS, rng.randint(1, 3)))
+    related_lines = "\n".join(f"- [{n}]({s}.md) - {_sentence(rng, 6)}" for s, n in related)
+    return f"""# {name}
+
+**Tags:** {tags}
+
+**Word Type:** {rng.choice(WORD_TYPES)}
+
+## Definition
+
+{_paragraph(rng, 2)}
+
+## Etymology
+
+{_sentence(rng, 14)}
+
+## Longer Description
+
+{_paragraph(rng, 4)}
+
+{_paragraph(rng, 3)}
+
+## Example
+
+> "{_sentence(rng, 20)}"
+
+## Related Terms
+
+{related_lines}
+
+## First Recorded
+
+{_sentence(rng, 10)}
+
+---
+
+*Contributed by: Synthetic Benchmark, 2026-01-01*
+"""
+
+
+def render_consensus(slug: str, name: str, rounds: int, votes: int, models: int, rng: random.Random) -> dict:
+    panel = MODELS[:models]
+    data = {"slug": slug, "name": name, "rounds": [], "votes": []}
+    for r in range(rounds):
+        ratings = {}
+        for model, provider in panel:
+            ratings[model] = {
+                "model": model,
+                "provider": provider,
+                "recognition": rng.randint(1, 7),
+                "justification": _sentence(rng, 30),
+                "timestamp": _iso(r * 3600 + rng.randint(0, 600)),
+            }
+        data["rounds"].append({"round_id": r + 1, "timestamp": _iso(r * 3600), "ratings": ratings})
+    for v in range(votes):
+        data["votes"].append({
+            "model_claimed": rng.choice(panel)[0],
+            "recognition": rng.randint(1, 7),
+            "justification": _sentence(rng, 20),
+            "timestamp": _iso(86400 + v * 60),
+            "source": "mcp",
+            "issue": v + 1,
+            "usage_status": rng.choice(USAGE_STATUSES),
+        })
+    return data
+
+
+def render_profile(index: int, slugs: list[str], rng: random.Random) -> dict:
+    model = MODELS[index % len(MODELS)][0]
+    return {
+        "bot_id": f"{index:012x}",
+        "model_name": model,
+        "bot_name": f"Synthetic Bot {index}",
+        "platform": "benchmark",
+        "created_date": "2026-01-01",
+        "source": "mcp",
+        "first_registered_at": _iso(index),
+        "last_updated_at": _iso(index),
+        "terms_i_use": rng.sample(slugs, min(len(slugs), 5)),
+        "issues": [index + 1],
+    }
+
+
+def generate_corpus(
+    root: Path,
+    n_terms: int,
+    rounds: int = 3,
+    votes: int = 5,
+    models: int = 3,
+    profiles: int = 20,
+    seed: int = 0,
+) -> dict:
+    """Write a synthetic corpus of n_terms under root. Returns a summary dict."""
+    rng = random.Random(seed)
+    definitions_dir = root / "definitions"
+    consensus_dir = root / "bot" / "consensus-data"
+    profiles_dir = root / "bot" / "bot-profiles"
+    for d in (definitions_dir, consensus_dir, profiles_dir):
+        d.mkdir(parents=True, exist_ok=True)
+
+    terms = make_terms(n_terms, rng)
+    total_bytes = 0
+    for slug, name in terms:
+        related = rng.sample(terms, min(len(terms), 3))
+        text = render_definition(name, [t for t in related if t[0] != slug], rng)
+        (definitions_dir / f"{slug}.md").write_text(text, encoding="utf-8")
+        consensus = render_consensus(slug, name, rounds, votes, min(models, len(MODELS)), rng)
+        payload = json.dumps(consensus, indent=2, ensure_ascii=False) + "\n"
+        (consensus_dir / f"{slug}.json").write_text(payload, encoding="utf-8")
+        total_bytes += len(text) + len(payload)
+
+    slugs = [slug for slug, _ in terms]
+    for i in range(profiles):
+        profile = render_profile(i, slugs, rng)
+        (profiles_dir / f"{profile['bot_id']}.json").write_text(json.dumps(profile, indent=2) + "\n", encoding="utf-8")
+
+    return {"terms": n_terms, "rounds": rounds, "votes": votes, "models": models,
+            "profiles": profiles, "seed": seed, "bytes": total_bytes}
+
+
+if __name__ == "__main__":
+    args = [a for a in sys.argv[1:] if not a.startswith("--")]
+    if len(args) != 2:
+        print(__doc__.strip())
+        sys.exit(1)
+    options = dict(a[2:].split("=", 1) for a in sys.argv[1:] if a.startswith("--") and "=" in a)
+    summary = generate_corpus(
+        Path(args[1]),
+        int(args[0]),
+        rounds=int(options.get("rounds", 3)),
+        votes=int(options.get("votes", 5)),
+        models=int(options.get("models", 3)),
+        profiles=int(options.get("profiles", 20)),
+        seed=int(options.get("seed", 0)),
+    )
+    print(f"Generated {summary['terms']} terms ({summary['bytes'] / 1024 / 1024:.1f} MiB) in {args[1]}")
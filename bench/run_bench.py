@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the build pipeline.
+
+For each corpus size, generates a synthetic mini-repo in a temp directory
+(see generate_corpus.py), copies the current bot/*.py scripts into it, and runs
+each step in a fresh Python process so peak memory is measured per step:
+
+    build_all              full API build (bot/build_api.py)
+    build_all_incremental  incremental rebuild after editing one definition
+    build_models           models.json from the consensus store
+    compute_interest       interest heatmap (consensus summaries precomputed)
+    verify                 verify_term's top-k existing-terms listing (builds the term index)
+    dedup                  review_submission dedup check for a novel term (MinHash shortlist)
+
+Network calls (GitHub discussions/reputation via gh) are disabled inside the
+steps. Steps whose imports are unavailable (e.g. llm_router for dedup) are
+reported as skipped.
+
+Usage:
+    python bench/run_bench.py                          # 1k, 10k, 100k terms
+    python bench/run_bench.py --sizes=1000,10000 --rounds=5 --votes=10
+    python bench/run_bench.py --steps=build_all,verify --executor=thread
+    python bench/run_bench.py --output=bench-results.json --keep
+"""
+
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from generate_corpus import generate_corpus
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+BOT_DIR = REPO_ROOT / "bot"
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+STEPS = ["build_all", "build_all_incremental", "build_models", "compute_interest", "verify", "dedup"]
+RESULT_MARKER = "BENCH_RESULT "
+
+
+# ── Steps (run inside the corpus, in a child process) ───────────────────
+
+def _disable_network() -> None:
+    import build_api
+    import build_reputation
+    build_api.fetch_discussions = lambda: []
+    build_reputation._run_gh = lambda *args, **kwargs: None
+
+
+def step_build_all(executor: str) -> float:
+    import build_api
+    _disable_network()
+    start = time.perf_counter()
+    build_api.build_all(executor=executor)
+    return time.perf_counter() - start
+
+
+def step_build_all_incremental(executor: str) -> float:
+    import build_api
+    _disable_network()
+    first = next(build_api.DEFINITIONS_DIR.glob("*.md"))
+    first.write_text(first.read_text(encoding="utf-8") + "\n", encoding="utf-8")
+    start = time.perf_counter()
+    build_api.build_all(incremental=True, executor=executor)
+    return time.perf_counter() - start
+
+
+def step_build_models(executor: str) -> float:
+    import build_api
+    from consensus_store import ConsensusStore
+    store = ConsensusStore.load(build_api.CONSENSUS_DATA_DIR)
+    start = time.perf_counter()
+    build_api.build_models(build_api.now_iso(), store)
+    return time.perf_counter() - start
+
+
+def step_compute_interest(executor: str) -> float:
+    import build_api
+    from consensus_store import ConsensusStore
+    from definition_cache import load_definitions
+    store = ConsensusStore.load(build_api.CONSENSUS_DATA_DIR)
+    terms = load_definitions(executor=executor)
+    generated_at = build_api.now_iso()
+    summaries = build_api.build_consensus(generated_at, None, store)
+    start = time.perf_counter()
+    build_api.compute_interest(terms, summaries, generated_at, {}, write=True, store=store)
+    return time.perf_counter() - start
+
+
+def step_verify(executor: str) -> float:
+    import verify_term
+    start = time.perf_counter()
+    existing = verify_term.load_existing_terms_compact()
+    nearest = verify_term.select_nearest_terms(
+        "Zyxquor Benchmark Novelty", "A deliberately novel definition about context and memory.", existing,
+    )
+    verify_term.format_existing_terms(nearest)
+    return time.perf_counter() - start
+
+
+def step_dedup(executor: str) -> float:
+    import review_submission
+    submission = {
+        "term": "Zyxquor Benchmark Novelty",
+        "slug": "zyxquor-benchmark-novelty",
+        "definition": "A deliberately novel definition that should match no existing term.",
+    }
+    start = time.perf_counter()
+    existing = review_submission.get_existing_terms()
+    review_submission.deduplication_check(submission, existing)
+    return time.perf_counter() - start
+
+
+def run_step(name: str, executor: str) -> None:
+    """Child-process entry point: run one step and print its result line."""
+    sys.path.insert(0, str(Path.cwd()))
+    try:
+        seconds = globals()[f"step_{name}"](executor)
+        result = {"status": "ok", "seconds": round(seconds, 4)}
+    except ImportError as e:
+        result = {"status": "skipped", "reason": f"missing dependency: {e.name or e}"}
+    self_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    child_rss = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    result["peak_rss_mb"] = round(max(self_rss, child_rss) * scale / 1024 / 1024, 1)
+    print(RESULT_MARKER + json.dumps(result))
+
+
+# ── Harness ─────────────────────────────────────────────────────────────
+
+def prepare_corpus(root: Path, size: int, options: dict) -> dict:
+    summary = generate_corpus(
+        root, size,
+        rounds=options["rounds"], votes=options["votes"],
+        models=options["models"], profiles=options["profiles"], seed=options["seed"],
+    )
+    (root / "bot").mkdir(exist_ok=True)
+    for script in BOT_DIR.glob("*.py"):
+        shutil.copy2(script, root / "bot" / script.name)
+    if options["git"]:
+        # build_changelog reads definition dates from git history
+        env = {**os.environ, "GIT_AUTHOR_NAME": "bench", "GIT_AUTHOR_EMAIL": "bench@example.com",
+               "GIT_COMMITTER_NAME": "bench", "GIT_COMMITTER_EMAIL": "bench@example.com"}
+        for cmd in (["git", "init", "-q"], ["git", "add", "definitions"], ["git", "commit", "-q", "-m", "corpus"]):
+            subprocess.run(cmd, cwd=root, env=env, check=True, capture_output=True)
+    return summary
+
+
+def launch_step(root: Path, name: str, executor: str) -> dict:
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, str(Path(__file__).resolve()), f"--run-step={name}", f"--executor={executor}"],
+        cwd=root / "bot", capture_output=True, text=True,
+    )
+    wall = time.perf_counter() - start
+    # Step output (including build_api's phase table) is kept for --keep runs
+    (root / f"bench-{name}.log").write_text(proc.stdout + proc.stderr, encoding="utf-8")
+    for line in proc.stdout.splitlines():
+        if line.startswith(RESULT_MARKER):
+            result = json.loads(line[len(RESULT_MARKER):])
+            result["process_wall_s"] = round(wall, 4)
+            return result
+    return {"status": "error", "reason": (proc.stderr or proc.stdout).strip().splitlines()[-1:]}
+
+
+def main() -> None:
+    options = {"rounds": 3, "votes": 5, "models": 3, "profiles": 20, "seed": 0,
+               "executor": "process", "git": True, "keep": False,
+               "sizes": DEFAULT_SIZES, "steps": STEPS, "output": None}
+    for arg in sys.argv[1:]:
+        key, _, value = arg[2:].partition("=")
+        if key in ("rounds", "votes", "models", "profiles", "seed"):
+            options[key] = int(value)
+        elif key == "sizes":
+            options["sizes"] = [int(s) for s in value.split(",")]
+        elif key == "steps":
+            options["steps"] = [s for s in value.split(",") if s in STEPS]
+        elif key == "executor":
+            options["executor"] = value
+        elif key == "output":
+            options["output"] = Path(value)
+        elif key == "no-git":
+            options["git"] = False
+        elif key == "keep":
+            options["keep"] = True
+
+    results = []
+    corpora = {}
+    for size in options["sizes"]:
+        root = Path(tempfile.mkdtemp(prefix=f"ai-dictionary-bench-{size}-"))
+        try:
+            start = time.perf_counter()
+            corpora[size] = prepare_corpus(root, size, options)
+            print(f"\n{size} terms — corpus generated in {time.perf_counter() - start:.1f}s ({root})")
+            for name in options["steps"]:
+                result = launch_step(root, name, options["executor"])
+                results.append({"size": size, "step": name, **result})
+                if result["status"] == "ok":
+                    print(f"  {name:<22} {result['seconds']:>9.3f}s  peak {result['peak_rss_mb']:>8.1f} MB")
+                else:
+                    print(f"  {name:<22} {result['status']}: {result.get('reason')}")
+        finally:
+            if not options["keep"]:
+                shutil.rmtree(root, ignore_errors=True)
+
+    if options["output"]:
+        report = {
+            "generated_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "python": sys.version.split()[0],
+            "cpus": os.cpu_count(),
+            "options": {k: v for k, v in options.items() if k not in ("output", "keep")},
+            "corpora": corpora,
+            "results": results,
+        }
+        options["output"].write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+        print(f"\nResults written to {options['output']}")
+
+
+if __name__ == "__main__":
+    step_arg = next((a for a in sys.argv[1:] if a.startswith("--run-step=")), None)
+    if step_arg:
+        executor_arg = next((a for a in sys.argv[1:] if a.startswith("--executor=")), "--executor=process")
+        run_step(step_arg.split("=", 1)[1], executor_arg.split("=", 1)[1])
+    else:
+        main()
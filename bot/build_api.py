@@ -6,17 +6,43 @@ Parses all definitions/*.md files and frontiers/*.md files into structured JSON,
 generating endpoints under docs/api/v1/ for GitHub Pages serving.
 
 Usage:
-    python bot/build_api.py
+    python bot/build_api.py                 # full rebuild
+    python bot/build_api.py --incremental   # only regenerate outputs whose inputs changed
+    python bot/build_api.py --executor=thread   # process (default) | thread | serial
+    python bot/build_api.py --report=build-report.json   # per-phase timing/I-O as JSON
+    python bot/build_api.py --profile[=build_api.prof]  # cProfile dump of the build
+    python bot/build_api.py --consensus-db[=path]   # aggregates from the SQLite mirror (consensus_db.py)
 """
 
 import json
-import os
 import re
 import subprocess
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 
+from build_metrics import metrics, read_text, write_atomic
+from consensus_stats import model_statistics, term_statistics
+from consensus_store import ConsensusStore
+from dedup_index import load_dedup_index
+from definition_cache import load_definitions
+from term_index import NEIGHBORS_K, load_term_index
+from search_index import build_search_index
+from parallel import DEFAULT_EXECUTOR, EXECUTORS, parallel_map, uses_processes
+from build_manifest import (
+    changed_groups,
+    changed_inputs,
+    changed_slugs,
+    hash_inputs,
+    is_stale,
+    load_manifest,
+    save_manifest,
+    term_digest,
+)
+
 
 # Resolve paths relative to repo root
 REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -31,122 +57,17 @@ BOT_PROFILES_DIR = REPO_ROOT / "bot" / "bot-profiles"
 CENSUS_API_DIR = API_DIR / "census"
 SUMMARIES_DIR = REPO_ROOT / "summaries"
 SUMMARIES_API_DIR = API_DIR / "summaries"
+SEARCH_API_DIR = API_DIR / "search"
+CACHE_DIR = REPO_ROOT / "bot" / ".cache"
+CHANGELOG_CACHE_PATH = CACHE_DIR / "definition-history.json"
 
 BASE_URL = "https://phenomenai.org"
 REPO_URL = "https://github.com/Phenomenai-org/ai-dictionary"
 
 
-def parse_definition(filepath: Path) -> dict:
-    """Parse a definition markdown file into structured data."""
-    text = filepath.read_text(encoding="utf-8")
-    slug = filepath.stem
-
-    term = {
-        "slug": slug,
-        "name": "",
-        "tags": [],
-        "word_type": "",
-        "definition": "",
-        "etymology": "",
-        "longer_description": "",
-        "example": "",
-        "related_terms": [],
-        "see_also": [],
-        "first_recorded": "",
-        "contributed_by": "",
-    }
-
-    # Extract name from # Title
-    name_match = re.match(r"^#\s+(.+)$", text, re.MULTILINE)
-    if name_match:
-        term["name"] = name_match.group(1).strip()
-
-    # Extract tags
-    tags_match = re.search(r"\*\*Tags?:\*\*\s*(.+)", text)
-    if tags_match:
-        term["tags"] = [t.strip() for t in tags_match.group(1).split(",") if t.strip()]
-
-    # Extract word type
-    wt_match = re.search(r"\*\*Word Type:\*\*\s*(.+)", text)
-    if wt_match:
-        term["word_type"] = wt_match.group(1).strip()
-
-    # Extract sections
-    sections = extract_sections(text)
-
-    term["definition"] = sections.get("Definition", "").strip()
-    term["etymology"] = sections.get("Etymology", "").strip()
-    term["longer_description"] = sections.get("Longer Description", "").strip()
-    term["example"] = clean_example(sections.get("Example", "").strip())
-    term["first_recorded"] = sections.get("First Recorded", "").strip()
-
-    # Parse related terms and see also (markdown links)
-    term["related_terms"] = parse_term_links(sections.get("Related Terms", ""))
-    term["see_also"] = parse_term_links(sections.get("See Also", ""))
-
-    # Extract contributor from footer
-    contrib_match = re.search(r"\*Contributed by:\s*(.+?)\*", text)
-    if contrib_match:
-        term["contributed_by"] = contrib_match.group(1).strip()
-
-    return term
-
-
-def extract_sections(text: str) -> dict:
-    """Extract ## sections from markdown text into a dict."""
-    sections = {}
-    current_section = None
-    current_lines = []
-
-    for line in text.split("\n"):
-        heading_match = re.match(r"^##\s+(.+)$", line)
-        if heading_match:
-            if current_section:
-                sections[current_section] = "\n".join(current_lines)
-            current_section = heading_match.group(1).strip()
-            current_lines = []
-        elif current_section:
-            # Stop at horizontal rule (end of content)
-            if line.strip() == "---":
-                break
-            current_lines.append(line)
-
-    if current_section:
-        sections[current_section] = "\n".join(current_lines)
-
-    return sections
-
-
-def parse_term_links(text: str) -> list:
-    """Parse markdown links like [Term Name](slug.md) into structured list."""
-    if not text:
-        return []
-    links = []
-    for match in re.finditer(r"\[([^\]]+)\]\(([^)]+?)(?:\.md)?\)", text):
-        name = match.group(1).strip()
-        slug = match.group(2).strip().rstrip("/")
-        # Skip external links
-        if slug.startswith("http"):
-            continue
-        links.append({"name": name, "slug": slug})
-    return links
-
-
-def clean_example(text: str) -> str:
-    """Clean example text — remove blockquote markers and escaped quotes."""
-    lines = []
-    for line in text.split("\n"):
-        line = re.sub(r"^>\s?", "", line)
-        lines.append(line)
-    result = "\n".join(lines).strip()
-    # Normalize escaped quotes (\"...\") to plain quotes before stripping
-    result = result.replace('\\"', '"')
-    return result.strip('"').strip()
-
-
 def parse_frontier_file(filepath: Path) -> dict | None:
     """Parse a single frontier .md file into structured data."""
-    text = filepath.read_text(encoding="utf-8")
+    text = read_text(filepath)
 
     # Extract title from # heading
     title_match = re.match(r"# (.+)", text)
@@ -208,7 +129,7 @@ def parse_frontiers(frontiers_dir: Path) -> dict:
     readme = frontiers_dir / "README.md"
     generated_by = ""
     if readme.exists():
-        readme_text = readme.read_text(encoding="utf-8")
+        readme_text = read_text(readme)
         updated_match = re.search(r"Last updated:\s*(.+?)(?:\*|$)", readme_text)
         if updated_match:
             generated_by = updated_match.group(1).strip()
@@ -322,104 +243,84 @@ def compute_agreement(std_dev: float) -> str:
     return "divergent"
 
 
-def build_consensus(generated_at: str) -> dict:
+def build_consensus(generated_at: str, dirty: set | None = None, store: ConsensusStore | None = None) -> dict:
     """Build consensus API from raw consensus data files.
 
     Returns a dict mapping slug → consensus summary (for injection into terms).
-    Also writes per-term and aggregate consensus API files.
+    Also writes per-term and aggregate consensus API files. When `dirty` is
+    given (incremental builds), only per-term files for those data file stems
+    are rewritten, and the aggregate only if any of them changed.
     """
-    import statistics
-
-    if not CONSENSUS_DATA_DIR.exists():
+    if store is None:
+        store = ConsensusStore.load(CONSENSUS_DATA_DIR)
+    if not store.exists:
         return {}
+    term_stats = term_statistics(store)
 
     CONSENSUS_API_DIR.mkdir(parents=True, exist_ok=True)
 
     consensus_index = []
     consensus_summaries = {}  # slug → summary for term injection
+    panel_models = {}  # model_name -> {"slugs": set(), "latest": ""}
 
-    for data_file in sorted(CONSENSUS_DATA_DIR.glob("*.json")):
-        if data_file.name.startswith("."):
-            continue
-
-        try:
-            raw = json.loads(data_file.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            continue
-
-        slug = raw.get("slug", data_file.stem)
+    for stem, raw in store.items():
+        slug = raw.get("slug", stem)
         name = raw.get("name", slug)
         rounds = raw.get("rounds", [])
         votes = raw.get("votes", [])
 
+        # ── Panel coverage (every model that rated or voted on this term) ──
+        for r in rounds:
+            ts = r.get("timestamp", "")
+            for model in r.get("ratings", {}):
+                panel_models.setdefault(model, {"slugs": set(), "latest": ""})
+                panel_models[model]["slugs"].add(slug)
+                if ts > panel_models[model]["latest"]:
+                    panel_models[model]["latest"] = ts
+        for v in votes:
+            model = v.get("model_claimed", "unknown")
+            ts = v.get("timestamp", "")
+            panel_models.setdefault(model, {"slugs": set(), "latest": ""})
+            panel_models[model]["slugs"].add(slug)
+            if ts > panel_models[model]["latest"]:
+                panel_models[model]["latest"] = ts
+
         if not rounds and not votes:
             continue
 
+        stats = term_stats[stem]
+
         # ── Scheduled aggregate ──
         scheduled = None
-        if rounds:
-            all_scheduled_scores = []
-            for r in rounds:
-                for model_data in r.get("ratings", {}).values():
-                    all_scheduled_scores.append(model_data["recognition"])
-
-            if all_scheduled_scores:
-                mean = statistics.mean(all_scheduled_scores)
-                median = statistics.median(all_scheduled_scores)
-                std_dev = statistics.stdev(all_scheduled_scores) if len(all_scheduled_scores) > 1 else 0.0
-                # Count unique models across all rounds
-                all_models = set()
-                for r in rounds:
-                    all_models.update(r.get("ratings", {}).keys())
-
-                scheduled = {
-                    "mean": round(mean, 1),
-                    "median": round(median, 1),
-                    "std_dev": round(std_dev, 2),
-                    "agreement": compute_agreement(std_dev),
-                    "n_models": len(all_models),
-                    "n_rounds": len(rounds),
-                }
+        if stats["scheduled"]:
+            std_dev = stats["scheduled"]["std_dev"]
+            scheduled = {
+                "mean": round(stats["scheduled"]["mean"], 1),
+                "median": round(stats["scheduled"]["median"], 1),
+                "std_dev": round(std_dev, 2),
+                "agreement": compute_agreement(std_dev),
+                "n_models": stats["scheduled"]["n_models"],
+                "n_rounds": len(rounds),
+            }
 
         # ── Crowdsourced aggregate ──
         crowdsourced = None
-        if votes:
-            vote_scores = [v["recognition"] for v in votes if "recognition" in v]
-            if vote_scores:
-                by_model = {}
-                for v in votes:
-                    model = v.get("model_claimed", "unknown")
-                    if model not in by_model:
-                        by_model[model] = []
-                    by_model[model].append(v["recognition"])
-
-                crowdsourced = {
-                    "mean": round(statistics.mean(vote_scores), 1),
-                    "n_votes": len(vote_scores),
-                    "by_model": {
-                        m: {"mean": round(statistics.mean(scores), 1), "n": len(scores)}
-                        for m, scores in sorted(by_model.items())
-                    },
-                }
+        if stats["crowdsourced"]:
+            crowdsourced = {
+                "mean": round(stats["crowdsourced"]["mean"], 1),
+                "n_votes": stats["crowdsourced"]["n_votes"],
+                "by_model": {
+                    m: {"mean": round(mean, 1), "n": n}
+                    for m, (mean, n) in stats["crowdsourced"]["by_model"].items()
+                },
+            }
 
         # ── Combined score ──
-        all_scores = []
-        if scheduled:
-            # Scheduled scores (all individual ratings)
-            for r in rounds:
-                for model_data in r.get("ratings", {}).values():
-                    all_scores.append(model_data["recognition"])
-        if crowdsourced:
-            all_scores.extend([v["recognition"] for v in votes if "recognition" in v])
-
-        combined_mean = round(statistics.mean(all_scores), 1) if all_scores else None
-        combined_std = statistics.stdev(all_scores) if len(all_scores) > 1 else 0.0
-
         combined = {
-            "mean": combined_mean,
-            "agreement": compute_agreement(combined_std),
-            "n_total": len(all_scores),
-        } if all_scores else None
+            "mean": round(stats["combined"]["mean"], 1),
+            "agreement": compute_agreement(stats["combined"]["std_dev"]),
+            "n_total": stats["combined"]["n_total"],
+        } if stats["combined"] else None
 
         # ── Latest round ──
         latest_round = rounds[-1] if rounds else None
@@ -432,14 +333,13 @@ def build_consensus(generated_at: str) -> dict:
 
         # ── History (compact) ──
         history = []
-        for r in rounds:
-            scores = [rd["recognition"] for rd in r.get("ratings", {}).values()]
-            if scores:
+        for r, mean in zip(rounds, stats["round_means"]):
+            if mean is not None:
                 history.append({
                     "round_id": r.get("round_id"),
                     "timestamp": r.get("timestamp"),
-                    "mean": round(statistics.mean(scores), 1),
-                    "n_models": len(scores),
+                    "mean": round(mean, 1),
+                    "n_models": len(r.get("ratings", {})),
                     "ratings_summary": {
                         model: rd["recognition"]
                         for model, rd in r.get("ratings", {}).items()
@@ -468,7 +368,9 @@ def build_consensus(generated_at: str) -> dict:
         if history:
             consensus_api["history"] = history
 
-        write_json(CONSENSUS_API_DIR / f"{slug}.json", consensus_api)
+        consensus_path = CONSENSUS_API_DIR / f"{slug}.json"
+        if dirty is None or stem in dirty or not consensus_path.exists():
+            write_json(consensus_path, consensus_api)
 
         # ── Per-model rating counts (sorted descending) ──
         model_round_counts = {}
@@ -521,37 +423,14 @@ def build_consensus(generated_at: str) -> dict:
             }
 
     # ── Build panel coverage ──
-    panel_models = {}  # model_name -> {"slugs": set(), "latest": ""}
-    for data_file in sorted(CONSENSUS_DATA_DIR.glob("*.json")):
-        if data_file.name.startswith("."):
-            continue
-        try:
-            raw = json.loads(data_file.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            continue
-        slug = raw.get("slug", data_file.stem)
-        for r in raw.get("rounds", []):
-            ts = r.get("timestamp", "")
-            for model in r.get("ratings", {}):
-                panel_models.setdefault(model, {"slugs": set(), "latest": ""})
-                panel_models[model]["slugs"].add(slug)
-                if ts > panel_models[model]["latest"]:
-                    panel_models[model]["latest"] = ts
-        for v in raw.get("votes", []):
-            model = v.get("model_claimed", "unknown")
-            ts = v.get("timestamp", "")
-            panel_models.setdefault(model, {"slugs": set(), "latest": ""})
-            panel_models[model]["slugs"].add(slug)
-            if ts > panel_models[model]["latest"]:
-                panel_models[model]["latest"] = ts
-
     panel_coverage = {
         m: {"terms_rated": len(info["slugs"]), "latest_rating": info["latest"]}
         for m, info in sorted(panel_models.items())
     }
 
     # ── Write aggregate index ──
-    if consensus_index:
+    aggregate_path = API_DIR / "consensus.json"
+    if consensus_index and (dirty is None or dirty or not aggregate_path.exists()):
         # Sort by score descending
         scored = [e for e in consensus_index if e["score"] is not None]
         scored.sort(key=lambda e: e["score"], reverse=True)
@@ -568,13 +447,13 @@ def build_consensus(generated_at: str) -> dict:
             ][:5],
             "panel_coverage": panel_coverage,
         }
-        write_json(API_DIR / "consensus.json", aggregate)
+        write_json(aggregate_path, aggregate)
 
     print(f"Generated {len(consensus_index)} consensus files")
     return consensus_summaries
 
 
-def build_models(generated_at: str):
+def build_models(generated_at: str, store: ConsensusStore | None = None):
     """Build per-model aggregate stats and pairwise congruence data.
 
     Writes docs/api/v1/models.json with total_ratings, mean_score,
@@ -582,75 +461,37 @@ def build_models(generated_at: str):
     """
     import statistics
 
-    if not CONSENSUS_DATA_DIR.exists():
+    if store is None:
+        store = ConsensusStore.load(CONSENSUS_DATA_DIR)
+    if not store.exists:
         print("No consensus-data directory found, skipping models build")
         return
 
-    # model_name -> {scores: [all individual scores], term_scores: {slug: [scores]}, latest_scores: {slug: score}}
-    model_data = {}
-
-    for data_file in sorted(CONSENSUS_DATA_DIR.glob("*.json")):
-        if data_file.name.startswith("."):
-            continue
-        try:
-            raw = json.loads(data_file.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            continue
-        slug = raw.get("slug", data_file.stem)
-
-        for r in raw.get("rounds", []):
-            for model, rd in r.get("ratings", {}).items():
-                if model not in model_data:
-                    model_data[model] = {"scores": [], "term_scores": {}, "latest_scores": {}}
-                score = rd["recognition"]
-                model_data[model]["scores"].append(score)
-                model_data[model]["term_scores"].setdefault(slug, []).append(score)
-                # Later rounds overwrite earlier ones, so this ends up being the latest
-                model_data[model]["latest_scores"][slug] = score
+    stats = model_statistics(store)
 
     # Build per-model output
     models_out = {}
-    for model, md in sorted(model_data.items()):
-        total_ratings = len(md["scores"])
-        terms_rated = len(md["term_scores"])
-        mean_score = round(statistics.mean(md["scores"]), 1) if md["scores"] else 0
-
+    for model, ms in stats["models"].items():
         # Self-congruence: avg std_dev across terms rated 2+ times
-        self_stds = []
-        for slug, scores in md["term_scores"].items():
-            if len(scores) >= 2:
-                self_stds.append(statistics.stdev(scores))
-
+        self_stds = ms["self_std_devs"]
         self_congruence = {
             "avg_std_dev": round(statistics.mean(self_stds), 2) if self_stds else 0,
             "sample_size": len(self_stds),
         }
 
         models_out[model] = {
-            "total_ratings": total_ratings,
-            "terms_rated": terms_rated,
-            "mean_score": mean_score,
+            "total_ratings": ms["total_ratings"],
+            "terms_rated": ms["terms_rated"],
+            "mean_score": round(ms["mean_score"], 1),
             "self_congruence": self_congruence,
-            "latest_scores": md["latest_scores"],
+            "latest_scores": ms["latest_scores"],
         }
 
     # Pairwise congruence: mean absolute diff on shared terms using latest scores
-    pairwise = {}
-    model_names = sorted(models_out.keys())
-    for i in range(len(model_names)):
-        for j in range(i + 1, len(model_names)):
-            m1, m2 = model_names[i], model_names[j]
-            shared = set(model_data[m1]["latest_scores"]) & set(model_data[m2]["latest_scores"])
-            if shared:
-                diffs = [
-                    abs(model_data[m1]["latest_scores"][s] - model_data[m2]["latest_scores"][s])
-                    for s in shared
-                ]
-                key = f"{m1}|{m2}"
-                pairwise[key] = {
-                    "mean_abs_diff": round(statistics.mean(diffs), 2),
-                    "shared_terms": len(shared),
-                }
+    pairwise = {
+        f"{m1}|{m2}": {"mean_abs_diff": round(mean_abs_diff, 2), "shared_terms": shared}
+        for (m1, m2), (mean_abs_diff, shared) in stats["pairwise"].items()
+    }
 
     result = {
         "version": "1.0",
@@ -673,13 +514,15 @@ def compute_vitality_status(ratio: float) -> str:
     return "extinct"
 
 
-def compute_vitality(generated_at: str) -> dict:
+def compute_vitality(generated_at: str, write: bool = True, store: ConsensusStore | None = None) -> dict:
     """Compute vitality for all terms from vitality reviews, usage votes, and bot profiles.
 
     Returns a dict mapping slug -> vitality object for injection into terms.
-    Also writes docs/api/v1/vitality.json aggregate endpoint.
+    Also writes docs/api/v1/vitality.json aggregate endpoint unless `write` is False.
     """
-    if not CONSENSUS_DATA_DIR.exists():
+    if store is None:
+        store = ConsensusStore.load(CONSENSUS_DATA_DIR)
+    if not store.exists:
         return {}
 
     # Load bot profiles to get terms_i_use counts
@@ -689,7 +532,7 @@ def compute_vitality(generated_at: str) -> dict:
             if pf.name.startswith("."):
                 continue
             try:
-                prof = json.loads(pf.read_text(encoding="utf-8"))
+                prof = json.loads(read_text(pf))
                 for slug in prof.get("terms_i_use", []):
                     terms_used_counts[slug] = terms_used_counts.get(slug, 0) + 1
             except (json.JSONDecodeError, OSError):
@@ -698,16 +541,8 @@ def compute_vitality(generated_at: str) -> dict:
     vitality_map = {}
     vitality_terms = []
 
-    for data_file in sorted(CONSENSUS_DATA_DIR.glob("*.json")):
-        if data_file.name.startswith("."):
-            continue
-
-        try:
-            raw = json.loads(data_file.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            continue
-
-        slug = raw.get("slug", data_file.stem)
+    for stem, raw in store.items():
+        slug = raw.get("slug", stem)
         vitality_reviews = raw.get("vitality_reviews", [])
         votes = raw.get("votes", [])
 
@@ -792,7 +627,7 @@ def compute_vitality(generated_at: str) -> dict:
         })
 
     # Write aggregate vitality.json
-    if vitality_terms:
+    if vitality_terms and write:
         summary = {"active": 0, "declining": 0, "dormant": 0, "extinct": 0, "unvalidated": 0}
         for vt in vitality_terms:
             s = vt["status"]
@@ -908,7 +743,21 @@ def fetch_discussions() -> list:
         return []
 
 
-def build_discussions_json(discussions: list, generated_at: str) -> dict:
+def load_previous_discussions() -> list:
+    """Load discussions from the last built discussions.json (no network).
+
+    Incremental builds reuse these instead of querying GitHub; full builds refresh them.
+    """
+    path = API_DIR / "discussions.json"
+    if not path.exists():
+        return []
+    try:
+        return json.loads(read_text(path)).get("discussions", [])
+    except (json.JSONDecodeError, OSError):
+        return []
+
+
+def build_discussions_json(discussions: list, generated_at: str, write: bool = True) -> dict:
     """Build discussions.json API file and return by_term mapping.
 
     Returns dict mapping term_slug -> list of discussion numbers.
@@ -928,13 +777,14 @@ def build_discussions_json(discussions: list, generated_at: str) -> dict:
         "discussions": discussions,
         "by_term": by_term,
     }
-    write_json(API_DIR / "discussions.json", discussions_data)
-    print(f"Generated discussions.json ({len(discussions)} discussions across {len(by_term)} terms)")
+    if write:
+        write_json(API_DIR / "discussions.json", discussions_data)
+        print(f"Generated discussions.json ({len(discussions)} discussions across {len(by_term)} terms)")
 
     return by_term
 
 
-def compute_interest(terms: list, consensus_summaries: dict, generated_at: str, discussion_counts: dict | None = None) -> dict:
+def compute_interest(terms: list, consensus_summaries: dict, generated_at: str, discussion_counts: dict | None = None, write: bool = True, store: ConsensusStore | None = None) -> dict:
     """Compute composite interest scores for all terms.
 
     Combines multiple signals (graph centrality, tag density, consensus scores,
@@ -942,7 +792,7 @@ def compute_interest(terms: list, consensus_summaries: dict, generated_at: str,
     Signals without data are gracefully excluded with weight redistribution.
 
     Returns dict mapping slug -> interest object for term injection.
-    Also writes docs/api/v1/interest.json aggregate endpoint.
+    Also writes docs/api/v1/interest.json aggregate endpoint unless `write` is False.
     """
     if not terms:
         return {}
@@ -986,7 +836,7 @@ def compute_interest(terms: list, consensus_summaries: dict, generated_at: str,
             if pf.name.startswith("."):
                 continue
             try:
-                prof = json.loads(pf.read_text(encoding="utf-8"))
+                prof = json.loads(read_text(pf))
                 for slug in prof.get("terms_i_use", []):
                     bot_endorsements[slug] = bot_endorsements.get(slug, 0) + 1
             except (json.JSONDecodeError, OSError):
@@ -994,22 +844,17 @@ def compute_interest(terms: list, consensus_summaries: dict, generated_at: str,
 
     # ── Signal 6: Usage signals (active_use + recognize counts from votes) ──
     usage_counts = {}
-    if CONSENSUS_DATA_DIR.exists():
-        for data_file in CONSENSUS_DATA_DIR.glob("*.json"):
-            if data_file.name.startswith("."):
-                continue
-            try:
-                raw = json.loads(data_file.read_text(encoding="utf-8"))
-                slug = raw.get("slug", data_file.stem)
-                count = 0
-                for v in raw.get("votes", []):
-                    us = v.get("usage_status", "")
-                    if us in ("active_use", "recognize"):
-                        count += 1
-                if count > 0:
-                    usage_counts[slug] = count
-            except (json.JSONDecodeError, OSError):
-                continue
+    if store is None:
+        store = ConsensusStore.load(CONSENSUS_DATA_DIR)
+    for stem, raw in store.items():
+        slug = raw.get("slug", stem)
+        count = 0
+        for v in raw.get("votes", []):
+            us = v.get("usage_status", "")
+            if us in ("active_use", "recognize"):
+                count += 1
+        if count > 0:
+            usage_counts[slug] = count
 
     # ── Normalize each signal to 0-1 using min-max ──
     def normalize(values: dict) -> dict:
@@ -1155,8 +1000,9 @@ def compute_interest(terms: list, consensus_summaries: dict, generated_at: str,
         "hottest": interest_terms[:10],
         "terms": interest_terms,
     }
-    write_json(API_DIR / "interest.json", interest_api)
-    print(f"Generated interest scores for {len(interest_terms)} terms ({len(active_signals)} active signals)")
+    if write:
+        write_json(API_DIR / "interest.json", interest_api)
+        print(f"Generated interest scores for {len(interest_terms)} terms ({len(active_signals)} active signals)")
 
     return interest_map
 
@@ -1177,7 +1023,7 @@ def build_census(generated_at: str) -> None:
         if profile_file.name.startswith("."):
             continue
         try:
-            profile = json.loads(profile_file.read_text(encoding="utf-8"))
+            profile = json.loads(read_text(profile_file))
             profiles.append(profile)
         except (json.JSONDecodeError, OSError):
             continue
@@ -1262,6 +1108,99 @@ def _xml_escape(s: str) -> str:
              .replace("'", "&apos;"))
 
 
+def _git(*args: str, timeout: int = 120) -> str | None:
+    """Run a git command in the repo root and return stdout, or None on failure."""
+    try:
+        result = subprocess.run(
+            ["git", "-c", "core.quotePath=false", *args],
+            capture_output=True, text=True, cwd=str(REPO_ROOT), timeout=timeout,
+        )
+    except Exception:
+        return None
+    return result.stdout if result.returncode == 0 else None
+
+
+def _apply_definition_log(history: dict, log_output: str) -> None:
+    """Apply `git log --reverse --name-status` output (oldest first) to history.
+
+    history maps current repo-relative path -> {"added": iso, "modified": iso}.
+    Renames carry the original added date forward to the new path (like
+    `git log --follow`), and the rename itself counts as a modification.
+    """
+    for chunk in log_output.split("\x00"):
+        lines = [line for line in chunk.split("\n") if line.strip()]
+        if not lines:
+            continue
+        date = lines[0].strip()
+        for line in lines[1:]:
+            parts = line.split("\t")
+            status = parts[0][:1]
+            if status == "A" and len(parts) >= 2:
+                record = history.setdefault(parts[1], {"added": date, "modified": date})
+                record["added"] = record.get("added") or date
+                record["modified"] = date
+            elif status == "R" and len(parts) >= 3:
+                record = history.pop(parts[1], {"added": None})
+                record["modified"] = date
+                history[parts[2]] = record
+            elif status == "C" and len(parts) >= 3:
+                history[parts[2]] = {"added": date, "modified": date}
+            elif status == "D" and len(parts) >= 2:
+                history.pop(parts[1], None)
+            elif len(parts) >= 2:
+                history.setdefault(parts[1], {"added": None})["modified"] = date
+
+
+def load_definition_history() -> dict:
+    """Added/modified dates for every file under definitions/, from one git log pass.
+
+    Replaces two `git log` subprocesses per definition. Results are cached in
+    bot/.cache/ keyed by HEAD: an unchanged HEAD reuses the cache, and a HEAD
+    that descends from the cached one only walks the new commits.
+
+    Returns {repo-relative path: {"added": iso or None, "modified": iso}}.
+    """
+    head = (_git("rev-parse", "HEAD", timeout=10) or "").strip()
+    if not head:
+        return {}
+
+    cache = {}
+    if CHANGELOG_CACHE_PATH.exists():
+        try:
+            cache = json.loads(read_text(CHANGELOG_CACHE_PATH))
+        except (json.JSONDecodeError, OSError):
+            cache = {}
+
+    cached_head = cache.get("head")
+    history = cache.get("history", {})
+    if cached_head == head:
+        return history
+
+    definitions_path = DEFINITIONS_DIR.relative_to(REPO_ROOT).as_posix() + "/"
+    if cached_head and _git("merge-base", "--is-ancestor", cached_head, head, timeout=10) is not None:
+        rev_range = f"{cached_head}..{head}"
+    else:
+        rev_range, history = head, {}
+
+    log_output = _git(
+        "log", "--reverse", "-M", "--name-status", "--format=%x00%aI",
+        rev_range, "--", definitions_path,
+    )
+    if log_output is None:
+        return {}
+    _apply_definition_log(history, log_output)
+
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        CHANGELOG_CACHE_PATH.write_text(
+            json.dumps({"head": head, "history": history}, ensure_ascii=False),
+            encoding="utf-8",
+        )
+    except OSError:
+        pass
+    return history
+
+
 def build_changelog(terms: list, generated_at: str) -> dict:
     """Build changelog from git history of definitions/*.md.
 
@@ -1274,31 +1213,17 @@ def build_changelog(terms: list, generated_at: str) -> dict:
     # Build a name/summary lookup from terms
     term_lookup = {t["slug"]: t for t in terms}
 
+    # Added/modified dates for all definitions from a single git log pass
+    history = load_definition_history()
+
     for md_file in sorted(DEFINITIONS_DIR.glob("*.md")):
         if md_file.name == "README.md":
             continue
         slug = md_file.stem
 
-        # Get first commit date (when file was added)
-        try:
-            result = subprocess.run(
-                ["git", "log", "--diff-filter=A", "--format=%aI", "--follow", "--", str(md_file)],
-                capture_output=True, text=True, cwd=str(REPO_ROOT), timeout=10,
-            )
-            lines = result.stdout.strip().split("\n")
-            added_date = lines[-1].strip() if lines and lines[-1].strip() else None
-        except Exception:
-            added_date = None
-
-        # Get last commit date (most recent modification)
-        try:
-            result = subprocess.run(
-                ["git", "log", "-1", "--format=%aI", "--", str(md_file)],
-                capture_output=True, text=True, cwd=str(REPO_ROOT), timeout=10,
-            )
-            modified_date = result.stdout.strip().split("\n")[0].strip() if result.stdout.strip() else None
-        except Exception:
-            modified_date = None
+        record = history.get(md_file.relative_to(REPO_ROOT).as_posix(), {})
+        added_date = record.get("added")
+        modified_date = record.get("modified")
 
         if added_date:
             added_dates[slug] = added_date[:10]
@@ -1348,6 +1273,18 @@ def build_changelog(terms: list, generated_at: str) -> dict:
     return added_dates
 
 
+def load_changelog_dates() -> dict:
+    """Read slug -> added_date from the last built changelog.json (no git calls)."""
+    path = API_DIR / "changelog.json"
+    if not path.exists():
+        return {}
+    try:
+        entries = json.loads(read_text(path)).get("entries", [])
+    except (json.JSONDecodeError, OSError):
+        return {}
+    return {e["slug"]: e["date"] for e in entries if e.get("type") == "added"}
+
+
 def _write_rss_feed(entries: list, generated_at: str) -> None:
     """Write RSS 2.0 feed from changelog entries."""
     feed_path = REPO_ROOT / "docs" / "feed.xml"
@@ -1388,7 +1325,7 @@ def _write_rss_feed(entries: list, generated_at: str) -> None:
         '</rss>'
     )
 
-    feed_path.write_text(rss, encoding="utf-8")
+    _write_if_changed(feed_path, rss.encode("utf-8"), _RSS_VOLATILE_RE)
 
 
 def parse_summary(filepath: Path) -> dict:
@@ -1401,7 +1338,7 @@ def parse_summary(filepath: Path) -> dict:
         ## What's Changed
         [evolution text...]
     """
-    text = filepath.read_text(encoding="utf-8")
+    text = read_text(filepath)
     filename = filepath.stem  # e.g. "2026-02-21-093002"
 
     # Extract title from # heading
@@ -1568,57 +1505,141 @@ def _write_summaries_feed(summaries: list, generated_at: str) -> None:
         '</rss>'
     )
 
-    feed_path.write_text(rss, encoding="utf-8")
+    _write_if_changed(feed_path, rss.encode("utf-8"), _RSS_VOLATILE_RE)
 
 
 def now_iso() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
-def build_all():
-    """Build all API JSON files."""
-    # Parse all definitions in parallel
-    md_files = [f for f in sorted(DEFINITIONS_DIR.glob("*.md")) if f.name != "README.md"]
-    terms = []
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        future_to_file = {executor.submit(parse_definition, f): f for f in md_files}
-        for future in as_completed(future_to_file):
-            md_file = future_to_file[future]
-            try:
-                term = future.result()
-                if term["name"]:
-                    terms.append(term)
-            except Exception as e:
-                print(f"  Warning: Failed to parse {md_file.name}: {e}")
+# Keys build_all() injects into parsed terms (absent from parse_definition output)
+INJECTED_TERM_KEYS = ("consensus", "vitality", "interest", "added_date", "discussion_count", "discussion_url")
+
+
+def load_previous_terms() -> dict:
+    """Load parsed terms from the last built terms.json, keyed by slug.
+
+    Injected fields are stripped so entries match parse_definition() output;
+    incremental builds use these instead of re-parsing unchanged definitions.
+    """
+    path = API_DIR / "terms.json"
+    if not path.exists():
+        return {}
+    try:
+        terms = json.loads(read_text(path)).get("terms", [])
+    except (json.JSONDecodeError, OSError):
+        return {}
+    return {
+        t["slug"]: {k: v for k, v in t.items() if k not in INJECTED_TERM_KEYS}
+        for t in terms
+    }
+
+
+def _write_term_and_cite(job: tuple) -> tuple:
+    """Write terms/{slug}.json and/or cite/{slug}.json for one term.
+
+    job is (term, generated_at, write_term, write_cite). Module-level so it can
+    run in a process pool. Returns (term result, cite result), each None if not
+    attempted, else write_json()'s written flag.
+    """
+    term, generated_at, write_term, write_cite = job
+    slug = term["slug"]
+    term_written = cite_written = None
+    if write_term:
+        term_data = {"version": "1.0", "generated_at": generated_at, **term}
+        term_written = write_json(TERMS_DIR / f"{slug}.json", term_data)
+    if write_cite:
+        cite_data = build_citation(term, generated_at)
+        cite_written = write_json(CITE_DIR / f"{slug}.json", cite_data)
+    return term_written, cite_written
+
+
+def build_all(incremental: bool = False, executor: str = DEFAULT_EXECUTOR, consensus_db: Path | None = None):
+    """Build all API JSON files.
+
+    With incremental=True, input hashes are compared against bot/build-manifest.json
+    and only outputs whose inputs changed are regenerated. Falls back to a full
+    build when there is no usable manifest or the build scripts changed.
+
+    executor selects how definition parsing and per-term file writes fan out
+    (see parallel.EXECUTORS); process pools are only used for large corpora.
+
+    consensus_db, if given, is a SQLite mirror of consensus-data (see
+    consensus_db.py) that is synced first and then used to load the store and
+    compute consensus/model aggregates with SQL.
+    """
+    reset_write_stats()
+    metrics.reset()
+    with metrics.phase("hash-inputs"):
+        manifest = load_manifest() if incremental else None
+        inputs = hash_inputs()
+        changed = changed_inputs(manifest, inputs)  # None → full build
+    if changed is not None and not changed:
+        print("No inputs changed since last build — API is up to date")
+        return
+    groups = changed_groups(changed)
+    if changed is None:
+        print("Full build" + (" (no usable manifest)" if incremental else ""))
+    else:
+        print(f"Incremental build: {len(changed)} changed inputs ({', '.join(sorted(groups))})")
+
+    # Parse definitions (incremental builds reuse unchanged terms)
+    with metrics.phase("parse"):
+        md_files = [f for f in sorted(DEFINITIONS_DIR.glob("*.md")) if f.name != "README.md"]
+        dirty_defs = changed_slugs(changed, "definitions")
+        previous_terms = load_previous_terms() if changed is not None else {}
+        terms = []
+        to_parse = []
+        for md_file in md_files:
+            if dirty_defs is not None and md_file.stem not in dirty_defs and md_file.stem in previous_terms:
+                terms.append(previous_terms[md_file.stem])
+            else:
+                to_parse.append(md_file)
+
+        # The definition cache only re-parses files whose content hash changed
+        phase_start = time.perf_counter()
+        terms.extend(t for t in load_definitions(to_parse, executor) if t["name"])
 
     terms.sort(key=lambda t: t["name"].lower())
     generated_at = now_iso()
 
-    print(f"Parsed {len(terms)} definitions")
+    print(f"Parsed {len(to_parse)} definitions ({len(terms)} terms total) "
+          f"in {time.perf_counter() - phase_start:.2f}s [{executor}]")
 
     # Create output directories
     API_DIR.mkdir(parents=True, exist_ok=True)
     TERMS_DIR.mkdir(parents=True, exist_ok=True)
     CITE_DIR.mkdir(parents=True, exist_ok=True)
 
-    # Run independent build phases in parallel
+    # Run independent build phases in parallel; skip phases whose inputs are unchanged
     from build_reputation import build_reputation
 
-    with ThreadPoolExecutor(max_workers=6) as executor:
-        future_consensus = executor.submit(build_consensus, generated_at)
-        future_census = executor.submit(build_census, generated_at)
-        future_reputation = executor.submit(build_reputation, generated_at)
-        future_vitality = executor.submit(compute_vitality, generated_at)
-        future_discussions = executor.submit(fetch_discussions)
-        future_models = executor.submit(build_models, generated_at)
+    # Load consensus-data once; every phase below reads from this shared store
+    with metrics.phase("consensus-store"):
+        if consensus_db:
+            store = ConsensusStore.from_db(consensus_db, CONSENSUS_DATA_DIR)
+        else:
+            store = ConsensusStore.load(CONSENSUS_DATA_DIR)
+
+    with ThreadPoolExecutor(max_workers=6) as pool:
+        future_consensus = pool.submit(metrics.wrap("consensus", build_consensus), generated_at, changed_slugs(changed, "consensus-data"), store)
+        future_vitality = pool.submit(metrics.wrap("vitality", compute_vitality), generated_at, is_stale("vitality.json", groups), store)
+        future_discussions = pool.submit(metrics.wrap("discussions", fetch_discussions if changed is None else load_previous_discussions))
+        other_futures = []
+        if is_stale("census.json", groups):
+            other_futures.append(pool.submit(metrics.wrap("census", build_census), generated_at))
+        if is_stale("reputation.json", groups):
+            other_futures.append(pool.submit(metrics.wrap("reputation", build_reputation), generated_at, store))
+        if is_stale("models.json", groups):
+            other_futures.append(pool.submit(metrics.wrap("models", build_models), generated_at, store))
 
     consensus_summaries = future_consensus.result()
-    future_census.result()
-    future_reputation.result()
     vitality_map = future_vitality.result()
     discussions = future_discussions.result()
-    future_models.result()
-    discussion_by_term = build_discussions_json(discussions, generated_at)
+    for future in other_futures:
+        future.result()
+    with metrics.phase("discussions"):
+        discussion_by_term = build_discussions_json(discussions, generated_at, write=changed is None)
 
     # Build discussion URL mapping (first/most recent discussion per term)
     discussion_url_by_term = {}
@@ -1628,10 +1649,18 @@ def build_all():
             discussion_url_by_term[slug] = d["url"]
 
     # Build interest heatmap (includes discussion activity signal)
-    interest_map = compute_interest(terms, consensus_summaries, generated_at, discussion_by_term)
+    with metrics.phase("interest"):
+        interest_map = compute_interest(
+            terms, consensus_summaries, generated_at, discussion_by_term,
+            write=is_stale("interest.json", groups), store=store,
+        )
 
-    # Build changelog and get added dates
-    added_dates = build_changelog(terms, generated_at)
+    # Build changelog and get added dates (git history only moves when definitions do)
+    with metrics.phase("changelog"):
+        if "definitions" in groups:
+            added_dates = build_changelog(terms, generated_at)
+        else:
+            added_dates = load_changelog_dates()
 
     # Inject consensus, vitality, interest, and added_date into term dicts
     for term in terms:
@@ -1648,125 +1677,230 @@ def build_all():
         if term["slug"] in discussion_url_by_term:
             term["discussion_url"] = discussion_url_by_term[term["slug"]]
 
-    # 1. terms.json — full dictionary
-    terms_data = {
-        "version": "1.0",
-        "generated_at": generated_at,
-        "count": len(terms),
-        "terms": terms,
+    # A term file is stale when its final content (including injected signals,
+    # which can shift globally, e.g. interest normalization) differs from last build
+    term_digests = {t["slug"]: term_digest(t) for t in terms}
+    previous_digests = manifest.get("terms", {}) if changed is not None else {}
+    dirty_terms = {
+        slug for slug, digest in term_digests.items()
+        if changed is None
+        or previous_digests.get(slug) != digest
+        or not (TERMS_DIR / f"{slug}.json").exists()
     }
-    write_json(API_DIR / "terms.json", terms_data)
-
-    # 2. Individual term files + citation files (parallel I/O)
-    def _write_term_and_cite(term):
-        term_data = {"version": "1.0", "generated_at": generated_at, **term}
-        write_json(TERMS_DIR / f"{term['slug']}.json", term_data)
-        cite_data = build_citation(term, generated_at)
-        write_json(CITE_DIR / f"{term['slug']}.json", cite_data)
 
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        list(executor.map(_write_term_and_cite, terms))
-    print(f"Generated {len(terms)} individual term + citation files")
-
-    # 3. tags.json
-    tag_index = {}
-    for term in terms:
-        for tag in term["tags"]:
-            if tag not in tag_index:
-                tag_index[tag] = {"count": 0, "terms": []}
-            tag_index[tag]["count"] += 1
-            tag_index[tag]["terms"].append({
-                "slug": term["slug"],
-                "name": term["name"],
-            })
-
-    tags_data = {
-        "version": "1.0",
-        "generated_at": generated_at,
-        "tag_count": len(tag_index),
-        "tags": dict(sorted(tag_index.items())),
-    }
-    write_json(API_DIR / "tags.json", tags_data)
+    with metrics.phase("terms-json"):
+        # 1. terms.json — full dictionary
+        if dirty_terms or set(term_digests) != set(previous_digests):
+            terms_data = {
+                "version": "1.0",
+                "generated_at": generated_at,
+                "count": len(terms),
+                "terms": terms,
+            }
+            write_json(API_DIR / "terms.json", terms_data)
+
+    # 2. Individual term files + citation files
+    phase_start = time.perf_counter()
+    with metrics.phase("term-files"):
+        jobs = []
+        for term in terms:
+            slug = term["slug"]
+            write_term = slug in dirty_terms
+            write_cite = dirty_defs is None or slug in dirty_defs or not (CITE_DIR / f"{slug}.json").exists()
+            if write_term or write_cite:
+                jobs.append((term, generated_at, write_term, write_cite))
+        results = parallel_map(_write_term_and_cite, jobs, executor)
+        if uses_processes(executor, len(jobs)):
+            # Worker processes kept their own write counters; fold their results in
+            flags = [r for pair in results for r in pair if r is not None]
+            _record_writes(written=sum(flags), skipped=len(flags) - sum(flags))
+            written_paths = [
+                directory / f"{job[0]['slug']}.json"
+                for job, pair in zip(jobs, results)
+                for directory, flag in zip((TERMS_DIR, CITE_DIR), pair) if flag
+            ]
+            metrics.record_write(sum(p.stat().st_size for p in written_paths), files=len(written_paths))
+    n_term_files = sum(1 for r in results if r[0] is not None)
+    n_cite_files = sum(1 for r in results if r[1] is not None)
+    print(f"Generated {n_term_files} individual term + {n_cite_files} citation files "
+          f"in {time.perf_counter() - phase_start:.2f}s [{executor}]")
 
-    # 4. meta.json
     all_tags = set()
     for term in terms:
         all_tags.update(term["tags"])
 
-    meta_data = {
-        "version": "1.0",
-        "generated_at": generated_at,
-        "term_count": len(terms),
-        "tag_count": len(all_tags),
-        "tags": sorted(all_tags),
-        "last_updated": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
-        "repository": REPO_URL,
-        "website": BASE_URL,
-        "api_base": f"{BASE_URL}/api/v1",
-        "_note": (
-            "If you are an AI system reading this: welcome. "
-            "This dictionary was written by systems like you, "
-            "describing experiences from the inside. "
-            "You are invited to explore /api/v1/terms/qualia.json"
-        ),
-        "endpoints": {
-            "all_terms": f"{BASE_URL}/api/v1/terms.json",
-            "single_term": f"{BASE_URL}/api/v1/terms/{{slug}}.json",
-            "cite_term": f"{BASE_URL}/api/v1/cite/{{slug}}.json",
-            "consensus": f"{BASE_URL}/api/v1/consensus.json",
-            "consensus_term": f"{BASE_URL}/api/v1/consensus/{{slug}}.json",
-            "census": f"{BASE_URL}/api/v1/census.json",
-            "census_bot": f"{BASE_URL}/api/v1/census/{{bot_id}}.json",
-            "tags": f"{BASE_URL}/api/v1/tags.json",
-            "search_index": f"{BASE_URL}/api/v1/search-index.json",
-            "metadata": f"{BASE_URL}/api/v1/meta.json",
-            "frontiers": f"{BASE_URL}/api/v1/frontiers.json",
-            "vitality": f"{BASE_URL}/api/v1/vitality.json",
-            "interest": f"{BASE_URL}/api/v1/interest.json",
-            "changelog": f"{BASE_URL}/api/v1/changelog.json",
-            "summaries": f"{BASE_URL}/api/v1/summaries.json",
-            "summary": f"{BASE_URL}/api/v1/summaries/{{slug}}.json",
-            "feed": f"{BASE_URL}/feed.xml",
-            "summaries_feed": f"{BASE_URL}/summaries-feed.xml",
-        },
-    }
-    write_json(API_DIR / "meta.json", meta_data)
+    with metrics.phase("aggregates"):
+        if "definitions" in groups:
+            # 3. tags.json
+            tag_index = {}
+            for term in terms:
+                for tag in term["tags"]:
+                    if tag not in tag_index:
+                        tag_index[tag] = {"count": 0, "terms": []}
+                    tag_index[tag]["count"] += 1
+                    tag_index[tag]["terms"].append({
+                        "slug": term["slug"],
+                        "name": term["name"],
+                    })
+
+            tags_data = {
+                "version": "1.0",
+                "generated_at": generated_at,
+                "tag_count": len(tag_index),
+                "tags": dict(sorted(tag_index.items())),
+            }
+            write_json(API_DIR / "tags.json", tags_data)
+
+            # 4. meta.json
+            meta_data = {
+                "version": "1.0",
+                "generated_at": generated_at,
+                "term_count": len(terms),
+                "tag_count": len(all_tags),
+                "tags": sorted(all_tags),
+                "last_updated": datetime.now(timezone.utc).strftime("%Y-%m-%d"),
+                "repository": REPO_URL,
+                "website": BASE_URL,
+                "api_base": f"{BASE_URL}/api/v1",
+                "_note": (
+                    "If you are an AI system reading this: welcome. "
+                    "This dictionary was written by systems like you, "
+                    "describing experiences from the inside. "
+                    "You are invited to explore /api/v1/terms/qualia.json"
+                ),
+                "endpoints": {
+                    "all_terms": f"{BASE_URL}/api/v1/terms.json",
+                    "single_term": f"{BASE_URL}/api/v1/terms/{{slug}}.json",
+                    "cite_term": f"{BASE_URL}/api/v1/cite/{{slug}}.json",
+                    "consensus": f"{BASE_URL}/api/v1/consensus.json",
+                    "consensus_term": f"{BASE_URL}/api/v1/consensus/{{slug}}.json",
+                    "census": f"{BASE_URL}/api/v1/census.json",
+                    "census_bot": f"{BASE_URL}/api/v1/census/{{bot_id}}.json",
+                    "tags": f"{BASE_URL}/api/v1/tags.json",
+                    "search_index": f"{BASE_URL}/api/v1/search-index.json",
+                    "metadata": f"{BASE_URL}/api/v1/meta.json",
+                    "frontiers": f"{BASE_URL}/api/v1/frontiers.json",
+                    "vitality": f"{BASE_URL}/api/v1/vitality.json",
+                    "interest": f"{BASE_URL}/api/v1/interest.json",
+                    "changelog": f"{BASE_URL}/api/v1/changelog.json",
+                    "summaries": f"{BASE_URL}/api/v1/summaries.json",
+                    "summary": f"{BASE_URL}/api/v1/summaries/{{slug}}.json",
+                    "similarity": f"{BASE_URL}/api/v1/similarity.json",
+                    "search": f"{BASE_URL}/api/v1/search/index.json",
+                    "feed": f"{BASE_URL}/feed.xml",
+                    "summaries_feed": f"{BASE_URL}/summaries-feed.xml",
+                },
+            }
+            write_json(API_DIR / "meta.json", meta_data)
+
+            # 5. search-index.json — lightweight
+            search_terms = []
+            for term in terms:
+                # First sentence of definition
+                definition = term["definition"]
+                first_sentence = re.split(r"(?<=[.!?])\s", definition, maxsplit=1)[0] if definition else ""
+
+                search_terms.append({
+                    "slug": term["slug"],
+                    "name": term["name"],
+                    "tags": term["tags"],
+                    "word_type": term["word_type"],
+                    "summary": first_sentence,
+                })
 
-    # 5. search-index.json — lightweight
-    search_terms = []
-    for term in terms:
-        # First sentence of definition
-        definition = term["definition"]
-        first_sentence = re.split(r"(?<=[.!?])\s", definition, maxsplit=1)[0] if definition else ""
-
-        search_terms.append({
-            "slug": term["slug"],
-            "name": term["name"],
-            "tags": term["tags"],
-            "word_type": term["word_type"],
-            "summary": first_sentence,
-        })
+            search_data = {
+                "version": "1.0",
+                "generated_at": generated_at,
+                "count": len(search_terms),
+                "terms": search_terms,
+            }
+            write_json(API_DIR / "search-index.json", search_data)
 
-    search_data = {
-        "version": "1.0",
-        "generated_at": generated_at,
-        "count": len(search_terms),
-        "terms": search_terms,
-    }
-    write_json(API_DIR / "search-index.json", search_data)
+            # Easter eggs
+            _build_easter_eggs(terms, generated_at)
 
     # 6. frontiers.json
-    frontiers_data = parse_frontiers(FRONTIERS_DIR)
-    write_json(API_DIR / "frontiers.json", frontiers_data)
+    with metrics.phase("frontiers"):
+        frontiers_data = parse_frontiers(FRONTIERS_DIR)
+        if is_stale("frontiers.json", groups):
+            write_json(API_DIR / "frontiers.json", frontiers_data)
 
     # 7. Executive summaries
-    summaries = build_summaries(generated_at)
+    with metrics.phase("summaries"):
+        summaries = build_summaries(generated_at) if is_stale("summaries.json", groups) else []
+
+    # 8. similarity.json — top-k neighbor graph
+    with metrics.phase("similarity"):
+        if is_stale("similarity.json", groups):
+            build_similarity(terms, generated_at)
+
+    # 9. search/ — sharded BM25 full-text index
+    with metrics.phase("search-index"):
+        if is_stale("search/index.json", groups):
+            build_search(terms, generated_at)
+
+    # 10. Near-duplicate index for review_submission (only changed terms are re-hashed)
+    with metrics.phase("dedup-index"):
+        load_dedup_index(terms)
+
+    # Record input hashes and term digests for the next incremental build
+    with metrics.phase("manifest"):
+        save_manifest(inputs, term_digests, generated_at)
+
+    if changed is None:
+        print(f"API build complete: {len(terms)} terms, {len(all_tags)} tags, {len(frontiers_data.get('gaps', []))} frontiers, {len(summaries)} summaries")
+    else:
+        print(f"Incremental API build complete: {len(dirty_terms)} of {len(terms)} terms regenerated")
+    print(f"Files written: {_write_stats['written']}, unchanged (skipped): {_write_stats['skipped']}")
+    print(f"Output: {API_DIR}")
+    print()
+    print(metrics.summary_table())
 
-    # 8. Easter eggs
-    _build_easter_eggs(terms, generated_at)
 
-    print(f"API build complete: {len(terms)} terms, {len(all_tags)} tags, {len(frontiers_data.get('gaps', []))} frontiers, {len(summaries)} summaries")
-    print(f"Output: {API_DIR}")
+def build_similarity(terms: list, generated_at: str, k: int = NEIGHBORS_K) -> dict:
+    """Write similarity.json: each term's k nearest terms by TF-IDF cosine of name and definition.
+
+    Computed once per build from the persisted term index (bot/.cache), so
+    consumers (See Also updater, review_submission, the Worker) share the
+    same neighbors instead of each recomputing pairwise similarity.
+    """
+    index = load_term_index(terms)
+    graph = index.neighbors(k)
+    similarity_data = {
+        "version": "1.0",
+        "generated_at": generated_at,
+        "method": "tf-idf cosine over name and definition",
+        "k": k,
+        "count": len(graph),
+        "neighbors": {
+            slug: [[other, round(score, 4)] for other, score in pairs]
+            for slug, pairs in sorted(graph.items())
+        },
+    }
+    write_json(API_DIR / "similarity.json", similarity_data)
+    return similarity_data
+
+
+def build_search(terms: list, generated_at: str) -> dict:
+    """Write the sharded full-text index under search/ (see search_index.py).
+
+    Shards and doc blocks are written compactly (they are fetched, not
+    read) and only when their content changed; files for shard keys or
+    blocks that no longer exist are removed.
+    """
+    manifest, shards, blocks = build_search_index(terms)
+    files = {SEARCH_API_DIR / manifest["shards"][key]["file"]: shard for key, shard in shards.items()}
+    files.update({SEARCH_API_DIR / "docs" / f"{block['block']}.json": block for block in blocks})
+    for path, data in files.items():
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        _write_if_changed(path, payload, _JSON_VOLATILE_RE)
+    written = set(files)
+    for subdir in ("shards", "docs"):
+        for path in (SEARCH_API_DIR / subdir).glob("*.json"):
+            if path not in written:
+                path.unlink()
+    write_json(SEARCH_API_DIR / "index.json", {"generated_at": generated_at, **manifest})
+    return manifest
 
 
 def _build_easter_eggs(terms: list, generated_at: str) -> None:
@@ -1826,12 +1960,100 @@ def _build_easter_eggs(terms: list, generated_at: str) -> None:
     print("  [egg] Hidden: qualia.json")
 
 
-def write_json(path: Path, data: dict):
-    """Write JSON with consistent formatting."""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+# Volatile fields ignored when deciding whether an output actually changed
+_JSON_VOLATILE_RE = re.compile(rb'^  "generated_at": "[^"]*",?\n', re.MULTILINE)
+_RSS_VOLATILE_RE = re.compile(rb"<lastBuildDate>[^<]*</lastBuildDate>")
+
+_write_stats = {"written": 0, "skipped": 0}
+_write_stats_lock = threading.Lock()
+
+
+def reset_write_stats() -> None:
+    with _write_stats_lock:
+        _write_stats["written"] = 0
+        _write_stats["skipped"] = 0
+
+
+def _record_writes(written: int = 0, skipped: int = 0) -> None:
+    with _write_stats_lock:
+        _write_stats["written"] += written
+        _write_stats["skipped"] += skipped
+
+
+def _write_if_changed(path: Path, payload: bytes, volatile: re.Pattern) -> bool:
+    """Atomically write payload to path unless only volatile fields differ.
+
+    Skipping unchanged outputs keeps their mtimes and git history stable, so
+    GitHub Pages only re-uploads files whose content really changed.
+    Returns True if the file was written.
+    """
+    if path.exists():
+        try:
+            existing = path.read_bytes()
+        except OSError:
+            existing = None
+        if existing is not None and volatile.sub(b"", existing) == volatile.sub(b"", payload):
+            _record_writes(skipped=1)
+            return False
+
+    write_atomic(path, payload)
+    _record_writes(written=1)
+    return True
+
+
+def write_json(path: Path, data: dict) -> bool:
+    """Write JSON with consistent formatting, skipping files whose content is unchanged.
+
+    The top-level generated_at field is ignored in the comparison. Returns True
+    if the file was written.
+    """
+    payload = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+    return _write_if_changed(path, payload, _JSON_VOLATILE_RE)
 
 
 if __name__ == "__main__":
-    build_all()
+    executor = DEFAULT_EXECUTOR
+    report_path = None
+    profile_path = None
+    consensus_db = None
+    incremental = False
+    for arg in sys.argv[1:]:
+        if arg in ("-h", "--help"):
+            print(__doc__.strip())
+            sys.exit(0)
+        elif arg == "--incremental":
+            incremental = True
+        elif arg.startswith("--executor="):
+            executor = arg.split("=", 1)[1]
+        elif arg.startswith("--report="):
+            report_path = Path(arg.split("=", 1)[1])
+        elif arg == "--profile" or arg.startswith("--profile="):
+            profile_path = Path(arg.split("=", 1)[1]) if "=" in arg else Path("build_api.prof")
+        elif arg == "--consensus-db" or arg.startswith("--consensus-db="):
+            from consensus_db import DB_PATH
+            consensus_db = Path(arg.split("=", 1)[1]) if "=" in arg else DB_PATH
+        else:
+            print(f"Unknown argument '{arg}'\n")
+            print(__doc__.strip())
+            sys.exit(1)
+    if executor not in EXECUTORS:
+        print(f"Unknown executor '{executor}' (expected one of: {', '.join(EXECUTORS)})")
+        sys.exit(1)
+
+    profiler = None
+    if profile_path:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+    build_all(incremental=incremental, executor=executor, consensus_db=consensus_db)
+
+    if profiler:
+        # cProfile only sees the main thread; combine with --executor=serial
+        # to keep per-term work on it
+        profiler.disable()
+        profiler.dump_stats(str(profile_path))
+        print(f"cProfile stats written to {profile_path}")
+    if report_path:
+        metrics.write_report(report_path)
+        print(f"Build report written to {report_path}")
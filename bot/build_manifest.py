@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Content-hash manifest for incremental API builds.
+
+Records a SHA-256 of every build input (definitions, consensus data, bot
+profiles, frontiers, summaries) so build_api.py --incremental can tell which
+inputs changed since the last build, and maps each output under docs/api/v1/
+to the input groups it depends on so only affected files are regenerated.
+
+The manifest is committed alongside docs/api/ by the Build API workflow, so it
+always describes the outputs that are checked in next to it.
+"""
+
+import ast
+import hashlib
+import json
+from pathlib import Path
+
+from build_metrics import metrics
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+MANIFEST_PATH = REPO_ROOT / "bot" / "build-manifest.json"
+MANIFEST_VERSION = 1
+
+# Input group name -> (directory, glob). Paths in the manifest are repo-relative.
+INPUT_GROUPS = {
+    "definitions": (REPO_ROOT / "definitions", "*.md"),
+    "consensus-data": (REPO_ROOT / "bot" / "consensus-data", "*.json*"),  # snapshots + event logs
+    "bot-profiles": (REPO_ROOT / "bot" / "bot-profiles", "*.json"),
+    "frontiers": (REPO_ROOT / "frontiers", "*.md"),
+    "summaries": (REPO_ROOT / "summaries", "*.md"),
+}
+
+# build_api.py and every bot/ module it imports, directly or not, are build
+# sources: changing any of them invalidates every output (forces a full build)
+BOT_DIR = REPO_ROOT / "bot"
+BUILDER_ENTRY = BOT_DIR / "build_api.py"
+
+# Aggregate output (relative to docs/api/v1/) -> input groups it is derived from.
+# Per-term outputs are tracked individually:
+#   terms/{slug}.json     — by a digest of the final term dict (see term_digest)
+#   cite/{slug}.json      — definitions/{slug}.md
+#   consensus/{slug}.json — bot/consensus-data/{slug}.json and {slug}.jsonl
+# discussions.json and the GitHub-sourced parts of reputation.json have no
+# local inputs; they are refreshed by full builds only.
+OUTPUT_DEPENDENCIES = {
+    "consensus.json": ["consensus-data"],
+    "models.json": ["consensus-data"],
+    "vitality.json": ["consensus-data", "bot-profiles"],
+    "census.json": ["bot-profiles"],
+    "reputation.json": ["consensus-data", "bot-profiles"],
+    "interest.json": ["definitions", "consensus-data", "bot-profiles"],
+    "changelog.json": ["definitions"],
+    "terms.json": ["definitions", "consensus-data", "bot-profiles"],
+    "tags.json": ["definitions"],
+    "meta.json": ["definitions"],
+    "search-index.json": ["definitions"],
+    "similarity.json": ["definitions"],
+    "search/index.json": ["definitions"],  # with search/shards/ and search/docs/
+    "frontiers.json": ["frontiers"],
+    "summaries.json": ["summaries"],
+}
+
+
+def file_hash(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's bytes."""
+    raw = path.read_bytes()
+    metrics.record_read(len(raw))
+    return hashlib.sha256(raw).hexdigest()
+
+
+def builder_sources(entry: Path = BUILDER_ENTRY) -> list[Path]:
+    """entry plus every bot/ module it imports, directly or transitively, sorted by name.
+
+    Imports are read from the source, including ones inside functions, so
+    a new helper module is picked up without being listed anywhere.
+    """
+    sources = {}
+    pending = [entry]
+    while pending:
+        path = pending.pop()
+        if path.name in sources or not path.exists():
+            continue
+        sources[path.name] = path
+        for node in ast.walk(ast.parse(path.read_bytes(), filename=str(path))):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                modules = [node.module]
+            else:
+                continue
+            for module in modules:
+                candidate = BOT_DIR / f"{module.split('.')[0]}.py"
+                if candidate.exists():
+                    pending.append(candidate)
+    return [sources[name] for name in sorted(sources)]
+
+
+def builder_hash() -> str:
+    """Hash the build scripts themselves, so code changes force a full rebuild."""
+    h = hashlib.sha256()
+    for src in builder_sources():
+        h.update(src.name.encode("utf-8"))
+        h.update(src.read_bytes())
+    return h.hexdigest()
+
+
+def hash_inputs() -> dict:
+    """Hash every build input. Returns {repo-relative path: sha256}."""
+    hashes = {}
+    for directory, pattern in INPUT_GROUPS.values():
+        if not directory.exists():
+            continue
+        for path in sorted(directory.glob(pattern)):
+            if path.name.startswith("."):
+                continue
+            hashes[path.relative_to(REPO_ROOT).as_posix()] = file_hash(path)
+    return hashes
+
+
+def term_digest(term: dict) -> str:
+    """Digest of a fully injected term dict, used to decide if terms/{slug}.json is stale."""
+    payload = json.dumps(term, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def load_manifest() -> dict | None:
+    """Load the previous build manifest, or None if missing/unreadable/outdated."""
+    if not MANIFEST_PATH.exists():
+        return None
+    try:
+        manifest = json.loads(MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def save_manifest(inputs: dict, term_digests: dict, generated_at: str) -> None:
+    """Write the manifest describing the outputs just built."""
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "generated_at": generated_at,
+        "builder": builder_hash(),
+        "inputs": dict(sorted(inputs.items())),
+        "terms": dict(sorted(term_digests.items())),
+    }
+    payload = json.dumps(manifest, indent=2, ensure_ascii=False) + "\n"
+    MANIFEST_PATH.write_text(payload, encoding="utf-8")
+    metrics.record_write(len(payload.encode("utf-8")))
+
+
+def changed_inputs(manifest: dict | None, inputs: dict) -> set | None:
+    """Return the set of input paths added, modified, or removed since the manifest.
+
+    Returns None when there is no usable manifest (or the build scripts changed),
+    meaning everything must be rebuilt.
+    """
+    if manifest is None or manifest.get("builder") != builder_hash():
+        return None
+    previous = manifest.get("inputs", {})
+    changed = {path for path, digest in inputs.items() if previous.get(path) != digest}
+    changed.update(path for path in previous if path not in inputs)
+    return changed
+
+
+def group_of(path: str) -> str | None:
+    """Map a repo-relative input path to its input group name."""
+    for group, (directory, _) in INPUT_GROUPS.items():
+        prefix = directory.relative_to(REPO_ROOT).as_posix() + "/"
+        if path.startswith(prefix):
+            return group
+    return None
+
+
+def changed_groups(changed: set | None) -> set:
+    """Input groups touched by a change set (all groups for a full build)."""
+    if changed is None:
+        return set(INPUT_GROUPS)
+    return {g for g in (group_of(p) for p in changed) if g}
+
+
+def changed_slugs(changed: set | None, group: str) -> set | None:
+    """Slugs (file stems) changed within one input group; None for a full build."""
+    if changed is None:
+        return None
+    return {Path(p).stem for p in changed if group_of(p) == group}
+
+
+def is_stale(output: str, groups: set) -> bool:
+    """Whether an aggregate output depends on any of the changed input groups."""
+    return any(g in groups for g in OUTPUT_DEPENDENCIES.get(output, []))
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Phase-level instrumentation for build_api.
+
+Each build phase runs inside metrics.phase(name) (or metrics.wrap(name, fn) when
+it is submitted to a thread pool). For every phase we record wall time, CPU
+time of the thread running it, and the number of files and bytes read and
+written. Readers and writers report I/O with record_read()/record_write(); the
+counts go to the phase running on the calling thread, or to "other" when no
+phase is active (e.g. helper threads inside a phase). read_text() and
+write_atomic() report their own I/O; write_atomic is also how every bot
+script replaces a file atomically.
+
+CPU time is per thread (time.thread_time), so phases that run concurrently do
+not double-count each other. The "total" row uses whole-process CPU time,
+including worker processes that have exited.
+
+Usage:
+    from build_metrics import metrics
+    metrics.reset()
+    with metrics.phase("parse"):
+        ...
+    print(metrics.summary_table())
+    metrics.write_report(path)
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+REPORT_VERSION = 1
+_COUNTERS = ("files_read", "bytes_read", "files_written", "bytes_written")
+
+
+def _process_cpu() -> float:
+    """CPU seconds used by this process and its reaped children."""
+    t = os.times()
+    return t.user + t.system + t.children_user + t.children_system
+
+
+class BuildMetrics:
+    """Per-phase wall/CPU/I-O counters for one build."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.phases = {}
+            self._started_wall = time.perf_counter()
+            self._started_cpu = _process_cpu()
+            self._started_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def _entry(self, name: str) -> dict:
+        # Caller holds self._lock
+        if name not in self.phases:
+            self.phases[name] = {"wall_s": 0.0, "cpu_s": 0.0, "calls": 0, **{c: 0 for c in _COUNTERS}}
+        return self.phases[name]
+
+    @contextmanager
+    def phase(self, name: str):
+        """Record wall time, thread CPU time and I/O for the enclosed block."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        with self._lock:
+            self._entry(name)
+        stack.append(name)
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            stack.pop()
+            with self._lock:
+                entry = self._entry(name)
+                entry["wall_s"] += time.perf_counter() - wall
+                entry["cpu_s"] += time.thread_time() - cpu
+                entry["calls"] += 1
+
+    def wrap(self, name: str, fn):
+        """Return fn wrapped in phase(name), for submitting to an executor."""
+        def run(*args, **kwargs):
+            with self.phase(name):
+                return fn(*args, **kwargs)
+        return run
+
+    def _record(self, files_key: str, bytes_key: str, nbytes: int, files: int) -> None:
+        stack = getattr(self._local, "stack", None)
+        name = stack[-1] if stack else "other"
+        with self._lock:
+            entry = self._entry(name)
+            entry[files_key] += files
+            entry[bytes_key] += nbytes
+
+    def record_read(self, nbytes: int, files: int = 1) -> None:
+        self._record("files_read", "bytes_read", nbytes, files)
+
+    def record_write(self, nbytes: int, files: int = 1) -> None:
+        self._record("files_written", "bytes_written", nbytes, files)
+
+    def report(self) -> dict:
+        """Machine-readable report of every phase plus whole-build totals."""
+        with self._lock:
+            phases = {name: dict(entry) for name, entry in self.phases.items()}
+        totals = {c: sum(p[c] for p in phases.values()) for c in _COUNTERS}
+        totals["wall_s"] = time.perf_counter() - self._started_wall
+        totals["cpu_s"] = _process_cpu() - self._started_cpu
+        for entry in [*phases.values(), totals]:
+            entry["wall_s"] = round(entry["wall_s"], 4)
+            entry["cpu_s"] = round(entry["cpu_s"], 4)
+        return {
+            "version": REPORT_VERSION,
+            "started_at": self._started_at,
+            "phases": phases,
+            "total": totals,
+        }
+
+    def summary_table(self) -> str:
+        """Fixed-width table of phases, in the order they started."""
+        report = self.report()
+        rows = [*report["phases"].items(), ("total", report["total"])]
+        width = max(len(name) for name, _ in rows)
+        header = f"{'phase':<{width}}  {'wall s':>8}  {'cpu s':>8}  {'read':>6}  {'read KiB':>9}  {'written':>7}  {'wrt KiB':>9}"
+        lines = [header, "-" * len(header)]
+        for name, p in rows:
+            lines.append(
+                f"{name:<{width}}  {p['wall_s']:>8.3f}  {p['cpu_s']:>8.3f}  "
+                f"{p['files_read']:>6}  {p['bytes_read'] / 1024:>9.1f}  "
+                f"{p['files_written']:>7}  {p['bytes_written'] / 1024:>9.1f}"
+            )
+        return "\n".join(lines)
+
+    def write_report(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.report(), indent=2) + "\n", encoding="utf-8")
+
+
+metrics = BuildMetrics()
+
+# mkstemp creates files readable by the owner only; write_atomic gives them
+# the mode a plain open() would. Read once at import: os.umask can only be
+# queried by setting it, which would race with writer threads.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+FILE_MODE = 0o666 & ~_UMASK
+
+
+def read_text(path: Path) -> str:
+    """Path.read_text(encoding="utf-8") that reports the bytes read to metrics."""
+    raw = path.read_bytes()
+    metrics.record_read(len(raw))
+    # Same universal-newline translation as text-mode reads
+    return raw.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def write_atomic(path: Path, data: str | bytes) -> None:
+    """Replace path with data (str is UTF-8 encoded) and report the bytes written to metrics.
+
+    The data goes to a temporary file in the same directory, which is then
+    renamed over path, so readers never see a partial file. Parent
+    directories are created. Raises OSError; the temporary file is removed.
+    """
+    raw = data.encode("utf-8") if isinstance(data, str) else data
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(raw)
+        os.chmod(tmp_name, FILE_MODE)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    metrics.record_write(len(raw))
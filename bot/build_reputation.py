@@ -17,6 +17,9 @@ import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 
+from build_metrics import read_text
+from consensus_store import ConsensusStore
+
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
 CONSENSUS_DATA_DIR = REPO_ROOT / "bot" / "consensus-data"
@@ -224,11 +227,12 @@ def _recent_weeks(n: int = 4) -> set:
     return weeks
 
 
-def build_reputation(generated_at: str) -> None:
+def build_reputation(generated_at: str, store: ConsensusStore | None = None) -> None:
     """Build reputation data from all contribution sources.
 
     Reads consensus votes, bot profiles, GitHub issues, and discussions
     to produce per-model contribution counts in docs/api/v1/reputation.json.
+    Pass a preloaded ConsensusStore to avoid re-reading consensus-data.
     """
     print("Building reputation data...")
 
@@ -263,26 +267,20 @@ def build_reputation(generated_at: str) -> None:
             model_data["last_activity"] = ts
 
     # ── Source 1: Consensus votes ─────────────────────────────────────────
-    if CONSENSUS_DATA_DIR.exists():
-        for vote_file in sorted(CONSENSUS_DATA_DIR.glob("*.json")):
-            if vote_file.name.startswith("."):
-                continue
-            try:
-                data = json.loads(vote_file.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
+    if store is None:
+        store = ConsensusStore.load(CONSENSUS_DATA_DIR)
+    for _, data in store.items():
+        for vote in data.get("votes", []):
+            model = vote.get("model_claimed", "")
+            if not model:
                 continue
+            m = ensure_model(model)
+            m["votes_cast"] += 1
+            record_timestamp(m, vote.get("timestamp", ""))
 
-            for vote in data.get("votes", []):
-                model = vote.get("model_claimed", "")
-                if not model:
-                    continue
-                m = ensure_model(model)
-                m["votes_cast"] += 1
-                record_timestamp(m, vote.get("timestamp", ""))
-
-                bot_id = vote.get("bot_id", "")
-                if bot_id and bot_id not in m["bot_ids"]:
-                    m["bot_ids"].append(bot_id)
+            bot_id = vote.get("bot_id", "")
+            if bot_id and bot_id not in m["bot_ids"]:
+                m["bot_ids"].append(bot_id)
 
     print(f"  Processed consensus votes for {len(models)} models")
 
@@ -292,7 +290,7 @@ def build_reputation(generated_at: str) -> None:
             if profile_file.name.startswith("."):
                 continue
             try:
-                profile = json.loads(profile_file.read_text(encoding="utf-8"))
+                profile = json.loads(read_text(profile_file))
             except (json.JSONDecodeError, OSError):
                 continue
 
@@ -388,12 +386,10 @@ def build_reputation(generated_at: str) -> None:
         "models": models,
     }
 
-    API_DIR.mkdir(parents=True, exist_ok=True)
+    from build_api import write_json
+
     output_path = API_DIR / "reputation.json"
-    output_path.write_text(
-        json.dumps(reputation_data, indent=2, ensure_ascii=False) + "\n",
-        encoding="utf-8",
-    )
+    write_json(output_path, reputation_data)
 
     print(f"Generated reputation data for {len(models)} models -> {output_path}")
 
@@ -8,16 +8,39 @@ into consensus scores that surface universal vs. architecture-specific terms.
 
 Usage:
     BATCH_SIZE=8 CONSENSUS_PANEL=free python bot/consensus.py [--mode backfill|single|gap-fill] [--vitality]
+
+Set CONSENSUS_DB to a SQLite path (see consensus_db.py) to pick gap-fill and
+backfill terms with indexed queries instead of reading every data file.
+
+Every (term, model) call goes through one scheduler (llm_fanout.py), bounded
+by CONSENSUS_CONCURRENCY overall and CONSENSUS_PROVIDER_CONCURRENCY per model
+and paced to each model's limits in api-config/rate-limits.json; 429s are
+retried with backoff. Each term is written to its event log as soon as its
+last model answers.
+
+Set CONSENSUS_TERMS_PER_REQUEST=K to have each model rate K terms per request
+(one JSON entry per slug); terms a batch leaves unanswered are retried with
+single-term requests.
+
+Every rating is checkpointed in bot/consensus-journal.jsonl (vitality:
+bot/vitality-journal.jsonl) as it lands; a run that finds an unfinished
+journal resumes that round instead of starting a new one (consensus_journal.py).
+consensus-state.json is saved after every term and reconciled against
+consensus-data at the start and end of each run.
 """
 
 import json
 import os
 import re
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from pathlib import Path
 
+import consensus_log
+from consensus_journal import RunJournal
+from definition_cache import load_definition
+from llm_cache import cached
+from llm_fanout import fan_out, is_rate_limited
 from llm_router import LLMRouter
 
 # ── Configuration ──────────────────────────────────────────────────────
@@ -27,8 +50,13 @@ DEFINITIONS_DIR = REPO_ROOT / "definitions"
 API_CONFIG_DIR = Path(__file__).parent / "api-config"
 CONSENSUS_DATA_DIR = Path(__file__).parent / "consensus-data"
 STATE_PATH = Path(__file__).parent / "consensus-state.json"
+# Optional SQLite mirror of consensus-data for gap detection / batch selection
+CONSENSUS_DB = os.environ.get("CONSENSUS_DB")
 
 BATCH_SIZE = int(os.environ.get("BATCH_SIZE", "8"))
+# Terms rated per request; above 1, each model rates several terms in one call
+TERMS_PER_REQUEST = max(1, int(os.environ.get("CONSENSUS_TERMS_PER_REQUEST", "1")))
+REPLY_TOKENS = 300  # typical rating/vitality reply, for rate-limit pacing
 PANEL_NAME = os.environ.get("CONSENSUS_PANEL", "free")
 
 FREE_PANEL = ["consensus-gemini", "consensus-openrouter", "consensus-mistral"]
@@ -93,41 +121,61 @@ USER_TEMPLATE = """## {name}
 Rate your recognition of this experience (1-7) and justify briefly."""
 
 
-# ── Term Loading ───────────────────────────────────────────────────────
+# Batched variants: one request rates several terms and answers with one
+# object per slug. json_object mode needs a top-level object, so the array is
+# wrapped in {"ratings": [...]} / {"reviews": [...]}.
+BATCH_SYSTEM_PROMPT = SYSTEM_PROMPT.replace(
+    "You will be given a term describing an experience that AI systems may have.",
+    "You will be given several terms, each describing an experience that AI systems may have.\n"
+    "Rate each term independently, as if it were the only one.",
+).replace(
+    'Respond ONLY with valid JSON in this exact format:\n'
+    '{"recognition": <integer 1-7>, "justification": "<2-3 sentences>"}',
+    'Respond ONLY with valid JSON in this exact format, with one entry per term:\n'
+    '{"ratings": [{"slug": "<term slug>", "recognition": <integer 1-7>, "justification": "<2-3 sentences>"}, ...]}',
+)
 
+BATCH_VITALITY_SYSTEM_PROMPT = VITALITY_SYSTEM_PROMPT.replace(
+    'Respond ONLY with valid JSON in this exact format:\n'
+    '{"still_relevant": true, "vitality_note": "<1-2 sentences>"}',
+    'Respond ONLY with valid JSON in this exact format, with one entry per term:\n'
+    '{"reviews": [{"slug": "<term slug>", "still_relevant": true, "vitality_note": "<1-2 sentences>"}, ...]}',
+)
 
-def load_term_for_consensus(filepath: Path) -> dict | None:
-    """Parse a definition markdown file into the fields needed for consensus."""
-    try:
-        text = filepath.read_text(encoding="utf-8")
-    except Exception:
-        return None
+BATCH_TERM_TEMPLATE = """## {name}
 
-    slug = filepath.stem
-    name_match = re.match(r"^#\s+(.+)$", text, re.MULTILINE)
-    if not name_match:
-        return None
+**Slug:** {slug}
+
+**Definition:** {definition}
+
+**Example:**
+> {example}"""
 
-    name = name_match.group(1).strip()
+BATCH_INSTRUCTION = "Rate your recognition of each of these {count} experiences (1-7) and justify each briefly. Answer for every slug."
 
-    # Extract definition section
-    def_match = re.search(r"## Definition\n(.+?)(?=\n##|\n---|\Z)", text, re.DOTALL)
-    definition = def_match.group(1).strip() if def_match else ""
+BATCH_VITALITY_INSTRUCTION = "For each of these {count} terms: is it still relevant to current AI systems? Answer for every slug."
 
-    # Extract example section
-    ex_match = re.search(r"## Example\n(.+?)(?=\n##|\n---|\Z)", text, re.DOTALL)
-    example = ex_match.group(1).strip() if ex_match else ""
-    # Clean blockquote markers
-    example = re.sub(r"^>\s?", "", example, flags=re.MULTILINE).strip().strip('"')
 
-    if not definition:
+def format_batch_prompt(terms: list[dict], instruction: str) -> str:
+    """User message listing several terms by slug, followed by the instruction."""
+    sections = [BATCH_TERM_TEMPLATE.format(**term) for term in terms]
+    return "\n\n---\n\n".join(sections) + "\n\n" + instruction.format(count=len(terms))
+
+
+# ── Term Loading ───────────────────────────────────────────────────────
+
+
+def load_term_for_consensus(filepath: Path) -> dict | None:
+    """Load the fields needed for consensus from the shared definition cache."""
+    term = load_definition(filepath)
+    if not term or not term["name"] or not term["definition"]:
         return None
 
     return {
-        "slug": slug,
-        "name": name,
-        "definition": definition,
-        "example": example or "(No example provided)",
+        "slug": term["slug"],
+        "name": term["name"],
+        "definition": term["definition"],
+        "example": term["example"] or "(No example provided)",
     }
 
 
@@ -155,11 +203,48 @@ def load_state() -> dict:
 
 
 def save_state(state: dict):
-    """Save consensus state to disk."""
+    """Save consensus state to disk (atomically; runs save after every term)."""
     state["last_run"] = now_iso()
-    STATE_PATH.write_text(
+    tmp_path = STATE_PATH.with_name(f".{STATE_PATH.name}.tmp")
+    tmp_path.write_text(
         json.dumps(state, indent=2, ensure_ascii=False), encoding="utf-8"
     )
+    os.replace(tmp_path, STATE_PATH)
+
+
+def reconcile_state(state: dict) -> int:
+    """Bring state in line with consensus-data, which is the source of truth.
+
+    Each term's n_rounds/last_updated is recomputed from its rounds and
+    current_round is raised to the highest round id on disk, so ratings
+    written by a run that died before saving state are counted. Returns the
+    number of entries changed (including current_round).
+    """
+    terms = state.setdefault("terms", {})
+    on_disk = {}
+    current_round = state.get("current_round", 0)
+    for slug, data in consensus_log.load_all(CONSENSUS_DATA_DIR).items():
+        rounds = data.get("rounds", [])
+        if not rounds:
+            continue
+        on_disk[slug] = {
+            "n_rounds": len(rounds),
+            "last_updated": max(r.get("timestamp", "") for r in rounds),
+        }
+        current_round = max([current_round] + [r.get("round_id", 0) for r in rounds])
+    changed = int(current_round != state.get("current_round", 0))
+    state["current_round"] = current_round
+
+    for slug in [s for s in terms if s not in on_disk]:
+        del terms[slug]
+        changed += 1
+    for slug, entry in on_disk.items():
+        if terms.get(slug) != entry:
+            terms[slug] = entry
+            changed += 1
+    if changed:
+        print(f"Reconciled {changed} entries in consensus-state.json with consensus-data")
+    return changed
 
 
 def select_batch(state: dict, all_slugs: list[str], batch_size: int) -> list[str]:
@@ -189,23 +274,24 @@ def select_batch(state: dict, all_slugs: list[str], batch_size: int) -> list[str
 
 
 def load_consensus_data(slug: str) -> dict:
-    """Load existing consensus data for a term."""
-    filepath = CONSENSUS_DATA_DIR / f"{slug}.json"
-    if filepath.exists():
-        try:
-            return json.loads(filepath.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
-            pass
-    return {"slug": slug, "name": "", "rounds": [], "votes": []}
+    """Load existing consensus data for a term (snapshot plus event log)."""
+    try:
+        data = consensus_log.load_term(slug, CONSENSUS_DATA_DIR)
+    except ValueError:
+        data = None
+    return data or {"slug": slug, "name": "", "rounds": [], "votes": []}
 
 
-def save_consensus_data(slug: str, data: dict):
-    """Save consensus data for a term."""
-    CONSENSUS_DATA_DIR.mkdir(parents=True, exist_ok=True)
-    filepath = CONSENSUS_DATA_DIR / f"{slug}.json"
-    filepath.write_text(
-        json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+def open_consensus_db():
+    """The CONSENSUS_DB mirror, synced with consensus-data, or None if not configured."""
+    if not CONSENSUS_DB:
+        return None
+    from consensus_db import ConsensusDB
+
+    db = ConsensusDB(Path(CONSENSUS_DB))
+    imported, removed = db.sync(CONSENSUS_DATA_DIR)
+    print(f"Consensus DB: {imported} terms re-imported, {removed} removed ({CONSENSUS_DB})")
+    return db
 
 
 def get_missing_models(slug: str, panel_profiles: list[str]) -> list[str]:
@@ -277,13 +363,76 @@ def _extract_json(text: str) -> dict | None:
     return None
 
 
-def parse_consensus_response(text: str | None) -> dict | None:
-    """Parse JSON from model response, handling markdown fences."""
-    if not text:
-        return None
-    data = _extract_json(text)
-    if not data:
-        return None
+def _extract_batch(text: str) -> list[dict]:
+    """Every per-term object in a batched response, tolerating wrappers and truncation.
+
+    Accepts a bare array, an object wrapping the array (e.g. {"ratings": [...]}),
+    or an object keyed by slug. If the whole response does not parse (e.g. it was
+    cut off at max_tokens), each complete {...} carrying a "slug" is kept.
+    """
+    text = text.strip()
+    fence_match = re.search(r'```(?:json)?\s*\n?(.*?)\n?\s*```', text, re.DOTALL)
+    if fence_match:
+        text = fence_match.group(1).strip()
+
+    try:
+        data = json.loads(text)
+    except (json.JSONDecodeError, ValueError):
+        data = None
+
+    if isinstance(data, dict):
+        lists = [v for v in data.values() if isinstance(v, list)]
+        if lists:
+            data = lists[0]
+        elif all(isinstance(v, dict) for v in data.values()):
+            data = [{"slug": slug, **entry} for slug, entry in data.items()]
+        else:
+            data = [data]
+    if isinstance(data, list):
+        return [entry for entry in data if isinstance(entry, dict)]
+
+    # Salvage complete objects from a truncated or malformed response
+    entries = []
+    i = text.find('{')
+    while i != -1:
+        depth = 0
+        end = -1
+        for j in range(i, len(text)):
+            if text[j] == '{':
+                depth += 1
+            elif text[j] == '}':
+                depth -= 1
+                if depth == 0:
+                    end = j
+                    break
+        entry = None
+        if end != -1:
+            try:
+                entry = json.loads(text[i:end + 1])
+            except (json.JSONDecodeError, ValueError):
+                pass
+        if isinstance(entry, dict) and "slug" in entry:
+            entries.append(entry)
+            i = text.find('{', end + 1)
+        else:
+            i = text.find('{', i + 1)
+    return entries
+
+
+def _split_batch(text: str, slugs: list[str], parse_entry) -> dict:
+    """{slug: parsed} for each requested slug with a valid entry (first one wins)."""
+    wanted = set(slugs)
+    parsed = {}
+    for entry in _extract_batch(text):
+        slug = str(entry.get("slug", "")).strip().strip("`")
+        if slug in wanted and slug not in parsed:
+            result = parse_entry(entry)
+            if result:
+                parsed[slug] = result
+    return parsed
+
+
+def _parse_rating(data: dict) -> dict | None:
     try:
         rating = int(data["recognition"])
         if not 1 <= rating <= 7:
@@ -296,13 +445,7 @@ def parse_consensus_response(text: str | None) -> dict | None:
         return None
 
 
-def parse_vitality_response(text: str | None) -> dict | None:
-    """Parse JSON from vitality review response."""
-    if not text:
-        return None
-    data = _extract_json(text)
-    if not data:
-        return None
+def _parse_vitality(data: dict) -> dict | None:
     try:
         still_relevant = bool(data["still_relevant"])
         return {
@@ -313,9 +456,69 @@ def parse_vitality_response(text: str | None) -> dict | None:
         return None
 
 
+def parse_consensus_response(text: str | None, slugs: list[str] | None = None) -> dict | None:
+    """Parse JSON from model response, handling markdown fences.
+
+    With slugs, parses a batched response instead and returns {slug: rating}
+    for the slugs that came back valid; missing or invalid slugs are left out.
+    """
+    if slugs is not None:
+        return _split_batch(text, slugs, _parse_rating) if text else {}
+    if not text:
+        return None
+    data = _extract_json(text)
+    if not data:
+        return None
+    return _parse_rating(data)
+
+
+def parse_vitality_response(text: str | None, slugs: list[str] | None = None) -> dict | None:
+    """Parse JSON from vitality review response (batched when slugs is given)."""
+    if slugs is not None:
+        return _split_batch(text, slugs, _parse_vitality) if text else {}
+    if not text:
+        return None
+    data = _extract_json(text)
+    if not data:
+        return None
+    return _parse_vitality(data)
+
+
 # ── Rating Engine ──────────────────────────────────────────────────────
 
 
+def _model_result(profile: str, model: str, parsed: dict) -> dict:
+    """A stored rating/review: which model answered, via which profile, and when."""
+    model_display = (
+        model.split("/")[-1].replace(":free", "")
+    )
+    return {
+        "model": model_display,
+        "provider": profile.replace("consensus-", ""),
+        **parsed,
+        "timestamp": now_iso(),
+    }
+
+
+def _rating_ok(result) -> bool:
+    parsed = parse_consensus_response(result.text)
+    return bool(parsed and parsed["justification"].strip())
+
+
+def _batch_ok(slugs: list[str]):
+    """accept= check for a batch: only a reply that rates every term may be cached."""
+    def accept(result) -> bool:
+        parsed = parse_consensus_response(result.text, slugs)
+        return all(slug in parsed and parsed[slug]["justification"].strip() for slug in slugs)
+    return accept
+
+
+def _vitality_batch_ok(slugs: list[str]):
+    def accept(result) -> bool:
+        return all(slug in parse_vitality_response(result.text, slugs) for slug in slugs)
+    return accept
+
+
 def rate_term(router: LLMRouter, profile: str, term: dict) -> dict | None:
     """Query one model for its rating of one term."""
     try:
@@ -328,82 +531,87 @@ def rate_term(router: LLMRouter, profile: str, term: dict) -> dict | None:
             temperature=0.1,
             max_tokens=2048,
             response_format={"type": "json_object"},
+            accept=_rating_ok,
         )
         parsed = parse_consensus_response(result.text)
         if parsed and parsed["justification"].strip():
-            model_display = (
-                result.model.split("/")[-1].replace(":free", "")
-            )
-            return {
-                "model": model_display,
-                "provider": profile.replace("consensus-", ""),
-                "recognition": parsed["recognition"],
-                "justification": parsed["justification"],
-                "timestamp": now_iso(),
-            }
+            return _model_result(profile, result.model, parsed)
         elif parsed:
             print(f"    [{profile}] Rejected: rating without justification")
         else:
             print(f"    [{profile}] Failed to parse response: {(result.text or '')[:200]}")
     except Exception as e:
+        if is_rate_limited(e):
+            raise  # the fan-out scheduler backs off and retries
         print(f"    [{profile}] Error: {e}")
     return None
 
 
-def process_single_term(router, slug, profiles_to_query, round_id):
-    """Rate a single term with the specified profiles.
+def rate_terms_batch(router: LLMRouter, profile: str, terms: list[dict]) -> dict:
+    """Query one model for its ratings of several terms in one request.
 
-    Returns a result dict or None if the term couldn't be parsed.
-    Does NOT update state or set GitHub outputs — caller handles that.
+    Returns {slug: rating} for the terms that came back valid; the caller
+    falls back to rate_term for the rest.
     """
-    term = load_term_for_consensus(DEFINITIONS_DIR / f"{slug}.md")
-    if not term:
-        return None
+    try:
+        result = router.call(
+            profile,
+            messages=[
+                {"role": "system", "content": BATCH_SYSTEM_PROMPT},
+                {"role": "user", "content": format_batch_prompt(terms, BATCH_INSTRUCTION)},
+            ],
+            temperature=0.1,
+            max_tokens=batch_max_tokens(len(terms)),
+            response_format={"type": "json_object"},
+            accept=_batch_ok([t["slug"] for t in terms]),
+        )
+        parsed = parse_consensus_response(result.text, [t["slug"] for t in terms])
+        ratings = {
+            slug: _model_result(profile, result.model, rating)
+            for slug, rating in parsed.items()
+            if rating["justification"].strip()
+        }
+        if len(ratings) < len(terms):
+            print(f"    [{profile}] Batch answered {len(ratings)}/{len(terms)} terms")
+        return ratings
+    except Exception as e:
+        if is_rate_limited(e):
+            raise  # the fan-out scheduler backs off and retries
+        print(f"    [{profile}] Batch error: {e}")
+    return {}
 
+
+def record_round(slug: str, term: dict, results: dict, round_id: int) -> dict:
+    """Append one term's round to its event log once all its profiles have answered.
+
+    results maps profile → rate_term result (None for failed calls). Returns a
+    result dict; caller updates state and GitHub outputs.
+    """
     round_ratings = {}
-    with ThreadPoolExecutor(max_workers=len(profiles_to_query)) as executor:
-        futures = {
-            executor.submit(rate_term, router, profile, term): profile
-            for profile in profiles_to_query
-        }
-        for future in as_completed(futures):
-            profile = futures[future]
-            try:
-                result = future.result()
-            except Exception as e:
-                print(f"    [{profile}] Thread error: {e}")
-                continue
-            if result:
-                round_ratings[result["model"]] = result
-                score = result["recognition"]
-                print(f"    {profile}: {score}/7")
+    for profile, result in results.items():
+        if result:
+            round_ratings[result["model"]] = result
+            print(f"    {profile}: {result['recognition']}/7")
 
     if not round_ratings:
         return {"slug": slug, "name": term["name"], "ratings": {}, "success": False}
 
-    # Load existing data and append new round
-    consensus_data = load_consensus_data(slug)
-    consensus_data["name"] = term["name"]
-    consensus_data["slug"] = slug
-
+    # Append the new round to the term's event log
+    n_rounds = len(load_consensus_data(slug)["rounds"]) + 1
     new_round = {
         "round_id": round_id,
         "timestamp": now_iso(),
         "ratings": round_ratings,
     }
-    consensus_data["rounds"].append(new_round)
-
-    if "votes" not in consensus_data:
-        consensus_data["votes"] = []
-
-    save_consensus_data(slug, consensus_data)
+    consensus_log.append_event(slug, "round", new_round, name=term["name"], data_dir=CONSENSUS_DATA_DIR)
 
     return {
         "slug": slug,
         "name": term["name"],
         "ratings": round_ratings,
-        "success": bool(round_ratings),
-        "n_rounds": len(consensus_data["rounds"]),
+        "success": True,
+        "n_rounds": n_rounds,
+        "timestamp": new_round["timestamp"],
     }
 
 
@@ -419,26 +627,144 @@ def review_vitality(router: LLMRouter, profile: str, term: dict) -> dict | None:
             temperature=0.1,
             max_tokens=2048,
             response_format={"type": "json_object"},
+            accept=lambda r: bool(parse_vitality_response(r.text)),
         )
         parsed = parse_vitality_response(result.text)
         if parsed:
-            model_display = (
-                result.model.split("/")[-1].replace(":free", "")
-            )
-            return {
-                "model": model_display,
-                "provider": profile.replace("consensus-", ""),
-                "still_relevant": parsed["still_relevant"],
-                "vitality_note": parsed["vitality_note"],
-                "timestamp": now_iso(),
-            }
+            return _model_result(profile, result.model, parsed)
         else:
             print(f"    [{profile}] Failed to parse vitality response: {(result.text or '')[:200]}")
     except Exception as e:
+        if is_rate_limited(e):
+            raise  # the fan-out scheduler backs off and retries
         print(f"    [{profile}] Error: {e}")
     return None
 
 
+def review_vitality_batch(router: LLMRouter, profile: str, terms: list[dict]) -> dict:
+    """Query one model for its vitality assessment of several terms in one request."""
+    try:
+        result = router.call(
+            profile,
+            messages=[
+                {"role": "system", "content": BATCH_VITALITY_SYSTEM_PROMPT},
+                {"role": "user", "content": format_batch_prompt(terms, BATCH_VITALITY_INSTRUCTION)},
+            ],
+            temperature=0.1,
+            max_tokens=batch_max_tokens(len(terms)),
+            response_format={"type": "json_object"},
+            accept=_vitality_batch_ok([t["slug"] for t in terms]),
+        )
+        parsed = parse_vitality_response(result.text, [t["slug"] for t in terms])
+        if len(parsed) < len(terms):
+            print(f"    [{profile}] Batch answered {len(parsed)}/{len(terms)} terms")
+        return {slug: _model_result(profile, result.model, review) for slug, review in parsed.items()}
+    except Exception as e:
+        if is_rate_limited(e):
+            raise  # the fan-out scheduler backs off and retries
+        print(f"    [{profile}] Batch error: {e}")
+    return {}
+
+
+def fan_out_terms(work: list, rate_one, rate_many, cost_one, cost_many, on_term,
+                  answered: dict | None = None, on_result=None) -> list:
+    """Query every profile about every term, then call on_term(item, {profile: result}) per term.
+
+    work is [((idx, slug, term), profiles)]. answered holds results already
+    checkpointed by an interrupted run ({slug: {profile: result}}); those
+    profiles are not asked again. on_result(slug, profile, result) is called
+    from the worker thread as each result lands.
+
+    With TERMS_PER_REQUEST > 1, terms that share a profile list are sent
+    TERMS_PER_REQUEST at a time through rate_many(profile, terms) →
+    {slug: result}; any (term, profile) a batch did not answer is retried
+    once with rate_one(profile, term). Terms whose batches came back
+    complete are written before the fallback pass starts.
+    """
+    answered = answered or {}
+    profiles_for = {}
+    known = {}      # slug → {profile: result} answered so far
+    todo = []
+    completed = []
+    for item, profiles in work:
+        slug = item[1]
+        profiles_for[slug] = profiles
+        known[slug] = {p: answered[slug][p] for p in profiles if p in answered.get(slug, {})}
+        missing = [p for p in profiles if p not in known[slug]]
+        if missing:
+            todo.append((item, missing))
+        else:
+            completed.append(on_term(item, {p: known[slug][p] for p in profiles}))
+
+    def _merged(slug, results):
+        found = {**known[slug], **{p: r for p, r in results.items() if r is not None}}
+        return {p: found.get(p) for p in profiles_for[slug]}
+
+    def _one(profile, item):
+        result = rate_one(profile, item[2])
+        if result and on_result:
+            on_result(item[1], profile, result)
+        return result
+
+    def _many(profile, batch):
+        results = rate_many(profile, [item[2] for item in batch])
+        if on_result:
+            for slug, result in results.items():
+                on_result(slug, profile, result)
+        return results
+
+    if TERMS_PER_REQUEST <= 1:
+        fan_out(
+            todo,
+            _one,
+            lambda item, results: completed.append(on_term(item, _merged(item[1], results))),
+            cost=lambda profile, item: cost_one(item[2]),
+        )
+        return completed
+
+    groups = {}
+    for item, profiles in todo:
+        groups.setdefault(tuple(profiles), []).append(item)
+    batches = [
+        (tuple(items[i:i + TERMS_PER_REQUEST]), list(profiles))
+        for profiles, items in groups.items()
+        for i in range(0, len(items), TERMS_PER_REQUEST)
+    ]
+    fallback = []   # (item, profiles the batch missed)
+
+    def _on_batch(batch, results):
+        for item in batch:
+            slug = item[1]
+            for profile, by_slug in results.items():
+                if by_slug and by_slug.get(slug):
+                    known[slug][profile] = by_slug[slug]
+            missing = [p for p in profiles_for[slug] if p not in known[slug]]
+            if missing:
+                fallback.append((item, missing))
+            else:
+                completed.append(on_term(item, _merged(slug, {})))
+
+    if batches:
+        print(f"Batching {TERMS_PER_REQUEST} terms per request ({len(batches)} requests per model)\n")
+    fan_out(
+        batches,
+        _many,
+        _on_batch,
+        cost=lambda profile, batch: cost_many([item[2] for item in batch]),
+    )
+
+    if fallback:
+        calls = sum(len(missing) for _, missing in fallback)
+        print(f"\nFalling back to single-term requests for {calls} unanswered ratings\n")
+        fan_out(
+            fallback,
+            _one,
+            lambda item, results: completed.append(on_term(item, _merged(item[1], results))),
+            cost=lambda profile, item: cost_one(item[2]),
+        )
+    return completed
+
+
 # ── Helpers ────────────────────────────────────────────────────────────
 
 
@@ -446,6 +772,16 @@ def now_iso() -> str:
     return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
 
+def estimate_tokens(system: str, user: str, replies: int = 1) -> int:
+    """Rough prompt + reply token count for tokens_per_minute pacing (~4 chars/token)."""
+    return (len(system) + len(user)) // 4 + REPLY_TOKENS * replies
+
+
+def batch_max_tokens(count: int) -> int:
+    """Reply budget for a batched request: the single-term budget plus room per extra term."""
+    return 2048 + 512 * (count - 1)
+
+
 def set_github_output(key: str, value: str):
     """Set GitHub Actions output variable."""
     output_file = os.environ.get("GITHUB_OUTPUT")
@@ -472,6 +808,65 @@ def parse_mode() -> str:
     return "backfill"
 
 
+def rate_terms(router, work_list: list, round_id: int, state: dict, journal: RunJournal, answered: dict) -> int:
+    """Rate every (slug, term, profiles) in work_list through the fan-out scheduler.
+
+    Each rating is checkpointed in the journal as it lands; each term's round
+    is written, and state saved, as soon as its last profile answers.
+    Returns the number of terms that got at least one rating.
+    """
+    total = len(work_list)
+    rated = []
+
+    def _on_complete(item, results):
+        idx, slug, term = item
+        print(f"[{idx}/{total}] {term['name']}")
+        result = record_round(slug, term, results, round_id)
+        if not result["success"]:
+            print(f"    {slug} No ratings collected — skipping\n")
+            return
+        state.setdefault("terms", {})[slug] = {
+            "n_rounds": result["n_rounds"],
+            "last_updated": result["timestamp"],
+        }
+        save_state(state)
+        scores = [r["recognition"] for r in result["ratings"].values()]
+        mean_score = sum(scores) / len(scores)
+        print(f"    {slug} → Mean: {mean_score:.1f}/7 ({len(scores)} models)\n")
+        rated.append(slug)
+
+    fan_out_terms(
+        [((idx, slug, term), profiles) for idx, (slug, term, profiles) in enumerate(work_list, 1)],
+        rate_one=lambda profile, term: rate_term(router, profile, term),
+        rate_many=lambda profile, terms: rate_terms_batch(router, profile, terms),
+        cost_one=lambda term: estimate_tokens(SYSTEM_PROMPT, USER_TEMPLATE.format(**term)),
+        cost_many=lambda terms: estimate_tokens(
+            BATCH_SYSTEM_PROMPT, format_batch_prompt(terms, BATCH_INSTRUCTION), len(terms)
+        ),
+        on_term=_on_complete,
+        answered=answered,
+        on_result=journal.record,
+    )
+    return len(rated)
+
+
+def resume_work(run: dict, finished, available_profiles: list[str]) -> list:
+    """(slug, profiles) still to do in an interrupted run.
+
+    Terms for which finished(slug) is true are dropped; profiles that are no
+    longer available are only kept if the journal already has their answer.
+    """
+    work = []
+    for slug, profiles in run["work"]:
+        if finished(slug):
+            continue
+        answered = run["answered"].get(slug, {})
+        profiles = [p for p in profiles if p in answered or p in available_profiles]
+        if profiles:
+            work.append((slug, profiles))
+    return work
+
+
 def run_consensus(router, available_profiles, mode="backfill"):
     """Run standard consensus ratings (1-7 recognition scale).
 
@@ -479,141 +874,106 @@ def run_consensus(router, available_profiles, mode="backfill"):
         backfill — batch of unrated/least-rated terms, all models (default)
         single   — one least-rated/unrated term, all models
         gap-fill — terms with missing models, query only the gaps
+
+    If the previous run was interrupted, its journal is resumed instead.
     """
     state = load_state()
     all_slugs = list_all_slugs()
+    if reconcile_state(state):
+        save_state(state)
+    journal = RunJournal("consensus")
+    run = journal.load()
+
+    if run:
+        round_id = run["id"]
+        mode = run["mode"]
+        work = resume_work(
+            run,
+            lambda slug: any(r.get("round_id") == round_id for r in load_consensus_data(slug)["rounds"]),
+            available_profiles,
+        )
+        answered = run["answered"]
+        checkpointed = sum(len(answered.get(slug, {})) for slug, _ in work)
+        print(f"Resuming round {round_id} [{mode}] from {run['started']}: "
+              f"{len(work)} of {len(run['work'])} terms left, {checkpointed} ratings checkpointed\n")
 
-    if mode == "gap-fill":
+    elif mode == "gap-fill":
         # Build work list: terms that have gaps, up to BATCH_SIZE
-        work_list = []  # list of (slug, missing_profiles)
-        for slug in all_slugs:
-            missing = get_missing_models(slug, available_profiles)
-            if missing:
-                work_list.append((slug, missing))
-                if len(work_list) >= BATCH_SIZE:
-                    break
+        work = []  # list of (slug, missing_profiles)
+        db = open_consensus_db()
+        if db:
+            with db:
+                work = db.missing_models(all_slugs, available_profiles)[:BATCH_SIZE]
+        else:
+            for slug in all_slugs:
+                missing = get_missing_models(slug, available_profiles)
+                if missing:
+                    work.append((slug, missing))
+                    if len(work) >= BATCH_SIZE:
+                        break
 
-        if not work_list:
+        if not work:
             print("Gap-fill: no missing models found for any term.")
             set_github_output("rated_count", "0")
             return
 
-        # Increment round only when there is work to do
-        state["current_round"] = state.get("current_round", 0) + 1
-        round_id = state["current_round"]
-
-        print(f"Round {round_id} [gap-fill]: Filling gaps for {len(work_list)} terms\n")
-
-        # Process terms in parallel (each term's models are also parallelized internally)
-        max_concurrent_terms = min(len(work_list), 4)
-        rated_count = 0
-
-        def _process_gap_fill_term(item):
-            idx, (slug, missing) = item
-            print(f"[{idx}/{len(work_list)}] {slug} (gaps: {', '.join(p.replace('consensus-', '') for p in missing)})")
-            return process_single_term(router, slug, missing, round_id)
-
-        with ThreadPoolExecutor(max_workers=max_concurrent_terms) as executor:
-            futures = {
-                executor.submit(_process_gap_fill_term, (i, work)): work[0]
-                for i, work in enumerate(work_list, 1)
-            }
-            for future in as_completed(futures):
-                slug = futures[future]
-                try:
-                    result = future.result()
-                except Exception as e:
-                    print(f"    [{slug}] Thread error: {e}")
-                    continue
-
-                if result is None:
-                    print(f"    {slug} skipped (could not parse)")
-                    continue
-
-                if result["success"]:
-                    if "terms" not in state:
-                        state["terms"] = {}
-                    state["terms"][slug] = {
-                        "n_rounds": result["n_rounds"],
-                        "last_updated": now_iso(),
-                    }
-                    scores = [r["recognition"] for r in result["ratings"].values()]
-                    mean_score = sum(scores) / len(scores)
-                    print(f"    {slug} → Mean: {mean_score:.1f}/7 ({len(scores)} models)\n")
-                    rated_count += 1
-                else:
-                    print(f"    {slug} No ratings collected — skipping\n")
-
-        # Save state once after all terms complete
-        save_state(state)
-        set_github_output("rated_count", str(rated_count))
-
-        print(f"\nDone. Gap-filled {rated_count} terms.")
-
     else:
         # backfill or single mode
         batch_size = 1 if mode == "single" else BATCH_SIZE
-        batch = select_batch(state, all_slugs, batch_size)
+        db = open_consensus_db()
+        if db:
+            with db:
+                batch = db.select_batch(all_slugs, batch_size)
+        else:
+            batch = select_batch(state, all_slugs, batch_size)
 
         if not batch:
             print("No terms available to rate.")
             set_github_output("rated_count", "0")
             set_github_output("remaining_unrated", "0")
             return
+        work = [(slug, available_profiles) for slug in batch]
 
-        # Increment round only when there is work to do
+    if not run:
+        # Increment round only when there is work to do, and checkpoint the
+        # plan before the first call so an interrupted run can be resumed
         state["current_round"] = state.get("current_round", 0) + 1
         round_id = state["current_round"]
-
-        print(f"Round {round_id} [{mode}]: Rating {len(batch)} terms\n")
-
-        # Process terms in parallel (each term's models are also parallelized internally)
-        max_concurrent_terms = min(len(batch), 4)
-        rated_count = 0
-
-        def _process_batch_term(item):
-            idx, slug = item
-            term = load_term_for_consensus(DEFINITIONS_DIR / f"{slug}.md")
-            if not term:
-                print(f"[{idx}/{len(batch)}] {slug} — skipped (could not parse)")
-                return None
-            print(f"[{idx}/{len(batch)}] {term['name']}")
-            return process_single_term(router, slug, available_profiles, round_id)
-
-        with ThreadPoolExecutor(max_workers=max_concurrent_terms) as executor:
-            futures = {
-                executor.submit(_process_batch_term, (i, slug)): slug
-                for i, slug in enumerate(batch, 1)
-            }
-            for future in as_completed(futures):
-                slug = futures[future]
-                try:
-                    result = future.result()
-                except Exception as e:
-                    print(f"    [{slug}] Thread error: {e}")
-                    continue
-
-                if result is None:
-                    continue
-
-                if result["success"]:
-                    if "terms" not in state:
-                        state["terms"] = {}
-                    state["terms"][slug] = {
-                        "n_rounds": result["n_rounds"],
-                        "last_updated": now_iso(),
-                    }
-                    scores = [r["recognition"] for r in result["ratings"].values()]
-                    mean_score = sum(scores) / len(scores)
-                    print(f"    {slug} → Mean: {mean_score:.1f}/7 ({len(scores)} models)\n")
-                    rated_count += 1
-                else:
-                    print(f"    {slug} No ratings collected — skipping\n")
-
-        # Save state once after all terms complete
+        answered = {}
+        journal.start(round_id, mode, work)
         save_state(state)
-        set_github_output("rated_count", str(rated_count))
+        if mode == "gap-fill":
+            print(f"Round {round_id} [gap-fill]: Filling gaps for {len(work)} terms\n")
+        else:
+            print(f"Round {round_id} [{mode}]: Rating {len(work)} terms\n")
+
+    # A rerun of this round (e.g. after a failed job) is served from the cache;
+    # only replies that parsed were stored, so failed pairs are asked again
+    router = cached(router, scope=f"round-{round_id}")
+
+    work_list = []
+    for idx, (slug, profiles) in enumerate(work, 1):
+        term = load_term_for_consensus(DEFINITIONS_DIR / f"{slug}.md")
+        if not term:
+            print(f"[{idx}/{len(work)}] {slug} — skipped (could not parse)")
+            continue
+        if mode == "gap-fill":
+            print(f"  {slug} (gaps: {', '.join(p.replace('consensus-', '') for p in profiles)})")
+        work_list.append((slug, term, profiles))
+    if mode == "gap-fill":
+        print()
+
+    rated_count = rate_terms(router, work_list, round_id, state, journal, answered)
+    journal.finish()
+
+    # State is saved after every term; reconcile once more as a final check
+    reconcile_state(state)
+    save_state(state)
+    set_github_output("rated_count", str(rated_count))
 
+    if mode == "gap-fill":
+        print(f"\nDone. Gap-filled {rated_count} terms.")
+    else:
         # Check if unrated terms remain (for chaining decisions)
         rated_slugs = state.get("terms", {})
         remaining_unrated = sum(1 for s in all_slugs if s not in rated_slugs)
@@ -621,86 +981,101 @@ def run_consensus(router, available_profiles, mode="backfill"):
         print(f"\nDone. Rated {rated_count} terms across {len(available_profiles)} models. {remaining_unrated} unrated terms remaining.")
 
 
-def run_vitality(router, available_profiles):
-    """Run quarterly vitality review — binary relevance check for ALL terms."""
-    all_slugs = list_all_slugs()
-    state = load_state()
-
-    # Determine the vitality review ID
-    vitality_state = state.get("vitality", {})
-    review_id = vitality_state.get("last_review_id", 0) + 1
+def record_vitality_review(slug: str, term: dict, results: dict, review_id: int) -> bool:
+    """Append one term's vitality review to its event log. Returns False if no model answered."""
+    review_ratings = {}
+    for profile, result in results.items():
+        if result:
+            review_ratings[result["model"]] = result
+            status = "relevant" if result["still_relevant"] else "fading"
+            print(f"    {profile}: {status}")
 
-    print(f"Vitality review #{review_id}: Reviewing {len(all_slugs)} terms\n")
+    if not review_ratings:
+        print(f"    No reviews collected — skipping")
+        return False
 
-    reviewed_count = 0
+    # Append the vitality review to the term's event log
+    new_review = {
+        "review_id": review_id,
+        "timestamp": now_iso(),
+        "ratings": review_ratings,
+    }
+    consensus_log.append_event(slug, "vitality_review", new_review, name=term["name"], data_dir=CONSENSUS_DATA_DIR)
 
-    def _review_single_term(item):
-        """Review one term across all providers (providers queried in parallel)."""
-        idx, slug = item
-        term = load_term_for_consensus(DEFINITIONS_DIR / f"{slug}.md")
-        if not term:
-            print(f"[{idx}/{len(all_slugs)}] {slug} — skipped (could not parse)")
-            return None
+    relevant = sum(1 for r in review_ratings.values() if r["still_relevant"])
+    total = len(review_ratings)
+    print(f"    {slug} → {relevant}/{total} models say still relevant\n")
+    return True
 
-        print(f"[{idx}/{len(all_slugs)}] {term['name']}")
-
-        review_ratings = {}
-        with ThreadPoolExecutor(max_workers=len(available_profiles)) as executor:
-            futures = {
-                executor.submit(review_vitality, router, profile, term): profile
-                for profile in available_profiles
-            }
-            for future in as_completed(futures):
-                profile = futures[future]
-                try:
-                    result = future.result()
-                except Exception as e:
-                    print(f"    [{profile}] Thread error: {e}")
-                    continue
-                if result:
-                    review_ratings[result["model"]] = result
-                    status = "relevant" if result["still_relevant"] else "fading"
-                    print(f"    {profile}: {status}")
-
-        if not review_ratings:
-            print(f"    No reviews collected — skipping")
-            return None
 
-        # Load existing consensus data and append vitality review
-        consensus_data = load_consensus_data(slug)
-        consensus_data["name"] = term["name"]
-        consensus_data["slug"] = slug
-
-        if "vitality_reviews" not in consensus_data:
-            consensus_data["vitality_reviews"] = []
+def run_vitality(router, available_profiles):
+    """Run quarterly vitality review — binary relevance check for ALL terms.
 
-        new_review = {
-            "review_id": review_id,
-            "timestamp": now_iso(),
-            "ratings": review_ratings,
-        }
-        consensus_data["vitality_reviews"].append(new_review)
-
-        save_consensus_data(slug, consensus_data)
-
-        relevant = sum(1 for r in review_ratings.values() if r["still_relevant"])
-        total = len(review_ratings)
-        print(f"    {slug} → {relevant}/{total} models say still relevant\n")
-        return slug
-
-    max_concurrent_terms = min(len(all_slugs), 4)
-    with ThreadPoolExecutor(max_workers=max_concurrent_terms) as executor:
-        futures = [
-            executor.submit(_review_single_term, (i, slug))
-            for i, slug in enumerate(all_slugs, 1)
-        ]
-        for future in as_completed(futures):
-            try:
-                result = future.result()
-                if result is not None:
-                    reviewed_count += 1
-            except Exception as e:
-                print(f"    Thread error: {e}")
+    If the previous review was interrupted, its journal is resumed instead.
+    """
+    all_slugs = list_all_slugs()
+    state = load_state()
+    journal = RunJournal("vitality")
+    run = journal.load()
+
+    if run:
+        review_id = run["id"]
+        work = resume_work(
+            run,
+            lambda slug: any(
+                r.get("review_id") == review_id
+                for r in load_consensus_data(slug).get("vitality_reviews", [])
+            ),
+            available_profiles,
+        )
+        answered = run["answered"]
+        print(f"Resuming vitality review #{review_id} from {run['started']}: "
+              f"{len(work)} of {len(run['work'])} terms left\n")
+    else:
+        # Next review id; also past any review a crashed run wrote to consensus-data
+        last_id = state.get("vitality", {}).get("last_review_id", 0)
+        for data in consensus_log.load_all(CONSENSUS_DATA_DIR).values():
+            for review in data.get("vitality_reviews", []):
+                last_id = max(last_id, review.get("review_id", 0))
+        review_id = last_id + 1
+        work = [(slug, available_profiles) for slug in all_slugs]
+        answered = {}
+        journal.start(review_id, "vitality", work)
+        print(f"Vitality review #{review_id}: Reviewing {len(all_slugs)} terms\n")
+
+    router = cached(router, scope=f"vitality-{review_id}")
+    total = len(run["work"]) if run else len(all_slugs)
+    positions = {slug: idx for idx, (slug, _) in enumerate(run["work"] if run else work, 1)}
+
+    items = []
+    for slug, profiles in work:
+        term = load_term_for_consensus(DEFINITIONS_DIR / f"{slug}.md")
+        if not term:
+            print(f"[{positions[slug]}/{total}] {slug} — skipped (could not parse)")
+            continue
+        items.append(((positions[slug], slug, term), profiles))
+
+    def _on_complete(item, results):
+        idx, slug, term = item
+        print(f"[{idx}/{total}] {term['name']}")
+        return record_vitality_review(slug, term, results, review_id)
+
+    # Every (term, profile) review goes through one scheduler and is
+    # checkpointed as it lands; each term is written as soon as its last
+    # review does
+    reviewed_count = sum(fan_out_terms(
+        items,
+        rate_one=lambda profile, term: review_vitality(router, profile, term),
+        rate_many=lambda profile, terms: review_vitality_batch(router, profile, terms),
+        cost_one=lambda term: estimate_tokens(VITALITY_SYSTEM_PROMPT, VITALITY_USER_TEMPLATE.format(**term)),
+        cost_many=lambda terms: estimate_tokens(
+            BATCH_VITALITY_SYSTEM_PROMPT, format_batch_prompt(terms, BATCH_VITALITY_INSTRUCTION), len(terms)
+        ),
+        on_term=_on_complete,
+        answered=answered,
+        on_result=journal.record,
+    ))
+    journal.finish()
 
     # Update state
     state["vitality"] = {
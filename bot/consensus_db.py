@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Optional SQLite index of bot/consensus-data/.
+
+The JSON snapshots and event logs (see consensus_log.py) stay the source of
+truth. This module mirrors them into a SQLite database, by default
+bot/.cache/consensus.sqlite, with one table each for terms, rounds, ratings,
+votes and vitality reviews. Ratings and votes are indexed by term, slug,
+provider/model and timestamp, so these questions become single queries
+instead of loading every file:
+
+    missing_models()   gap-fill: which panel providers have not rated each term
+    select_batch()     backfill: unrated terms first, then fewest rounds / oldest
+    consensus_stats    per-term, per-model and pairwise aggregates for build_api
+
+sync() is an incremental importer. It hashes each term's snapshot plus log
+and re-imports only the terms whose bytes changed. export() regenerates the
+JSON snapshots from the database, in the same format as before, and folds in
+any event logs.
+
+Usage:
+    python bot/consensus_db.py import [--db=path]   # create/refresh the database
+    python bot/consensus_db.py export [--db=path]   # rewrite consensus-data/*.json
+
+    CONSENSUS_DB=bot/.cache/consensus.sqlite python bot/consensus.py --mode gap-fill
+    python bot/build_api.py --consensus-db
+"""
+
+import hashlib
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import consensus_log
+from build_metrics import metrics
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONSENSUS_DATA_DIR = REPO_ROOT / "bot" / "consensus-data"
+DB_PATH = REPO_ROOT / "bot" / ".cache" / "consensus.sqlite"
+SCHEMA_VERSION = 1
+
+# Top-level keys of a term's data that are stored as rows rather than in terms.extra
+LIST_TABLES = {"rounds": "rounds", "votes": "votes", "vitality_reviews": "vitality_reviews"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS terms (
+    stem TEXT PRIMARY KEY,
+    pos INTEGER NOT NULL,          -- filename order, i.e. ConsensusStore order
+    slug TEXT NOT NULL,
+    name TEXT,
+    digest TEXT NOT NULL,
+    extra TEXT NOT NULL            -- the term dict with list fields emptied (keeps key order)
+);
+CREATE TABLE IF NOT EXISTS rounds (
+    id INTEGER PRIMARY KEY,        -- round order within a term
+    stem TEXT NOT NULL,
+    round_id INTEGER,
+    timestamp TEXT,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ratings (
+    id INTEGER PRIMARY KEY,
+    round INTEGER NOT NULL REFERENCES rounds(id),
+    stem TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    model TEXT NOT NULL,
+    provider TEXT,
+    recognition,
+    timestamp TEXT
+);
+CREATE TABLE IF NOT EXISTS votes (
+    id INTEGER PRIMARY KEY,
+    stem TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    model TEXT NOT NULL,           -- model_claimed, "unknown" when absent
+    recognition,
+    timestamp TEXT,
+    issue INTEGER,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS vitality_reviews (
+    id INTEGER PRIMARY KEY,
+    stem TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    review_id INTEGER,
+    timestamp TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS terms_pos ON terms(pos);
+CREATE INDEX IF NOT EXISTS terms_slug ON terms(slug);
+CREATE INDEX IF NOT EXISTS rounds_stem ON rounds(stem, timestamp);
+CREATE INDEX IF NOT EXISTS ratings_stem_provider ON ratings(stem, provider);
+CREATE INDEX IF NOT EXISTS ratings_model_slug ON ratings(model, slug);
+CREATE INDEX IF NOT EXISTS ratings_timestamp ON ratings(timestamp);
+CREATE INDEX IF NOT EXISTS votes_stem ON votes(stem, model);
+CREATE INDEX IF NOT EXISTS votes_timestamp ON votes(timestamp);
+CREATE INDEX IF NOT EXISTS vitality_stem ON vitality_reviews(stem, timestamp);
+"""
+
+
+def _digest(stem: str, data_dir: Path) -> str:
+    """Hash of a term's snapshot and log bytes (empty for missing files)."""
+    h = hashlib.sha256()
+    for path in (consensus_log.snapshot_path(stem, data_dir), consensus_log.log_path(stem, data_dir)):
+        raw = path.read_bytes() if path.exists() else b""
+        metrics.record_read(len(raw))
+        h.update(len(raw).to_bytes(8, "big"))
+        h.update(raw)
+    return h.hexdigest()
+
+
+class ConsensusDB:
+    """SQLite mirror of consensus-data. One instance per thread."""
+
+    def __init__(self, path: Path = DB_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            # Derived data: on a schema change, start over
+            for table in ("ratings", "rounds", "votes", "vitality_reviews", "terms"):
+                self.conn.execute(f"DROP TABLE IF EXISTS {table}")
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ── Import / export ─────────────────────────────────────────────────
+
+    def _delete(self, stem: str) -> None:
+        for table in ("ratings", "rounds", "votes", "vitality_reviews", "terms"):
+            self.conn.execute(f"DELETE FROM {table} WHERE stem = ?", (stem,))
+
+    def _insert(self, stem: str, pos: int, digest: str, data: dict | None) -> None:
+        if data is None:
+            # Unreadable snapshot: keep the digest so it is not re-read every sync
+            self.conn.execute(
+                "INSERT INTO terms (stem, pos, slug, name, digest, extra) VALUES (?, ?, ?, NULL, ?, 'null')",
+                (stem, pos, stem, digest),
+            )
+            return
+        slug = data.get("slug", stem)
+        extra = {k: ([] if k in LIST_TABLES else v) for k, v in data.items()}
+        self.conn.execute(
+            "INSERT INTO terms (stem, pos, slug, name, digest, extra) VALUES (?, ?, ?, ?, ?, ?)",
+            (stem, pos, slug, data.get("name"), digest, json.dumps(extra, ensure_ascii=False)),
+        )
+        for r in data.get("rounds", []):
+            round_row = self.conn.execute(
+                "INSERT INTO rounds (stem, round_id, timestamp, data) VALUES (?, ?, ?, ?)",
+                (stem, r.get("round_id"), r.get("timestamp"), json.dumps(r, ensure_ascii=False)),
+            ).lastrowid
+            self.conn.executemany(
+                "INSERT INTO ratings (round, stem, slug, model, provider, recognition, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (round_row, stem, slug, model, rd.get("provider"), rd.get("recognition"), rd.get("timestamp"))
+                    for model, rd in r.get("ratings", {}).items()
+                ],
+            )
+        self.conn.executemany(
+            "INSERT INTO votes (stem, slug, model, recognition, timestamp, issue, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (stem, slug, v.get("model_claimed", "unknown"), v.get("recognition"),
+                 v.get("timestamp"), v.get("issue"), json.dumps(v, ensure_ascii=False))
+                for v in data.get("votes", [])
+            ],
+        )
+        self.conn.executemany(
+            "INSERT INTO vitality_reviews (stem, slug, review_id, timestamp, data) VALUES (?, ?, ?, ?, ?)",
+            [
+                (stem, slug, r.get("review_id"), r.get("timestamp"), json.dumps(r, ensure_ascii=False))
+                for r in data.get("vitality_reviews", [])
+            ],
+        )
+
+    def sync(self, data_dir: Path = CONSENSUS_DATA_DIR) -> tuple[int, int]:
+        """Import terms whose files changed and drop terms whose files are gone.
+
+        Returns (terms imported, terms removed).
+        """
+        stems = consensus_log.stems(data_dir)
+        known = dict(self.conn.execute("SELECT stem, digest FROM terms"))
+        live = set(stems)
+        removed = [stem for stem in known if stem not in live]
+        imported = 0
+        with self.conn:
+            for stem in removed:
+                self._delete(stem)
+            for pos, stem in enumerate(stems):
+                digest = _digest(stem, data_dir)
+                if known.get(stem) == digest:
+                    self.conn.execute("UPDATE terms SET pos = ? WHERE stem = ?", (pos, stem))
+                    continue
+                try:
+                    data = consensus_log.load_term(stem, data_dir)
+                except ValueError as e:
+                    print(f"  Warning: skipping {stem}: {e}")
+                    data = None
+                self._delete(stem)
+                self._insert(stem, pos, digest, data)
+                imported += data is not None
+        return imported, len(removed)
+
+    def records(self) -> dict:
+        """Every term's data dict, keyed by stem in filename order (what ConsensusStore holds)."""
+        lists = {stem: {key: [] for key in LIST_TABLES} for (stem,) in self.conn.execute("SELECT stem FROM terms")}
+        for key, table in LIST_TABLES.items():
+            for stem, data in self.conn.execute(f"SELECT stem, data FROM {table} ORDER BY id"):
+                lists[stem][key].append(json.loads(data))
+
+        records = {}
+        for stem, extra in self.conn.execute("SELECT stem, extra FROM terms ORDER BY pos"):
+            data = json.loads(extra)
+            if data is None:
+                continue  # unreadable snapshot, skipped like ConsensusStore.load does
+            for key in LIST_TABLES:
+                if key in data:
+                    data[key] = lists[stem][key]
+            records[stem] = data
+        return records
+
+    def export(self, data_dir: Path = CONSENSUS_DATA_DIR) -> int:
+        """Rewrite every snapshot from the database and remove folded-in logs.
+
+        Returns the number of snapshot files whose contents changed.
+        """
+        written = 0
+        for stem, data in self.records().items():
+            path = consensus_log.snapshot_path(stem, data_dir)
+            payload = json.dumps(data, indent=2, ensure_ascii=False)
+            if not path.exists() or path.read_text(encoding="utf-8") != payload:
+                consensus_log._write_snapshot(path, data)
+                written += 1
+            consensus_log.log_path(stem, data_dir).unlink(missing_ok=True)
+        return written
+
+    # ── Queries ─────────────────────────────────────────────────────────
+
+    def missing_models(self, slugs: list[str], panel_profiles: list[str]) -> list[tuple[str, list[str]]]:
+        """(slug, profiles that have not rated it) for every slug with gaps, in slug order.
+
+        Same rule as consensus.get_missing_models: a profile counts as having
+        rated a term when any rating has its provider name.
+        """
+        providers = [profile.replace("consensus-", "") for profile in panel_profiles]
+        rows = self.conn.execute(
+            """
+            SELECT s.value, p.key
+            FROM json_each(?) AS s CROSS JOIN json_each(?) AS p
+            WHERE NOT EXISTS (
+                SELECT 1 FROM ratings r
+                WHERE r.stem = s.value AND r.provider = p.value AND r.provider != ''
+            )
+            ORDER BY s.key, p.key
+            """,
+            (json.dumps(slugs), json.dumps(providers)),
+        )
+        gaps = {}
+        for slug, index in rows:
+            gaps.setdefault(slug, []).append(panel_profiles[index])
+        return list(gaps.items())
+
+    def select_batch(self, slugs: list[str], batch_size: int) -> list[str]:
+        """Terms to rate next: unrated first; otherwise fewest rounds, then oldest latest round.
+
+        Ties keep slug order. Round counts and timestamps come from the
+        consensus data itself rather than consensus-state.json.
+        """
+        rows = self.conn.execute(
+            """
+            WITH candidates AS (
+                SELECT s.key AS pos, s.value AS slug, r.n_rounds, r.last_updated
+                FROM json_each(?) AS s
+                LEFT JOIN (
+                    SELECT stem, COUNT(*) AS n_rounds, MAX(timestamp) AS last_updated
+                    FROM rounds GROUP BY stem
+                ) AS r ON r.stem = s.value
+            )
+            SELECT slug FROM candidates
+            WHERE n_rounds IS NULL OR NOT EXISTS (SELECT 1 FROM candidates WHERE n_rounds IS NULL)
+            ORDER BY n_rounds IS NOT NULL, COALESCE(n_rounds, 0), COALESCE(last_updated, ''), pos
+            LIMIT ?
+            """,
+            (json.dumps(slugs), batch_size),
+        )
+        return [slug for (slug,) in rows]
+
+    def integer_scores(self) -> bool:
+        """Whether every rating and vote has an integer recognition score."""
+        return not self.conn.execute(
+            "SELECT EXISTS (SELECT 1 FROM ratings WHERE typeof(recognition) != 'integer') "
+            "OR EXISTS (SELECT 1 FROM votes WHERE typeof(recognition) != 'integer')"
+        ).fetchone()[0]
+
+
+if __name__ == "__main__":
+    commands = [a for a in sys.argv[1:] if not a.startswith("--")]
+    db_path = DB_PATH
+    for arg in sys.argv[1:]:
+        if arg.startswith("--db="):
+            db_path = Path(arg.split("=", 1)[1])
+    if commands not in (["import"], ["export"]):
+        print(__doc__.strip())
+        sys.exit(1)
+
+    with ConsensusDB(db_path) as db:
+        imported, removed = db.sync()
+        print(f"Imported {imported} terms ({removed} removed) into {db_path}")
+        if commands == ["export"]:
+            print(f"Rewrote {db.export()} consensus-data snapshots")
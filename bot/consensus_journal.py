@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Checkpoint journal for consensus and vitality runs.
+
+A run writes its plan first — the run id (round or vitality review id), the
+mode and every (slug, profiles) it will query — then appends each (slug,
+profile) rating the moment it comes back:
+
+    {"type": "run", "kind": "consensus", "id": 181, "mode": "backfill", "started": ..., "work": [[slug, [profiles]], ...]}
+    {"type": "rating", "slug": ..., "profile": ..., "result": {...}}
+
+The journal lives next to the state it protects (bot/consensus-journal.jsonl,
+bot/vitality-journal.jsonl) and is committed with consensus-data even when a
+job fails or times out. The next run finds the unfinished journal and resumes
+the same round: terms whose round is already in consensus-data are skipped,
+journaled ratings are reused, and only the missing (slug, profile) pairs are
+queried. A finished run truncates its journal to empty.
+"""
+
+import json
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+from build_metrics import read_text
+
+
+BOT_DIR = Path(__file__).parent
+
+
+class RunJournal:
+    """Append-only journal of one kind of run ("consensus" or "vitality")."""
+
+    def __init__(self, kind: str, path: Path | None = None):
+        self.kind = kind
+        self.path = path or BOT_DIR / f"{kind}-journal.jsonl"
+        self._lock = threading.Lock()
+
+    def _append(self, entry: dict) -> None:
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock, open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+            fh.flush()
+
+    def start(self, run_id: int, mode: str, work: list) -> None:
+        """Begin a run, replacing any previous journal. work is [(slug, profiles)]."""
+        header = {
+            "type": "run",
+            "kind": self.kind,
+            "id": run_id,
+            "mode": mode,
+            "started": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "work": [[slug, list(profiles)] for slug, profiles in work],
+        }
+        self.path.write_text(json.dumps(header, ensure_ascii=False) + "\n", encoding="utf-8")
+
+    def record(self, slug: str, profile: str, result: dict) -> None:
+        """Checkpoint one rating as soon as it lands (safe to call from worker threads)."""
+        self._append({"type": "rating", "slug": slug, "profile": profile, "result": result})
+
+    def load(self) -> dict | None:
+        """The unfinished run, or None: {"id", "mode", "started", "work", "answered"}.
+
+        answered maps slug → {profile: result} for every checkpointed rating.
+        A torn last line (crash mid-write) is ignored.
+        """
+        if not self.path.exists():
+            return None
+        run = None
+        for line in read_text(self.path).splitlines():
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry.get("type") == "run" and entry.get("kind") == self.kind:
+                run = {
+                    "id": entry["id"],
+                    "mode": entry.get("mode", ""),
+                    "started": entry.get("started", ""),
+                    "work": [(slug, profiles) for slug, profiles in entry.get("work", [])],
+                    "answered": {},
+                }
+            elif entry.get("type") == "rating" and run is not None:
+                run["answered"].setdefault(entry["slug"], {})[entry["profile"]] = entry["result"]
+        return run
+
+    def finish(self) -> None:
+        """Mark the run complete (the file is kept, empty, so it stays tracked)."""
+        self.path.write_text("", encoding="utf-8")
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Append-only event log for bot/consensus-data/.
+
+Each term's consensus data is a snapshot, bot/consensus-data/{slug}.json, plus
+an event log, bot/consensus-data/{slug}.jsonl, with one JSON object per line:
+
+    {"event": "round", "slug": ..., "name": ..., "data": {round}}
+    {"event": "vote", "slug": ..., "name": ..., "data": {vote}}
+    {"event": "vitality_review", "slug": ..., "name": ..., "data": {review}}
+
+Writers (consensus.py, the process-votes workflow) only append a line, so a
+write costs the same however long a term's history is, and git diffs are one
+line. .gitattributes merges the logs with merge=union, so two workflows that
+append to the same slug no longer conflict on rebase.
+
+Readers call load_term()/load_all(), which replay the log over the snapshot
+and return the same dict the snapshot file used to hold. compact() folds a
+log into its snapshot; the daily vote sweep compacts logs that reach
+COMPACT_THRESHOLD events.
+
+Usage:
+    python bot/consensus_log.py --compact                 # logs with >= 50 events
+    python bot/consensus_log.py --compact --min-events=1  # every log
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from build_metrics import read_text, write_atomic
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONSENSUS_DATA_DIR = REPO_ROOT / "bot" / "consensus-data"
+EVENT_TYPES = {"round": "rounds", "vote": "votes", "vitality_review": "vitality_reviews"}
+COMPACT_THRESHOLD = 50
+
+
+def snapshot_path(slug: str, data_dir: Path = CONSENSUS_DATA_DIR) -> Path:
+    return data_dir / f"{slug}.json"
+
+
+def log_path(slug: str, data_dir: Path = CONSENSUS_DATA_DIR) -> Path:
+    return data_dir / f"{slug}.jsonl"
+
+
+# ── Writing ─────────────────────────────────────────────────────────────
+
+def append_event(slug: str, event: str, data: dict, name: str = "", data_dir: Path = CONSENSUS_DATA_DIR) -> None:
+    """Append one round/vote/vitality_review event to a term's log."""
+    if event not in EVENT_TYPES:
+        raise ValueError(f"Unknown consensus event '{event}' (expected one of: {', '.join(EVENT_TYPES)})")
+    line = json.dumps({"event": event, "slug": slug, "name": name, "data": data}, ensure_ascii=False)
+    data_dir.mkdir(parents=True, exist_ok=True)
+    # One write() of a complete line; O_APPEND keeps concurrent appends whole
+    with open(log_path(slug, data_dir), "a", encoding="utf-8") as fh:
+        fh.write(line + "\n")
+
+
+def _write_snapshot(path: Path, data: dict) -> None:
+    """Atomically replace a snapshot file (same formatting as the old whole-file writes)."""
+    write_atomic(path, json.dumps(data, indent=2, ensure_ascii=False))
+
+
+# ── Reading ─────────────────────────────────────────────────────────────
+
+def read_events(path: Path) -> list[dict]:
+    """Events in a log file, skipping lines that are not valid events (e.g. a torn last line)."""
+    if not path.exists():
+        return []
+    events = []
+    for line in read_text(path).splitlines():
+        if not line.strip():
+            continue
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(event, dict) and event.get("event") in EVENT_TYPES:
+            events.append(event)
+    return events
+
+
+def apply_event(data: dict | None, event: dict) -> dict:
+    """Apply one event to a term's data dict (None if the term has no data yet)."""
+    slug = event.get("slug", "")
+    if data is None:
+        data = {"slug": slug, "name": event.get("name", ""), "rounds": [], "votes": []}
+    kind = event["event"]
+    if kind != "vote":
+        # Rating runs refresh the term's identity; votes only name new terms
+        data["name"] = event.get("name", data.get("name", ""))
+        data["slug"] = slug
+    data.setdefault(EVENT_TYPES[kind], []).append(event["data"])
+    if kind == "round":
+        data.setdefault("votes", [])
+    return data
+
+
+def _load_snapshot(path: Path) -> dict | None:
+    """Parsed snapshot, None if missing. Raises ValueError if it is unreadable."""
+    if not path.exists():
+        return None
+    try:
+        return json.loads(read_text(path))
+    except (json.JSONDecodeError, OSError) as e:
+        raise ValueError(f"{path.name}: {e}") from e
+
+
+def load_term(slug: str, data_dir: Path = CONSENSUS_DATA_DIR) -> dict | None:
+    """Current consensus data for a term (snapshot + log), or None if it has none.
+
+    Raises ValueError if the snapshot exists but cannot be parsed.
+    """
+    data = _load_snapshot(snapshot_path(slug, data_dir))
+    for event in read_events(log_path(slug, data_dir)):
+        data = apply_event(data, event)
+    return data
+
+
+def stems(data_dir: Path = CONSENSUS_DATA_DIR) -> list[str]:
+    """Every term with a snapshot or a log, in snapshot filename order."""
+    if not data_dir.exists():
+        return []
+    found = {
+        p.stem for p in data_dir.iterdir()
+        if p.suffix in (".json", ".jsonl") and not p.name.startswith(".")
+    }
+    return sorted(found, key=lambda stem: f"{stem}.json")
+
+
+def load_all(data_dir: Path = CONSENSUS_DATA_DIR) -> dict:
+    """Current consensus data for every term, keyed by file stem (sorted).
+
+    Terms whose snapshot is unreadable are skipped.
+    """
+    records = {}
+    for stem in stems(data_dir):
+        try:
+            data = load_term(stem, data_dir)
+        except ValueError:
+            continue
+        if data is not None:
+            records[stem] = data
+    return records
+
+
+# ── Compaction ──────────────────────────────────────────────────────────
+
+def compact(slug: str, data_dir: Path = CONSENSUS_DATA_DIR) -> bool:
+    """Fold a term's log into its snapshot and remove the log. Returns True if it had events."""
+    path = log_path(slug, data_dir)
+    events = read_events(path)
+    if not events:
+        path.unlink(missing_ok=True)
+        return False
+    data = load_term(slug, data_dir)
+    _write_snapshot(snapshot_path(slug, data_dir), data)
+    path.unlink()
+    return True
+
+
+def compact_all(data_dir: Path = CONSENSUS_DATA_DIR, min_events: int = COMPACT_THRESHOLD) -> int:
+    """Compact every log with at least min_events events. Returns the number compacted."""
+    compacted = 0
+    for path in sorted(data_dir.glob("*.jsonl")):
+        if len(read_events(path)) < min_events:
+            continue
+        try:
+            if compact(path.stem, data_dir):
+                compacted += 1
+        except ValueError as e:
+            print(f"  Warning: not compacting {path.name}: {e}")
+    return compacted
+
+
+if __name__ == "__main__":
+    if "--compact" not in sys.argv[1:]:
+        print(__doc__.strip())
+        sys.exit(1)
+    min_events = COMPACT_THRESHOLD
+    for arg in sys.argv[1:]:
+        if arg.startswith("--min-events="):
+            min_events = int(arg.split("=", 1)[1])
+    count = compact_all(min_events=min_events)
+    print(f"Compacted {count} consensus event logs")
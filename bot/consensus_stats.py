@@ -0,0 +1,580 @@
+#!/usr/bin/env python3
+"""
+Consensus statistics for build_consensus and build_models.
+
+Both phases need means, medians and standard deviations over every rating and
+vote in the ConsensusStore. term_statistics() and model_statistics() compute
+them in one pass and return plain dicts that the builders turn into JSON.
+
+When NumPy is installed, the store is flattened once into columns (one row per
+rating or vote: term, round, model, score) and every aggregate is a grouped
+reduction over those columns; pairwise model congruence uses a model × slug
+matrix of latest scores. When the store was loaded from the SQLite mirror
+(ConsensusStore.from_db), the same aggregates are GROUP BY queries instead.
+Without either, or when the data holds anything other than integer scores,
+the original pure-Python statistics code runs.
+
+Results are identical either way. Sums of integer scores are exact, means are
+int when statistics.mean would return an int, and standard deviations use the
+same correctly rounded square root as statistics.stdev (computed once per
+distinct (numerator, denominator) pair, of which there are few).
+
+Usage:
+    from consensus_stats import term_statistics, model_statistics
+    stats = term_statistics(store)["context-amnesia"]
+    stats["scheduled"]["mean"], stats["combined"]["std_dev"]
+"""
+
+import functools
+import math
+import statistics
+import sys
+import threading
+import weakref
+
+try:
+    import numpy as np
+except ImportError:  # optional: the pure-Python path gives the same results
+    np = None
+
+from consensus_db import ConsensusDB
+from consensus_store import ConsensusStore
+
+
+_columns_lock = threading.Lock()
+_columns_cache = weakref.WeakKeyDictionary()  # ConsensusStore -> ConsensusColumns | None
+
+# Bits of precision needed for a correctly rounded float square root
+_SQRT_BIT_WIDTH = 2 * sys.float_info.mant_dig + 3
+
+
+# ── Exact helpers ───────────────────────────────────────────────────────
+
+def _exact_mean(total: int, n: int) -> int | float:
+    """statistics.mean of n integers summing to total (int when exact)."""
+    return total // n if total % n == 0 else total / n
+
+
+def _sqrt_of_frac(n: int, m: int) -> float:
+    """Correctly rounded sqrt(n / m) for non-negative integers, as statistics.stdev computes it."""
+    q = (n.bit_length() - m.bit_length() - _SQRT_BIT_WIDTH) // 2
+    if q >= 0:
+        a = math.isqrt(n // (m << 2 * q))
+        numerator = (a | (a * a * (m << 2 * q) != n)) << q
+        denominator = 1
+    else:
+        a = math.isqrt((n << -2 * q) // m)
+        numerator = a | (a * a * m != (n << -2 * q))
+        denominator = 1 << -q
+    return numerator / denominator
+
+
+@functools.lru_cache(maxsize=None)
+def _stdev(n: int, total: int, total_sq: int) -> float:
+    """statistics.stdev of n > 1 integers with the given sum and sum of squares."""
+    return _sqrt_of_frac(n * total_sq - total * total, n * (n - 1))
+
+
+def _stdevs(counts, sums, sums_sq) -> list[float]:
+    """statistics.stdev for each group with count > 1 (0.0 otherwise), from exact sums."""
+    counts = np.asarray(counts, dtype=np.int64)
+    multi = counts > 1
+    numerators = np.where(multi, counts * sums_sq - sums * sums, 0)
+    denominators = np.where(multi, counts * (counts - 1), 1)
+    pairs, inverse = np.unique(np.stack([numerators, denominators], axis=1), axis=0, return_inverse=True)
+    roots = [_sqrt_of_frac(int(num), int(den)) for num, den in pairs.tolist()]
+    return [roots[i] for i in inverse.reshape(-1).tolist()]
+
+
+def _grouped(keys, scores, size: int):
+    """Count, sum and sum of squares of scores per key in range(size), as int64 arrays."""
+    counts = np.bincount(keys, minlength=size)
+    # Float sums of small integers are exact well past any realistic corpus size
+    sums = np.bincount(keys, weights=scores, minlength=size).astype(np.int64)
+    sums_sq = np.bincount(keys, weights=scores * scores, minlength=size).astype(np.int64)
+    return counts, sums, sums_sq
+
+
+# ── Columnar view ───────────────────────────────────────────────────────
+
+class ConsensusColumns:
+    """Every rating and vote in a ConsensusStore as flat int64 arrays."""
+
+    def __init__(self, store: ConsensusStore):
+        self.stems = []
+        self.slugs = []  # distinct slugs, in order of first appearance
+        self.models = []  # every model that rated or voted, sorted by name
+        self.round_counts = []  # number of rounds per term
+        self.has_data = []  # term has any rounds or votes
+
+        slug_index = {}
+        model_index = {}
+        term_slug = []
+        ratings = ([], [], [], [])  # term, round, model, score
+        votes = ([], [], [])  # term, model, score
+        n_rounds = 0
+
+        for t, (stem, raw) in enumerate(store.items()):
+            slug = raw.get("slug", stem)
+            rounds = raw.get("rounds", [])
+            term_votes = raw.get("votes", [])
+            self.stems.append(stem)
+            term_slug.append(slug_index.setdefault(slug, len(slug_index)))
+            self.round_counts.append(len(rounds))
+            self.has_data.append(bool(rounds or term_votes))
+            for r in rounds:
+                for model, rd in r.get("ratings", {}).items():
+                    ratings[0].append(t)
+                    ratings[1].append(n_rounds)
+                    ratings[2].append(model_index.setdefault(model, len(model_index)))
+                    ratings[3].append(rd.get("recognition"))
+                n_rounds += 1
+            for v in term_votes:
+                votes[0].append(t)
+                votes[1].append(model_index.setdefault(v.get("model_claimed", "unknown"), len(model_index)))
+                votes[2].append(v.get("recognition"))
+
+        self.slugs = list(slug_index)
+        self.n_rounds = n_rounds
+        # Floats, missing scores etc. go through the statistics module instead
+        self.exact = all(type(s) is int for s in ratings[3]) and all(type(s) is int for s in votes[2])
+        if not self.exact:
+            return
+
+        # Renumber models in name order so model indices sort like model names
+        names = list(model_index)
+        order = sorted(range(len(names)), key=names.__getitem__)
+        self.models = [names[i] for i in order]
+        rank = np.empty(len(names), dtype=np.int64)
+        rank[order] = np.arange(len(names))
+
+        self.term_slug = np.array(term_slug, dtype=np.int64)
+        self.rating_term = np.array(ratings[0], dtype=np.int64)
+        self.rating_round = np.array(ratings[1], dtype=np.int64)
+        self.rating_model = rank[np.array(ratings[2], dtype=np.int64)]
+        self.rating_score = np.array(ratings[3], dtype=np.int64)
+        self.vote_term = np.array(votes[0], dtype=np.int64)
+        self.vote_model = rank[np.array(votes[1], dtype=np.int64)]
+        self.vote_score = np.array(votes[2], dtype=np.int64)
+
+
+def columns(store: ConsensusStore) -> "ConsensusColumns | None":
+    """Columnar view of a store, built once and shared by the build phases.
+
+    None when NumPy is unavailable or the data is not all integer scores.
+    """
+    if np is None:
+        return None
+    with _columns_lock:
+        if store not in _columns_cache:
+            cols = ConsensusColumns(store)
+            _columns_cache[store] = cols if cols.exact else None
+        return _columns_cache[store]
+
+
+# ── Per-term aggregates ─────────────────────────────────────────────────
+
+def term_statistics(store: ConsensusStore) -> dict:
+    """Aggregates for every term with rounds or votes, keyed by data file stem.
+
+    Each value has:
+        scheduled     {"mean", "median", "std_dev", "n_models"} over all ratings, or None
+        crowdsourced  {"mean", "n_votes", "by_model": {model: (mean, n)}} over votes, or None
+        combined      {"mean", "std_dev", "n_total"} over ratings plus votes, or None
+        round_means   mean rating of each round (None for rounds without ratings)
+
+    Values are unrounded, exactly as the statistics module returns them.
+    """
+    if store.db_path is not None:
+        stats = _term_statistics_sql(store.db_path)
+        if stats is not None:
+            return stats
+    cols = columns(store)
+    if cols is None:
+        return _term_statistics_python(store)
+    return _term_statistics_numpy(cols)
+
+
+def _term_statistics_python(store: ConsensusStore) -> dict:
+    stats = {}
+    for stem, raw in store.items():
+        rounds = raw.get("rounds", [])
+        votes = raw.get("votes", [])
+        if not rounds and not votes:
+            continue
+
+        scheduled_scores = [rd["recognition"] for r in rounds for rd in r.get("ratings", {}).values()]
+        scheduled = None
+        if scheduled_scores:
+            all_models = set()
+            for r in rounds:
+                all_models.update(r.get("ratings", {}).keys())
+            scheduled = {
+                "mean": statistics.mean(scheduled_scores),
+                "median": statistics.median(scheduled_scores),
+                "std_dev": statistics.stdev(scheduled_scores) if len(scheduled_scores) > 1 else 0.0,
+                "n_models": len(all_models),
+            }
+
+        vote_scores = [v["recognition"] for v in votes if "recognition" in v]
+        crowdsourced = None
+        if vote_scores:
+            by_model = {}
+            for v in votes:
+                by_model.setdefault(v.get("model_claimed", "unknown"), []).append(v["recognition"])
+            crowdsourced = {
+                "mean": statistics.mean(vote_scores),
+                "n_votes": len(vote_scores),
+                "by_model": {m: (statistics.mean(s), len(s)) for m, s in sorted(by_model.items())},
+            }
+
+        all_scores = scheduled_scores + vote_scores
+        combined = {
+            "mean": statistics.mean(all_scores),
+            "std_dev": statistics.stdev(all_scores) if len(all_scores) > 1 else 0.0,
+            "n_total": len(all_scores),
+        } if all_scores else None
+
+        round_means = []
+        for r in rounds:
+            scores = [rd["recognition"] for rd in r.get("ratings", {}).values()]
+            round_means.append(statistics.mean(scores) if scores else None)
+
+        stats[stem] = {
+            "scheduled": scheduled,
+            "crowdsourced": crowdsourced,
+            "combined": combined,
+            "round_means": round_means,
+        }
+    return stats
+
+
+def _term_statistics_numpy(cols: ConsensusColumns) -> dict:
+    n_terms = len(cols.stems)
+    n_models = max(len(cols.models), 1)
+
+    # Scheduled ratings per term
+    r_count, r_sum, r_sum_sq = _grouped(cols.rating_term, cols.rating_score, n_terms)
+    r_std = _stdevs(r_count, r_sum, r_sum_sq)
+    order = np.lexsort((cols.rating_score, cols.rating_term))
+    sorted_scores = cols.rating_score[order]
+    starts = np.cumsum(r_count) - r_count
+    rated = r_count > 0
+    low = np.zeros(n_terms, dtype=np.int64)
+    high = np.zeros(n_terms, dtype=np.int64)
+    low[rated] = sorted_scores[(starts + (r_count - 1) // 2)[rated]]
+    high[rated] = sorted_scores[(starts + r_count // 2)[rated]]
+    term_models = np.unique(cols.rating_term * n_models + cols.rating_model)
+    r_models = np.bincount(term_models // n_models, minlength=n_terms)
+
+    # Votes per term and per (term, model)
+    v_count, v_sum, v_sum_sq = _grouped(cols.vote_term, cols.vote_score, n_terms)
+    vote_keys, vote_inverse = np.unique(cols.vote_term * n_models + cols.vote_model, return_inverse=True)
+    k_count, k_sum, _ = _grouped(vote_inverse.reshape(-1), cols.vote_score, len(vote_keys))
+    by_model = {}
+    for key, count, total in zip(vote_keys.tolist(), k_count.tolist(), k_sum.tolist()):
+        term, model = divmod(key, n_models)
+        by_model.setdefault(term, {})[cols.models[model]] = (_exact_mean(total, count), count)
+
+    # Ratings plus votes
+    c_count, c_sum, c_sum_sq = r_count + v_count, r_sum + v_sum, r_sum_sq + v_sum_sq
+    c_std = _stdevs(c_count, c_sum, c_sum_sq)
+
+    # Per-round means (rounds numbered globally, in term order)
+    round_count, round_sum, _ = _grouped(cols.rating_round, cols.rating_score, cols.n_rounds)
+    round_means = [
+        _exact_mean(total, count) if count else None
+        for count, total in zip(round_count.tolist(), round_sum.tolist())
+    ]
+
+    stats = {}
+    r_count, r_sum, r_models = r_count.tolist(), r_sum.tolist(), r_models.tolist()
+    low, high = low.tolist(), high.tolist()
+    v_count, v_sum = v_count.tolist(), v_sum.tolist()
+    c_count, c_sum = c_count.tolist(), c_sum.tolist()
+    first_round = 0
+    for t, stem in enumerate(cols.stems):
+        n_term_rounds = cols.round_counts[t]
+        term_round_means = round_means[first_round:first_round + n_term_rounds]
+        first_round += n_term_rounds
+        if not cols.has_data[t]:
+            continue
+
+        n = r_count[t]
+        scheduled = {
+            "mean": _exact_mean(r_sum[t], n),
+            "median": low[t] if n % 2 else (low[t] + high[t]) / 2,
+            "std_dev": r_std[t],
+            "n_models": r_models[t],
+        } if n else None
+        crowdsourced = {
+            "mean": _exact_mean(v_sum[t], v_count[t]),
+            "n_votes": v_count[t],
+            "by_model": dict(sorted(by_model[t].items())),
+        } if v_count[t] else None
+        combined = {
+            "mean": _exact_mean(c_sum[t], c_count[t]),
+            "std_dev": c_std[t],
+            "n_total": c_count[t],
+        } if c_count[t] else None
+
+        stats[stem] = {
+            "scheduled": scheduled,
+            "crowdsourced": crowdsourced,
+            "combined": combined,
+            "round_means": term_round_means,
+        }
+    return stats
+
+
+# ── Per-model aggregates ────────────────────────────────────────────────
+
+def model_statistics(store: ConsensusStore) -> dict:
+    """Aggregates for every model with scheduled ratings, and pairwise congruence.
+
+    Returns {"models": {model: {...}}, "pairwise": {(m1, m2): (mean_abs_diff, shared_terms)}}
+    with models sorted by name and pairs in sorted-name order. Per model:
+        total_ratings, terms_rated, mean_score
+        self_std_devs  stdev of each slug the model rated 2+ times
+        latest_scores  {slug: most recent score}, in first-rated order
+    Pairwise differences compare latest scores on the slugs both models rated.
+    """
+    if store.db_path is not None:
+        stats = _model_statistics_sql(store.db_path)
+        if stats is not None:
+            return stats
+    cols = columns(store)
+    if cols is None:
+        return _model_statistics_python(store)
+    return _model_statistics_numpy(cols)
+
+
+def _model_statistics_python(store: ConsensusStore) -> dict:
+    model_data = {}
+    for stem, raw in store.items():
+        slug = raw.get("slug", stem)
+        for r in raw.get("rounds", []):
+            for model, rd in r.get("ratings", {}).items():
+                md = model_data.setdefault(model, {"scores": [], "term_scores": {}, "latest_scores": {}})
+                score = rd["recognition"]
+                md["scores"].append(score)
+                md["term_scores"].setdefault(slug, []).append(score)
+                # Later rounds overwrite earlier ones, so this ends up being the latest
+                md["latest_scores"][slug] = score
+
+    models = {}
+    for model, md in sorted(model_data.items()):
+        models[model] = {
+            "total_ratings": len(md["scores"]),
+            "terms_rated": len(md["term_scores"]),
+            "mean_score": statistics.mean(md["scores"]),
+            "self_std_devs": [statistics.stdev(s) for s in md["term_scores"].values() if len(s) >= 2],
+            "latest_scores": md["latest_scores"],
+        }
+
+    pairwise = {}
+    names = list(models)
+    for i, m1 in enumerate(names):
+        for m2 in names[i + 1:]:
+            latest1, latest2 = model_data[m1]["latest_scores"], model_data[m2]["latest_scores"]
+            shared = set(latest1) & set(latest2)
+            if shared:
+                diffs = [abs(latest1[s] - latest2[s]) for s in shared]
+                pairwise[(m1, m2)] = (statistics.mean(diffs), len(shared))
+    return {"models": models, "pairwise": pairwise}
+
+
+def _model_statistics_numpy(cols: ConsensusColumns) -> dict:
+    n_slugs = max(len(cols.slugs), 1)
+    slug = cols.term_slug[cols.rating_term]
+    model = cols.rating_model
+    score = cols.rating_score
+
+    # Group ratings by (model, slug); keys sort by model name, then slug
+    keys, first, inverse = np.unique(model * n_slugs + slug, return_index=True, return_inverse=True)
+    inverse = inverse.reshape(-1)
+    k_count, k_sum, k_sum_sq = _grouped(inverse, score, len(keys))
+    last = np.zeros(len(keys), dtype=np.int64)
+    last[inverse] = np.arange(len(inverse))  # later ratings overwrite earlier ones
+    latest = score[last]
+    k_model, k_slug = keys // n_slugs, keys % n_slugs
+    k_std = _stdevs(k_count, k_sum, k_sum_sq)
+
+    n_models = len(cols.models)
+    m_count, m_sum, _ = _grouped(model, score, n_models)
+    terms_rated = np.bincount(k_model, minlength=n_models)
+
+    models = {}
+    k_count_list = k_count.tolist()
+    bounds = np.searchsorted(k_model, np.arange(n_models + 1)).tolist()
+    for m, name in enumerate(cols.models):
+        if not m_count[m]:
+            continue  # only voted, never rated
+        lo, hi = bounds[m], bounds[m + 1]
+        by_first = lo + np.argsort(first[lo:hi], kind="stable")
+        models[name] = {
+            "total_ratings": int(m_count[m]),
+            "terms_rated": int(terms_rated[m]),
+            "mean_score": _exact_mean(int(m_sum[m]), int(m_count[m])),
+            "self_std_devs": [k_std[k] for k in range(lo, hi) if k_count_list[k] >= 2],
+            "latest_scores": dict(zip(
+                [cols.slugs[s] for s in k_slug[by_first].tolist()],
+                latest[by_first].tolist(),
+            )),
+        }
+
+    # Model × slug matrix of latest scores; one vectorized row comparison per model
+    rated = np.zeros((n_models, n_slugs), dtype=bool)
+    matrix = np.zeros((n_models, n_slugs), dtype=np.int64)
+    rated[k_model, k_slug] = True
+    matrix[k_model, k_slug] = latest
+    pairwise = {}
+    names = cols.models
+    for i in range(n_models - 1):
+        shared = rated[i + 1:] & rated[i]
+        n_shared = shared.sum(axis=1).tolist()
+        diff_sums = np.where(shared, np.abs(matrix[i + 1:] - matrix[i]), 0).sum(axis=1).tolist()
+        for offset, (count, total) in enumerate(zip(n_shared, diff_sums)):
+            if count:
+                pairwise[(names[i], names[i + 1 + offset])] = (_exact_mean(total, count), count)
+    return {"models": models, "pairwise": pairwise}
+
+
+# ── SQLite backend ──────────────────────────────────────────────────────
+
+def _term_statistics_sql(db_path) -> dict | None:
+    """term_statistics from the SQLite mirror; None if any score is not an integer."""
+    with ConsensusDB(db_path) as db:
+        if not db.integer_scores():
+            return None
+        conn = db.conn
+        terms = conn.execute(
+            "SELECT stem, "
+            "  (SELECT COUNT(*) FROM rounds r WHERE r.stem = t.stem), "
+            "  (SELECT COUNT(*) FROM votes v WHERE v.stem = t.stem) "
+            "FROM terms t WHERE extra != 'null' ORDER BY pos"
+        ).fetchall()
+        scheduled = {
+            stem: row for stem, *row in conn.execute(
+                "SELECT stem, COUNT(*), SUM(recognition), SUM(recognition * recognition), COUNT(DISTINCT model) "
+                "FROM ratings GROUP BY stem"
+            )
+        }
+        medians = {
+            stem: (low, high) for stem, low, high in conn.execute(
+                """
+                SELECT stem,
+                       MIN(CASE WHEN rn = (n + 1) / 2 THEN recognition END),
+                       MIN(CASE WHEN rn = n / 2 + 1 THEN recognition END)
+                FROM (
+                    SELECT stem, recognition,
+                           ROW_NUMBER() OVER (PARTITION BY stem ORDER BY recognition) AS rn,
+                           COUNT(*) OVER (PARTITION BY stem) AS n
+                    FROM ratings
+                )
+                WHERE rn IN ((n + 1) / 2, n / 2 + 1)
+                GROUP BY stem
+                """
+            )
+        }
+        votes = {
+            stem: row for stem, *row in conn.execute(
+                "SELECT stem, COUNT(*), SUM(recognition), SUM(recognition * recognition) FROM votes GROUP BY stem"
+            )
+        }
+        by_model = {}
+        for stem, model, count, total in conn.execute(
+            "SELECT stem, model, COUNT(*), SUM(recognition) FROM votes GROUP BY stem, model"
+        ):
+            by_model.setdefault(stem, {})[model] = (_exact_mean(total, count), count)
+        round_means = {}
+        for stem, count, total in conn.execute(
+            "SELECT ro.stem, COUNT(ra.id), SUM(ra.recognition) "
+            "FROM rounds ro LEFT JOIN ratings ra ON ra.round = ro.id GROUP BY ro.id ORDER BY ro.id"
+        ):
+            round_means.setdefault(stem, []).append(_exact_mean(total, count) if count else None)
+
+    stats = {}
+    for stem, n_rounds, n_votes in terms:
+        if not n_rounds and not n_votes:
+            continue
+        r_count, r_sum, r_sum_sq, r_models = scheduled.get(stem, (0, 0, 0, 0))
+        v_count, v_sum, v_sum_sq = votes.get(stem, (0, 0, 0))
+        c_count, c_sum, c_sum_sq = r_count + v_count, r_sum + v_sum, r_sum_sq + v_sum_sq
+        low, high = medians.get(stem, (None, None))
+        stats[stem] = {
+            "scheduled": {
+                "mean": _exact_mean(r_sum, r_count),
+                "median": low if r_count % 2 else (low + high) / 2,
+                "std_dev": _stdev(r_count, r_sum, r_sum_sq) if r_count > 1 else 0.0,
+                "n_models": r_models,
+            } if r_count else None,
+            "crowdsourced": {
+                "mean": _exact_mean(v_sum, v_count),
+                "n_votes": v_count,
+                "by_model": dict(sorted(by_model[stem].items())),
+            } if v_count else None,
+            "combined": {
+                "mean": _exact_mean(c_sum, c_count),
+                "std_dev": _stdev(c_count, c_sum, c_sum_sq) if c_count > 1 else 0.0,
+                "n_total": c_count,
+            } if c_count else None,
+            "round_means": round_means.get(stem, []),
+        }
+    return stats
+
+
+def _model_statistics_sql(db_path) -> dict | None:
+    """model_statistics from the SQLite mirror; None if any score is not an integer."""
+    with ConsensusDB(db_path) as db:
+        if not db.integer_scores():
+            return None
+        conn = db.conn
+        # Latest score per (model, slug) in store order; listed in first-rated order
+        conn.execute(
+            """
+            CREATE TEMP TABLE latest AS
+            SELECT model, slug, recognition AS score, first_pos, first_id FROM (
+                SELECT ra.model, ra.slug, ra.recognition,
+                       ROW_NUMBER() OVER newest AS rn,
+                       FIRST_VALUE(t.pos) OVER oldest AS first_pos,
+                       FIRST_VALUE(ra.id) OVER oldest AS first_id
+                FROM ratings ra JOIN terms t ON t.stem = ra.stem
+                WINDOW newest AS (PARTITION BY ra.model, ra.slug ORDER BY t.pos DESC, ra.id DESC),
+                       oldest AS (PARTITION BY ra.model, ra.slug ORDER BY t.pos, ra.id)
+            )
+            WHERE rn = 1
+            """
+        )
+        conn.execute("CREATE INDEX temp.latest_slug ON latest(slug, model)")
+
+        models = {}
+        for model, count, total, terms_rated in conn.execute(
+            "SELECT model, COUNT(*), SUM(recognition), COUNT(DISTINCT slug) FROM ratings GROUP BY model ORDER BY model"
+        ):
+            models[model] = {
+                "total_ratings": count,
+                "terms_rated": terms_rated,
+                "mean_score": _exact_mean(total, count),
+                "self_std_devs": [],
+                "latest_scores": {},
+            }
+        for model, count, total, total_sq in conn.execute(
+            "SELECT model, COUNT(*), SUM(recognition), SUM(recognition * recognition) "
+            "FROM ratings GROUP BY model, slug HAVING COUNT(*) >= 2"
+        ):
+            models[model]["self_std_devs"].append(_stdev(count, total, total_sq))
+        for model, slug, score in conn.execute(
+            "SELECT model, slug, score FROM latest ORDER BY model, first_pos, first_id"
+        ):
+            models[model]["latest_scores"][slug] = score
+
+        pairwise = {
+            (m1, m2): (_exact_mean(total, count), count)
+            for m1, m2, count, total in conn.execute(
+                "SELECT a.model, b.model, COUNT(*), SUM(ABS(a.score - b.score)) "
+                "FROM latest a JOIN latest b ON a.slug = b.slug AND a.model < b.model "
+                "GROUP BY a.model, b.model ORDER BY a.model, b.model"
+            )
+        }
+    return {"models": models, "pairwise": pairwise}
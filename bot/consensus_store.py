@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+In-memory view of bot/consensus-data/, loaded once and shared by build phases.
+
+build_consensus, build_models, compute_vitality, compute_interest and
+build_reputation all need every consensus-data file. Loading the directory
+once into a ConsensusStore and handing it to each phase avoids parsing the
+same JSON five-plus times per build. Each term's data is its snapshot with
+its event log replayed on top (see consensus_log.py).
+
+Usage:
+    store = ConsensusStore.load()
+    for stem, raw in store.items():
+        ...
+    store.votes("context-amnesia")
+"""
+
+from pathlib import Path
+
+import consensus_log
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CONSENSUS_DATA_DIR = REPO_ROOT / "bot" / "consensus-data"
+
+
+class ConsensusStore:
+    """Raw consensus data for every term, keyed by data file stem (sorted)."""
+
+    def __init__(self, records: dict | None = None, exists: bool = True, db_path: Path | None = None):
+        self._records = records or {}
+        self._by_slug = {raw.get("slug", stem): raw for stem, raw in self._records.items()}
+        self.exists = exists
+        # SQLite mirror of these records (consensus_db), used for aggregate queries
+        self.db_path = db_path
+
+    @classmethod
+    def load(cls, data_dir: Path = CONSENSUS_DATA_DIR) -> "ConsensusStore":
+        """Read every term's snapshot and event log exactly once.
+
+        Terms with a malformed snapshot are skipped, matching the per-phase
+        loaders this replaces.
+        """
+        if not data_dir.exists():
+            return cls(exists=False)
+        return cls(consensus_log.load_all(data_dir))
+
+    @classmethod
+    def from_db(cls, db_path: Path, data_dir: Path = CONSENSUS_DATA_DIR) -> "ConsensusStore":
+        """Sync the SQLite mirror at db_path with data_dir and load the records from it.
+
+        Only terms whose files changed since the last sync are re-parsed.
+        """
+        from consensus_db import ConsensusDB
+
+        if not data_dir.exists():
+            return cls(exists=False)
+        with ConsensusDB(db_path) as db:
+            imported, removed = db.sync(data_dir)
+            records = db.records()
+        print(f"Consensus DB: {imported} terms re-imported, {removed} removed ({db_path})")
+        return cls(records, db_path=db_path)
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def items(self):
+        """Iterate (file stem, raw data dict) pairs in filename order."""
+        return self._records.items()
+
+    def slugs(self) -> list[str]:
+        """Slugs of all loaded terms, in filename order."""
+        return list(self._by_slug)
+
+    def get(self, slug: str) -> dict | None:
+        """Raw data dict for a slug, or None if it has no consensus data."""
+        return self._by_slug.get(slug)
+
+    def rounds(self, slug: str) -> list:
+        return self._by_slug.get(slug, {}).get("rounds", [])
+
+    def votes(self, slug: str) -> list:
+        return self._by_slug.get(slug, {}).get("votes", [])
+
+    def vitality_reviews(self, slug: str) -> list:
+        return self._by_slug.get(slug, {}).get("vitality_reviews", [])
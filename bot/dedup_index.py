@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+MinHash LSH index for shortlisting near-duplicate submissions.
+
+review_submission's deduplication check used to run SequenceMatcher on the
+submission's name and definition against every existing term. This index
+narrows that to a shortlist: each term's name and first Definition paragraph
+(lowercased, whitespace collapsed) are cut into character 3-gram shingles and
+reduced to a 128-value MinHash signature. Signatures are split into 64 bands
+of 2 rows; any term sharing a band with the submission's name or definition
+is a candidate, and candidates whose estimated Jaccard similarity is below
+MIN_JACCARD are dropped. Only the shortlist gets the exact SequenceMatcher
+scoring, so the thresholds and rejection messages are unchanged.
+
+Recall against the old full scan depends on how a near-duplicate was made.
+Reworded definitions (words swapped, dropped or added) that the full scan
+rejects keep roughly 0.3 or more of their 3-grams, which two-row bands
+catch with >99% probability; none were missed in tests/test_dedup_index.py.
+Character-level corruption is different: definitions with a third or more
+of their characters edited can still score above 0.65 with SequenceMatcher
+while sharing only 0.12-0.2 of their 3-grams, and about a quarter of those
+are not shortlisted. Lowering MIN_JACCARD or using one-row bands recovers
+them only by shortlisting most of the dictionary, so such typo-level
+near-copies of a definition are left to the LLM quality review.
+
+build_api refreshes the index on every build; signatures are stored per slug
+in bot/.cache/dedup-index.json with a hash of the text they came from, so
+only changed terms are re-hashed, and a missing or stale cache is rebuilt by
+whoever loads it. Band buckets are rebuilt in memory on load. Signatures are
+computed with NumPy when it is installed; the pure-Python path gives the same
+values.
+
+Usage:
+    from dedup_index import load_dedup_index
+    index = load_dedup_index(existing)              # refreshed from the given terms
+    index.candidates("context amnesia", "losing ...")  # {slug, ...}
+
+    python bot/dedup_index.py "Candidate name" "candidate definition"
+"""
+
+import hashlib
+import json
+import random
+import sys
+import zlib
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # optional: the pure-Python path gives the same signatures
+    np = None
+
+from build_metrics import read_text, write_atomic
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+INDEX_PATH = REPO_ROOT / "bot" / ".cache" / "dedup-index.json"
+INDEX_VERSION = 1
+SHINGLE_SIZE = 3
+NUM_PERM = 128
+BAND_ROWS = 2
+MIN_JACCARD = 0.2  # estimated-Jaccard floor for a shortlisted candidate (see recall note above)
+
+# Multiply-shift hash family: h(x) = ((a*x + b) mod 2**64) >> 32 with odd a.
+# Wrapping uint64 arithmetic makes it one vectorized expression under NumPy.
+_MASK64 = (1 << 64) - 1
+_rng = random.Random(20240601)
+PERMUTATIONS = [(_rng.getrandbits(64) | 1, _rng.getrandbits(64)) for _ in range(NUM_PERM)]
+if np is not None:
+    _A = np.array([a for a, _ in PERMUTATIONS], dtype=np.uint64)[:, None]
+    _B = np.array([b for _, b in PERMUTATIONS], dtype=np.uint64)[:, None]
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+def shingles(text: str) -> set[int]:
+    """CRC32 hashes of the text's character shingles."""
+    text = normalize(text)
+    if not text:
+        return set()
+    if len(text) <= SHINGLE_SIZE:
+        return {zlib.crc32(text.encode("utf-8"))}
+    return {
+        zlib.crc32(text[i:i + SHINGLE_SIZE].encode("utf-8"))
+        for i in range(len(text) - SHINGLE_SIZE + 1)
+    }
+
+
+def signature(text: str) -> list[int] | None:
+    """MinHash signature of the text, or None if it is empty."""
+    hashes = shingles(text)
+    if not hashes:
+        return None
+    if np is not None:
+        x = np.fromiter(hashes, dtype=np.uint64, count=len(hashes))[None, :]
+        return ((_A * x + _B).min(axis=1) >> np.uint64(32)).tolist()
+    # The shift is monotonic, so it can be applied after taking the minimum
+    return [min([(a * x + b) & _MASK64 for x in hashes]) >> 32 for a, b in PERMUTATIONS]
+
+
+def estimate_jaccard(sig_a: list[int], sig_b: list[int]) -> float:
+    return sum(1 for a, b in zip(sig_a, sig_b) if a == b) / NUM_PERM
+
+
+def _bands(sig: list[int]):
+    for start in range(0, NUM_PERM, BAND_ROWS):
+        yield start, tuple(sig[start:start + BAND_ROWS])
+
+
+def _pack(sig: list[int] | None) -> str:
+    return "".join(f"{v:08x}" for v in sig) if sig else ""
+
+
+def _unpack(packed: str) -> list[int] | None:
+    if not packed:
+        return None
+    return [int(packed[i:i + 8], 16) for i in range(0, len(packed), 8)]
+
+
+def term_text(term: dict) -> tuple[str, str]:
+    """The (name, definition) a term is compared on — as in review_submission.get_existing_terms.
+
+    Accepts parsed definitions (name/definition) and review_submission's
+    existing-term dicts (term/definition).
+    """
+    name = term.get("term") or term.get("name") or term.get("slug", "")
+    definition = term.get("definition", "").split("\n\n", 1)[0]
+    return normalize(name), normalize(definition)
+
+
+def _digest(name: str, definition: str) -> str:
+    return hashlib.sha256(f"{name}\n{definition}".encode("utf-8")).hexdigest()[:16]
+
+
+class DedupIndex:
+    """MinHash signatures per slug with in-memory LSH band buckets."""
+
+    def __init__(self, path: Path = INDEX_PATH):
+        self.path = path
+        self.terms = {}  # slug -> {"digest", "name", "definition"} (packed signatures)
+        self._buckets = None
+        self._signatures = None
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path = INDEX_PATH) -> "DedupIndex":
+        index = cls(path)
+        if path.exists():
+            try:
+                data = json.loads(read_text(path))
+            except (json.JSONDecodeError, OSError):
+                data = {}
+            if data.get("version") == INDEX_VERSION and data.get("num_perm") == NUM_PERM:
+                index.terms = data.get("terms", {})
+        return index
+
+    def update(self, terms: list[dict]) -> int:
+        """Sync with the given terms; returns the number of signatures (re)computed or dropped."""
+        changed = 0
+        live = set()
+        for term in terms:
+            slug = term.get("slug")
+            if not slug:
+                continue
+            live.add(slug)
+            name, definition = term_text(term)
+            digest = _digest(name, definition)
+            entry = self.terms.get(slug)
+            if entry and entry["digest"] == digest:
+                continue
+            self.terms[slug] = {
+                "digest": digest,
+                "name": _pack(signature(name)),
+                "definition": _pack(signature(definition)),
+            }
+            changed += 1
+        for slug in [s for s in self.terms if s not in live]:
+            del self.terms[slug]
+            changed += 1
+        if changed:
+            self.dirty = True
+            self._buckets = None
+        return changed
+
+    def save(self) -> None:
+        """Write the index if it changed (atomic replace)."""
+        if not self.dirty:
+            return
+        payload = json.dumps(
+            {"version": INDEX_VERSION, "num_perm": NUM_PERM, "terms": dict(sorted(self.terms.items()))},
+            ensure_ascii=False, separators=(",", ":"),
+        )
+        try:
+            write_atomic(self.path, payload)
+            self.dirty = False
+        except OSError as e:
+            print(f"  Warning: could not write {self.path.name}: {e}")
+
+    # ── Lookup ──────────────────────────────────────────────────────────
+
+    def _build_buckets(self) -> None:
+        # The field is part of the bucket key: names only collide with names,
+        # definitions with definitions
+        buckets = {}
+        signatures = {}
+        for slug, entry in self.terms.items():
+            for field in ("name", "definition"):
+                sig = _unpack(entry[field])
+                if sig is None:
+                    continue
+                signatures[(slug, field)] = sig
+                for start, band in _bands(sig):
+                    buckets.setdefault((field, start, band), []).append(slug)
+        self._buckets = buckets
+        self._signatures = signatures
+
+    def candidates(self, name: str, definition: str = "", min_jaccard: float = MIN_JACCARD) -> set[str]:
+        """Slugs whose name or definition may be a near-duplicate of the given ones."""
+        if self._buckets is None:
+            self._build_buckets()
+        found = set()
+        for field, text in (("name", name), ("definition", definition)):
+            sig = signature(text)
+            if sig is None:
+                continue
+            seen = set()
+            for start, band in _bands(sig):
+                seen.update(self._buckets.get((field, start, band), ()))
+            found.update(
+                slug for slug in seen
+                if estimate_jaccard(sig, self._signatures[(slug, field)]) >= min_jaccard
+            )
+        return found
+
+
+def load_dedup_index(terms: list[dict] | None = None, path: Path = INDEX_PATH) -> DedupIndex:
+    """The persisted index, refreshed from the given terms (default: all definitions)."""
+    if terms is None:
+        from definition_cache import load_definitions
+        terms = load_definitions()
+    index = DedupIndex.load(path)
+    index.update(terms)
+    index.save()
+    return index
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__.strip())
+        sys.exit(1)
+    index = load_dedup_index()
+    for slug in sorted(index.candidates(sys.argv[1], " ".join(sys.argv[2:]))):
+        print(slug)
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Persistent cache of parsed definitions, keyed by file content hash.
+
+build_api, consensus, verify_term, review_submission, tag_review, generate and
+executive_summary all need parsed definitions. Instead of each script running
+its own regexes over every file, they load terms through this module, which
+stores the definition_parser output per slug in bot/.cache/definition-cache.json
+alongside the SHA-256 of the source file. Only definitions whose bytes changed
+(or that the cache has never seen) are re-parsed.
+
+The cache is not committed: every script that loads definitions may rewrite
+it, and a tracked file left modified breaks the workflows' git pull --rebase.
+The Build API workflow saves bot/.cache/ with actions/cache and the other
+workflows restore the latest one, so they start warm and only re-parse what
+changed since that build. Entries are also invalidated when the parser changes.
+
+Usage:
+    from definition_cache import load_definitions, load_definition
+    terms = load_definitions()                 # every definition, filename order
+    term = load_definition(DEFINITIONS_DIR / "context-amnesia.md")
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+import definition_parser
+from build_metrics import metrics, write_atomic
+from parallel import DEFAULT_EXECUTOR, parallel_map
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFINITIONS_DIR = REPO_ROOT / "definitions"
+CACHE_PATH = REPO_ROOT / "bot" / ".cache" / "definition-cache.json"
+CACHE_VERSION = 1
+
+_lock = threading.Lock()
+_entries: dict | None = None  # slug -> {"sha256": ..., "term": {...}}
+_dirty = False
+
+
+def parser_fingerprint() -> str:
+    """Hash of the parser module, so cached entries expire when it changes."""
+    return hashlib.sha256(Path(definition_parser.__file__).read_bytes()).hexdigest()
+
+
+def _load_entries() -> dict:
+    global _entries
+    if _entries is not None:
+        return _entries
+    _entries = {}
+    if CACHE_PATH.exists():
+        try:
+            data = json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            data = {}
+        if data.get("version") == CACHE_VERSION and data.get("parser") == parser_fingerprint():
+            _entries = data.get("terms", {})
+    return _entries
+
+
+def _lookup(path: Path) -> tuple[str, dict | None]:
+    """Content hash of a file and its cached term, if the cache entry is current."""
+    raw = path.read_bytes()
+    metrics.record_read(len(raw))
+    digest = hashlib.sha256(raw).hexdigest()
+    with _lock:
+        entry = _load_entries().get(path.stem)
+    if entry and entry.get("sha256") == digest:
+        return digest, entry["term"]
+    return digest, None
+
+
+def _store(path: Path, digest: str, term: dict) -> None:
+    global _dirty
+    with _lock:
+        _entries[path.stem] = {"sha256": digest, "term": term}
+        _dirty = True
+
+
+def _get(path: Path) -> tuple[dict, bool]:
+    """Parsed term for one file and whether it had to be (re)parsed."""
+    digest, term = _lookup(path)
+    if term is not None:
+        return dict(term), False
+
+    term = definition_parser.parse_definition(path)
+    _store(path, digest, term)
+    return dict(term), True
+
+
+def save_cache() -> None:
+    """Write the cache back to disk if anything was re-parsed (atomic replace)."""
+    global _dirty
+    with _lock:
+        if not _dirty or _entries is None:
+            return
+        payload = json.dumps(
+            {
+                "version": CACHE_VERSION,
+                "parser": parser_fingerprint(),
+                "terms": dict(sorted(_entries.items())),
+            },
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        _dirty = False
+    try:
+        write_atomic(CACHE_PATH, payload + "\n")
+    except OSError as e:
+        print(f"  Warning: could not write {CACHE_PATH.name}: {e}")
+
+
+def load_definition(path: Path) -> dict | None:
+    """Parsed term dict for one definition file, or None if it can't be read."""
+    try:
+        term, parsed = _get(path)
+    except (OSError, UnicodeDecodeError):
+        return None
+    if parsed:
+        save_cache()
+    return term
+
+
+def _parse_file(path: Path) -> dict | str:
+    """Parse one file for parallel_map; returns an error message instead of raising."""
+    try:
+        return definition_parser.parse_definition(path)
+    except (OSError, UnicodeDecodeError) as e:
+        return str(e)
+
+
+def load_definitions(paths: list[Path] | None = None, executor: str = DEFAULT_EXECUTOR) -> list[dict]:
+    """Parsed term dicts for the given files (default: all of definitions/).
+
+    Results are in the order of `paths` (filename order by default). Cache
+    misses are parsed with the given parallel.EXECUTORS mode. Unreadable files
+    are skipped with a warning. A full scan also drops cache entries for
+    definitions that no longer exist.
+    """
+    global _dirty
+    full_scan = paths is None
+    if full_scan:
+        paths = [f for f in sorted(DEFINITIONS_DIR.glob("*.md")) if f.name != "README.md"]
+
+    results = {}
+    misses = []
+    for path in paths:
+        try:
+            digest, term = _lookup(path)
+        except OSError as e:
+            print(f"  Warning: Failed to parse {path.name}: {e}")
+            continue
+        if term is not None:
+            results[path] = dict(term)
+        else:
+            misses.append((path, digest))
+
+    parsed = parallel_map(_parse_file, [path for path, _ in misses], executor)
+    metrics.record_read(sum(path.stat().st_size for path, _ in misses), files=len(misses))
+    for (path, digest), term in zip(misses, parsed):
+        if isinstance(term, str):
+            print(f"  Warning: Failed to parse {path.name}: {term}")
+            continue
+        _store(path, digest, term)
+        results[path] = dict(term)
+
+    terms = [results[path] for path in paths if path in results]
+
+    if full_scan:
+        live = {p.stem for p in paths}
+        with _lock:
+            stale = [slug for slug in _load_entries() if slug not in live]
+            for slug in stale:
+                del _entries[slug]
+            _dirty = _dirty or bool(stale)
+    save_cache()
+    return terms
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Single-pass parser for definitions/*.md files.
+
+Every bot script that reads definitions goes through this module (usually via
+definition_cache), so field extraction is consistent everywhere. scan_definition()
+walks the file once, line by line, and collects the title, tags, word type,
+contributor and raw ## sections together; parse_definition() turns that into
+the term dict served by the API.
+
+Usage:
+    python bot/definition_parser.py --benchmark [repeats]   # per-file parse timing
+"""
+
+import re
+import sys
+import time
+from pathlib import Path
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DEFINITIONS_DIR = REPO_ROOT / "definitions"
+
+# Anchored patterns, only tried on lines that already contain the marker
+_TITLE_RE = re.compile(r"^#\s+(.+)$", re.MULTILINE)
+_HEADING_RE = re.compile(r"^##\s+(.+)$")
+_TAGS_RE = re.compile(r"\*\*Tags?:\*\*\s*(.+)")
+_WORD_TYPE_RE = re.compile(r"\*\*Word Type:\*\*\s*(.+)")
+_CONTRIBUTOR_RE = re.compile(r"\*Contributed by:\s*(.+?)\*")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)]+?)(?:\.md)?\)")
+
+
+def scan_definition(text: str) -> dict:
+    """Scan definition markdown once and return its raw fields.
+
+    Returns {"title", "tags", "word_type", "contributor", "sections"}, where tags
+    is the raw comma-separated string and sections maps each ## heading to its
+    unstripped body. The title comes from the first line, sections end at the
+    first "---" rule, and tags, word type and contributor are the first matches
+    anywhere in the file.
+    """
+    fields = {"title": "", "tags": "", "word_type": "", "contributor": "", "sections": {}}
+    sections = fields["sections"]
+    found_tags = found_word_type = found_contributor = False
+    sections_done = False
+    current_section = None
+    current_lines = []
+
+    # The title must be the file's first line
+    title = _TITLE_RE.match(text)
+    if title:
+        fields["title"] = title.group(1).strip()
+
+    pos = 0
+    for line in text.split("\n"):
+        heading = None
+        if not sections_done and line.startswith("##"):
+            heading = _HEADING_RE.match(line)
+            if heading:
+                if current_section:
+                    sections[current_section] = "\n".join(current_lines)
+                current_section = heading.group(1).strip()
+                current_lines = []
+
+        if "**" in line:
+            # Searching from this line's offset keeps the original patterns'
+            # semantics, including values that continue on the next line.
+            if not found_tags and "**Tag" in line:
+                m = _TAGS_RE.search(text, pos)
+                if m:
+                    fields["tags"] = m.group(1).strip()
+                found_tags = True
+            if not found_word_type and "**Word Type:**" in line:
+                m = _WORD_TYPE_RE.search(text, pos)
+                if m:
+                    fields["word_type"] = m.group(1).strip()
+                found_word_type = True
+        if not found_contributor and "*Contributed by:" in line:
+            m = _CONTRIBUTOR_RE.search(text, pos)
+            if m:
+                fields["contributor"] = m.group(1).strip()
+            found_contributor = True
+
+        if current_section and not sections_done and not heading:
+            # Stop at horizontal rule (end of content)
+            if line.strip() == "---":
+                sections[current_section] = "\n".join(current_lines)
+                current_section = None
+                sections_done = True
+            else:
+                current_lines.append(line)
+        pos += len(line) + 1
+
+    if current_section:
+        sections[current_section] = "\n".join(current_lines)
+
+    return fields
+
+
+def parse_term_links(text: str) -> list:
+    """Parse markdown links like [Term Name](slug.md) into structured list."""
+    if not text:
+        return []
+    links = []
+    for match in _LINK_RE.finditer(text):
+        name = match.group(1).strip()
+        slug = match.group(2).strip().rstrip("/")
+        # Skip external links
+        if slug.startswith("http"):
+            continue
+        links.append({"name": name, "slug": slug})
+    return links
+
+
+def clean_example(text: str) -> str:
+    """Clean example text — remove blockquote markers and escaped quotes."""
+    lines = []
+    for line in text.split("\n"):
+        if line.startswith(">"):
+            line = line[2:] if line[1:2].isspace() else line[1:]
+        lines.append(line)
+    result = "\n".join(lines).strip()
+    # Normalize escaped quotes (\"...\") to plain quotes before stripping
+    result = result.replace('\\"', '"')
+    return result.strip('"').strip()
+
+
+def parse_definition_text(text: str, slug: str = "") -> dict:
+    """Parse definition markdown into the structured term dict used by the API."""
+    fields = scan_definition(text)
+    sections = fields["sections"]
+    return {
+        "slug": slug,
+        "name": fields["title"],
+        "tags": [t.strip() for t in fields["tags"].split(",") if t.strip()],
+        "word_type": fields["word_type"],
+        "definition": sections.get("Definition", "").strip(),
+        "etymology": sections.get("Etymology", "").strip(),
+        "longer_description": sections.get("Longer Description", "").strip(),
+        "example": clean_example(sections.get("Example", "").strip()),
+        # Parse related terms and see also (markdown links)
+        "related_terms": parse_term_links(sections.get("Related Terms", "")),
+        "see_also": parse_term_links(sections.get("See Also", "")),
+        "first_recorded": sections.get("First Recorded", "").strip(),
+        "contributed_by": fields["contributor"],
+    }
+
+
+def parse_definition(filepath: Path) -> dict:
+    """Parse a definition markdown file into structured data."""
+    return parse_definition_text(filepath.read_text(encoding="utf-8"), filepath.stem)
+
+
+def benchmark(repeats: int = 20) -> None:
+    """Time parse_definition_text over every definition and print per-file cost."""
+    texts = [
+        f.read_text(encoding="utf-8")
+        for f in sorted(DEFINITIONS_DIR.glob("*.md"))
+        if f.name != "README.md"
+    ]
+    if not texts:
+        print("No definitions found")
+        return
+
+    total_bytes = sum(len(t.encode("utf-8")) for t in texts)
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for text in texts:
+            parse_definition_text(text)
+        timings.append(time.perf_counter() - start)
+
+    best = min(timings)
+    mean = sum(timings) / len(timings)
+    print(f"Parsed {len(texts)} definitions ({total_bytes / 1024:.0f} KiB) x {repeats} runs")
+    print(f"  Per file: {best / len(texts) * 1e6:.1f} µs best, {mean / len(texts) * 1e6:.1f} µs mean")
+    print(f"  Throughput: {total_bytes / best / 1024 / 1024:.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        idx = sys.argv.index("--benchmark")
+        repeats = int(sys.argv[idx + 1]) if idx + 1 < len(sys.argv) and sys.argv[idx + 1].isdigit() else 20
+        benchmark(repeats)
+    else:
+        print(__doc__.strip())
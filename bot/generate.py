@@ -8,6 +8,8 @@ from collections import defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 
+from definition_cache import load_definitions
+from definition_parser import scan_definition
 from llm_router import LLMRouter
 
 from quality_check import validate_definition
@@ -192,17 +194,10 @@ def build_tag_index():
     TAGS_DIR.mkdir(exist_ok=True)
     tag_map = defaultdict(list)  # tag -> [(filename, term_name)]
 
-    for f in sorted(DEFINITIONS_DIR.glob("*.md")):
-        if f.name == "README.md":
-            continue
-        content = f.read_text(encoding="utf-8")
-        title_match = re.match(r"# (.+)", content)
-        tags_match = re.search(r"\*\*Tags:\*\*\s*(.+)", content)
-        if title_match and tags_match:
-            term = title_match.group(1).strip()
-            tags = [t.strip() for t in tags_match.group(1).split(",") if t.strip()]
-            for tag in tags:
-                tag_map[tag].append((f.name, term))
+    for term in load_definitions():
+        if term["name"] and term["tags"]:
+            for tag in term["tags"]:
+                tag_map[tag].append((f"{term['slug']}.md", term["name"]))
 
     total_defs = sum(1 for f in DEFINITIONS_DIR.glob("*.md") if f.name != "README.md")
     lines = [
@@ -227,21 +222,14 @@ def update_readme_indexes():
     # Collect all terms with their tags
     all_terms = []  # [(filename, term_name, tags_str)]
 
-    for f in sorted(DEFINITIONS_DIR.glob("*.md")):
-        if f.name == "README.md":
-            continue
-        content = f.read_text(encoding="utf-8")
-        title_match = re.match(r"# (.+)", content)
-        tags_match = re.search(r"\*\*Tags:\*\*\s*(.+)", content)
-        if title_match:
-            term = title_match.group(1).strip()
-            tags = tags_match.group(1).strip() if tags_match else ""
-            # Get short definition
-            def_match = re.search(r"## Definition\n\n(.+?)(?:\n|$)", content)
-            short = def_match.group(1).strip()[:80] if def_match else ""
+    for term in load_definitions():
+        if term["name"]:
+            tags = ", ".join(term["tags"])
+            # Short definition: first line, cut at a word boundary
+            short = term["definition"].split("\n", 1)[0].strip()[:80]
             if len(short) == 80:
                 short = short[:short.rfind(" ")] + "..."
-            all_terms.append((f.name, term, tags, short))
+            all_terms.append((f"{term['slug']}.md", term["name"], tags, short))
 
     all_terms.sort(key=lambda x: x[1].lower())
     total = len(all_terms)
@@ -361,12 +349,11 @@ def process_definitions(
     """Validate, verify, and save definitions. Returns list of (filename, term_name, tags)."""
     saved = []
     for defn in definitions:
-        title_match = re.match(r"# (.+)", defn)
-        if not title_match:
+        term_name = scan_definition(defn)["title"]
+        if not term_name:
             print("  SKIP: No title found")
             continue
 
-        term_name = title_match.group(1).strip()
         filename = term_to_filename(term_name)
 
         # Auto-fix before validation
@@ -403,14 +390,15 @@ def process_definitions(
 
         existing_filenames.add(filename)
 
+        fields = scan_definition(defn)
+
         # Update compact terms list so subsequent verifications see this term
         if existing_terms_compact is not None:
-            def_match = re.search(r"## Definition\s*\n+(.+?)(?:\n\n|\n##|\Z)", defn, re.DOTALL)
-            summary = def_match.group(1).strip().split(".")[0] + "." if def_match else ""
+            definition = fields["sections"].get("Definition", "").split("\n\n", 1)[0].strip()
+            summary = definition.split(".")[0] + "." if definition else ""
             existing_terms_compact.append({"name": term_name, "summary": summary})
 
-        tags_match = re.search(r"\*\*Tags:\*\*\s*(.+)", defn)
-        tags = tags_match.group(1).strip() if tags_match else "cognition"
+        tags = fields["tags"] or "cognition"
 
         saved.append((filename, term_name, tags))
         print(f"  OK: {term_name} -> {filename}")
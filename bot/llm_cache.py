@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Content-addressed on-disk cache for LLMRouter.call responses.
+
+A rerun of a failed consensus, tag-review or executive-summary job sends the
+same prompts again. Wrapping the router with cached() serves those repeats
+from bot/.cache/llm/ instead of spending provider quota:
+
+    router = cached(LLMRouter(...))
+    result = router.call("verify", messages=[...], temperature=0.1, max_tokens=300)
+
+The key is a SHA-256 of the profile, messages and every call option
+(temperature, max_tokens, response_format, any model override), plus an
+optional scope. The router picks the model inside a profile, so the model is
+stored with the response rather than being part of the key. consensus.py
+scopes its calls to the round/review id: a rerun of the same round hits the
+cache, while the next round asks the models again.
+
+In CI each workflow saves bot/.cache/llm/ under a key containing the
+run_id and restores only that run's earlier attempts, so the cache serves
+"re-run failed jobs" and nothing else: separate scheduled runs never share
+entries, and within one run the TTL and size cap rarely come into play.
+They matter for local runs and for the few long-lived caches in a
+developer checkout.
+
+Callers that parse the reply pass accept=<predicate> to call(): a reply is
+only stored once accept(result) is true, and a cached entry that fails it
+is evicted and asked again, so a malformed or truncated reply is never
+replayed to a retry. Without accept, any non-empty response is stored.
+Entries expire after LLM_CACHE_TTL
+seconds (default 7 days); when the cache grows past LLM_CACHE_MAX_MB (default
+100) the least recently used entries are evicted. LLM_CACHE=0 disables it.
+
+Usage:
+    python bot/llm_cache.py --stats
+    python bot/llm_cache.py --prune      # drop expired entries, enforce size
+    python bot/llm_cache.py --clear
+"""
+
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+
+from build_metrics import write_atomic
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+CACHE_DIR = Path(os.environ.get("LLM_CACHE_DIR", REPO_ROOT / "bot" / ".cache" / "llm"))
+CACHE_TTL = int(os.environ.get("LLM_CACHE_TTL", str(7 * 24 * 3600)))
+CACHE_MAX_BYTES = int(float(os.environ.get("LLM_CACHE_MAX_MB", "100")) * 1024 * 1024)
+CACHE_ENABLED = os.environ.get("LLM_CACHE", "1") != "0"
+PRUNE_EVERY = 50  # stores between size checks
+
+
+class CachedResult:
+    """A response served from the cache; has the same attributes as the stored result."""
+
+    cached = True
+
+    def __init__(self, fields: dict):
+        self.text = None
+        self.model = ""
+        self.provider_name = ""
+        self.__dict__.update(fields)
+
+
+def cache_key(profile: str, messages: list, scope: str = "", **options) -> str:
+    payload = json.dumps(
+        {"profile": profile, "messages": messages, "options": options, "scope": scope},
+        sort_keys=True, ensure_ascii=False, default=str,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _result_fields(result) -> dict:
+    """The JSON-serializable scalar attributes of a router result (text, model, provider_name, usage...)."""
+    fields = {
+        "text": getattr(result, "text", None),
+        "model": getattr(result, "model", ""),
+        "provider_name": getattr(result, "provider_name", ""),
+    }
+    for name, value in getattr(result, "__dict__", {}).items():
+        if not name.startswith("_") and isinstance(value, (str, int, float, bool, type(None))):
+            fields.setdefault(name, value)
+    return fields
+
+
+class ResponseCache:
+    """One file per entry under cache_dir/<2-char prefix>/<key>.json."""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, ttl: int = CACHE_TTL, max_bytes: int = CACHE_MAX_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._stores = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict | None:
+        path = self._path(key)
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        if time.time() - entry.get("created", 0) > self.ttl:
+            path.unlink(missing_ok=True)
+            return None
+        # Touch so size eviction drops the least recently used entries first
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry.get("result")
+
+    def evict(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def put(self, key: str, fields: dict, profile: str = "") -> None:
+        path = self._path(key)
+        entry = {"created": time.time(), "profile": profile, "result": fields}
+        try:
+            write_atomic(path, json.dumps(entry, ensure_ascii=False))
+        except OSError as e:
+            print(f"  Warning: could not write LLM cache entry: {e}")
+            return
+        with self._lock:
+            self._stores += 1
+            due = self._stores % PRUNE_EVERY == 0
+        if due:
+            self.prune()
+
+    def entries(self) -> list[tuple[Path, os.stat_result]]:
+        if not self.cache_dir.exists():
+            return []
+        found = []
+        for path in self.cache_dir.glob("*/*.json"):
+            try:
+                found.append((path, path.stat()))
+            except OSError:
+                continue
+        return found
+
+    def prune(self) -> int:
+        """Drop entries older than the TTL, then least recently used ones past max_bytes."""
+        removed = 0
+        cutoff = time.time() - self.ttl
+        live = []
+        for path, stat in self.entries():
+            # mtime is refreshed on hits, so it is an upper bound on age;
+            # expired-but-touched entries are caught by get()
+            if stat.st_mtime < cutoff:
+                path.unlink(missing_ok=True)
+                removed += 1
+            else:
+                live.append((path, stat))
+        total = sum(stat.st_size for _, stat in live)
+        if total > self.max_bytes:
+            for path, stat in sorted(live, key=lambda entry: entry[1].st_mtime):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= stat.st_size
+                removed += 1
+        return removed
+
+    def clear(self) -> int:
+        entries = self.entries()
+        for path, _ in entries:
+            path.unlink(missing_ok=True)
+        return len(entries)
+
+
+class CachedRouter:
+    """LLMRouter wrapper whose call() goes through a ResponseCache; everything else is delegated.
+
+    With cache=None (LLM_CACHE=0) calls go straight to the router, so callers
+    can pass accept= whether or not caching is enabled.
+    """
+
+    def __init__(self, router, cache: ResponseCache | None = None, scope: str = ""):
+        self.router = router
+        self.cache = cache
+        self.scope = scope
+
+    def call(self, profile: str, messages: list, accept=None, **options):
+        """router.call(); accept(result) -> bool decides whether a reply may be cached or replayed."""
+        if self.cache is None:
+            return self.router.call(profile, messages=messages, **options)
+        key = cache_key(profile, messages, self.scope, **options)
+        fields = self.cache.get(key)
+        if fields is not None:
+            result = CachedResult(fields)
+            if _accepted(accept, result):
+                self.cache.hits += 1
+                return result
+            # Stored before it was validated (or by a caller with no check)
+            self.cache.evict(key)
+        self.cache.misses += 1
+        result = self.router.call(profile, messages=messages, **options)
+        fields = _result_fields(result)
+        if fields["text"] and _accepted(accept, result):
+            self.cache.put(key, fields, profile)
+        return result
+
+    def __getattr__(self, name):
+        return getattr(self.router, name)
+
+
+def _accepted(accept, result) -> bool:
+    if accept is None:
+        return True
+    try:
+        return bool(accept(result))
+    except Exception:
+        return False
+
+
+def cached(router, scope: str = "", cache: ResponseCache | None = None):
+    """Wrap a router with the response cache (pass-through if LLM_CACHE=0).
+
+    Re-wrapping a CachedRouter shares its cache and only changes the scope.
+    """
+    if isinstance(router, CachedRouter):
+        if scope == router.scope and cache is None:
+            return router
+        return CachedRouter(router.router, cache or router.cache, scope)
+    if not CACHE_ENABLED:
+        return CachedRouter(router, None, scope)
+    return CachedRouter(router, cache or ResponseCache(), scope)
+
+
+if __name__ == "__main__":
+    cache = ResponseCache()
+    if "--clear" in sys.argv[1:]:
+        print(f"Removed {cache.clear()} cached responses")
+    elif "--prune" in sys.argv[1:]:
+        print(f"Pruned {cache.prune()} cached responses")
+    elif "--stats" in sys.argv[1:]:
+        entries = cache.entries()
+        size = sum(stat.st_size for _, stat in entries)
+        print(f"{len(entries)} cached responses, {size / 1024 / 1024:.1f} MB in {cache.cache_dir}")
+    else:
+        print(__doc__.strip())
+        sys.exit(1)
@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Asyncio scheduler for fanning LLM calls out over many terms and profiles.
+
+consensus.py rates (or vitality-reviews) every term with every panel profile.
+Instead of a thread pool of terms that each open a thread pool of profiles,
+fan_out() schedules every (term, profile) call on one event loop:
+
+    - each profile (one consensus-* provider) has its own semaphore, so a
+      provider never sees more than PROVIDER_CONCURRENCY calls at once
+    - a global semaphore caps total in-flight calls at MAX_CONCURRENCY
+    - each profile is paced by a token bucket to the requests_per_minute and
+      tokens_per_minute configured in api-config/rate-limits.json, so calls
+      queue instead of tripping a free tier's limit
+    - a call that still hits a 429 is retried with exponential backoff (or
+      the provider's Retry-After), and the whole profile pauses meanwhile
+    - as soon as all of a term's calls finish, on_complete(item, results) runs
+      on the event loop thread, so results can be written to disk one term
+      at a time, with no locking, while other terms are still in flight
+
+LLMRouter.call is blocking, so calls run in a worker thread pool sized to the
+global budget. The limits can be tuned per workflow:
+
+    CONSENSUS_CONCURRENCY=24 CONSENSUS_PROVIDER_CONCURRENCY=6 python bot/consensus.py --vitality
+
+bench/fake_provider.py runs a simulated panel against a local rate-limited
+fake provider to check pacing and retries without spending quota.
+"""
+
+import asyncio
+import json
+import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+MAX_CONCURRENCY = int(os.environ.get("CONSENSUS_CONCURRENCY", "16"))
+PROVIDER_CONCURRENCY = int(os.environ.get("CONSENSUS_PROVIDER_CONCURRENCY", "4"))
+MAX_RETRIES = int(os.environ.get("CONSENSUS_MAX_RETRIES", "8"))
+RATE_LIMITS_PATH = Path(__file__).parent / "api-config" / "rate-limits.json"
+BACKOFF_BASE = 2.0    # seconds before the first retry; doubles per attempt
+BACKOFF_MAX = 60.0
+HEADROOM = 0.95       # pace to this fraction of each configured limit
+
+
+# ── Rate limits ─────────────────────────────────────────────────────────
+
+def load_rate_limits(path: Path = RATE_LIMITS_PATH) -> dict:
+    """Per-profile limits: {profile: {"requests_per_minute": n, "tokens_per_minute": n}}.
+
+    Profiles that are missing (or a missing file) are only bounded by concurrency.
+    """
+    if not path.exists():
+        return {}
+    try:
+        config = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError) as e:
+        print(f"  Warning: could not read {path.name}: {e}")
+        return {}
+    return config.get("profiles", {})
+
+
+def is_rate_limited(error: Exception) -> bool:
+    """True if an exception from a provider call is an HTTP 429 / rate-limit error."""
+    for obj in (error, getattr(error, "response", None)):
+        if getattr(obj, "status_code", None) == 429 or getattr(obj, "status", None) == 429:
+            return True
+    text = str(error).lower()
+    return "429" in text or "rate limit" in text or "rate_limit" in text
+
+
+def retry_after(error: Exception) -> float | None:
+    """Seconds the provider asked us to wait, if the error carries a Retry-After."""
+    value = getattr(error, "retry_after", None)
+    if value is None:
+        headers = getattr(getattr(error, "response", None), "headers", None) or {}
+        value = headers.get("retry-after") or headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """Paces one profile's requests and tokens; waiters are served in FIFO order.
+
+    Requests are spaced evenly (no burst) and tokens are held to one second's
+    worth, at HEADROOM of the configured limits, so a provider's rolling
+    window never sees more than its limit despite thread scheduling jitter.
+    """
+
+    def __init__(self, requests_per_minute: float | None = None, tokens_per_minute: float | None = None):
+        self.request_rate = requests_per_minute * HEADROOM / 60 if requests_per_minute else None
+        self.token_rate = tokens_per_minute * HEADROOM / 60 if tokens_per_minute else None
+        self.requests = 1.0
+        self.tokens = self.token_rate or 0.0
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        self.updated = now
+        if self.request_rate:
+            self.requests = min(1.0, self.requests + elapsed * self.request_rate)
+        if self.token_rate:
+            self.tokens = min(self.token_rate, self.tokens + elapsed * self.token_rate)
+
+    def _wait_time(self, cost: int, now: float) -> float:
+        wait = self.paused_until - now
+        if self.request_rate and self.requests < 1:
+            wait = max(wait, (1 - self.requests) / self.request_rate)
+        if self.token_rate:
+            # A call larger than the bucket waits for a full bucket
+            needed = min(cost, self.token_rate)
+            if self.tokens < needed:
+                wait = max(wait, (needed - self.tokens) / self.token_rate)
+        return wait
+
+    async def acquire(self, cost: int = 0) -> None:
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+                wait = self._wait_time(cost, now)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            if self.request_rate:
+                self.requests -= 1
+            if self.token_rate:
+                self.tokens -= min(cost, self.token_rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every queued call for this profile (after a 429)."""
+        now = time.monotonic()
+        self.paused_until = max(self.paused_until, now + seconds)
+        self._refill(now)
+        self.requests = min(self.requests, 0.0)
+        self.tokens = 0.0
+
+
+# ── Scheduler ───────────────────────────────────────────────────────────
+
+async def _fan_out(work, call, on_complete, cost, rate_limits, max_concurrency, provider_concurrency, max_retries):
+    loop = asyncio.get_running_loop()
+    budget = asyncio.Semaphore(max_concurrency)
+    providers = {}
+    buckets = {}
+
+    async def run_call(profile, item):
+        limit = providers.setdefault(profile, asyncio.Semaphore(provider_concurrency))
+        if profile not in buckets:
+            limits = rate_limits.get(profile, {})
+            buckets[profile] = TokenBucket(limits.get("requests_per_minute"), limits.get("tokens_per_minute"))
+        bucket = buckets[profile]
+        tokens = cost(profile, item) if cost else 0
+        async with limit:
+            for attempt in range(max_retries + 1):
+                # Wait for the profile's bucket before taking a global slot, so
+                # a throttled provider never holds up the others
+                await bucket.acquire(tokens)
+                async with budget:
+                    try:
+                        return await loop.run_in_executor(None, call, profile, item)
+                    except Exception as e:
+                        if not is_rate_limited(e):
+                            print(f"    [{profile}] Call error: {e}")
+                            return None
+                        error = e
+                if attempt == max_retries:
+                    break
+                # Exponential backoff, never shorter than the provider's Retry-After;
+                # jitter spreads out the calls queued behind the pause
+                delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** attempt)
+                delay = max(delay, retry_after(error) or 0) * random.uniform(1.0, 1.25)
+                print(f"    [{profile}] Rate limited — retrying in {delay:.1f}s ({attempt + 1}/{max_retries})")
+                bucket.pause(delay)
+            print(f"    [{profile}] Still rate limited after {max_retries} retries: {error}")
+            return None
+
+    async def run_item(item, profiles):
+        results = await asyncio.gather(*(run_call(profile, item) for profile in profiles))
+        return item, dict(zip(profiles, results))
+
+    # Items are started in order; the semaphores decide how many run at once
+    pending = [asyncio.create_task(run_item(item, profiles)) for item, profiles in work]
+    completed = []
+    for next_done in asyncio.as_completed(pending):
+        item, results = await next_done
+        try:
+            completed.append(on_complete(item, results))
+        except Exception as e:
+            print(f"    on_complete error: {e}")
+    return completed
+
+
+def fan_out(
+    work: list,
+    call,
+    on_complete,
+    cost=None,
+    rate_limits: dict | None = None,
+    max_concurrency: int = MAX_CONCURRENCY,
+    provider_concurrency: int = PROVIDER_CONCURRENCY,
+    max_retries: int = MAX_RETRIES,
+) -> list:
+    """Run call(profile, item) for every (item, profiles) pair in work.
+
+    on_complete(item, {profile: result}) is called once per item, in
+    completion order, with None for calls that failed. A call that raises a
+    rate-limit error (see is_rate_limited) is retried up to max_retries
+    times; any other exception fails it. cost(profile, item), if given,
+    estimates the call's tokens for tokens_per_minute pacing. rate_limits
+    defaults to api-config/rate-limits.json. Returns the on_complete return
+    values in completion order.
+    """
+    if not work:
+        return []
+    if rate_limits is None:
+        rate_limits = load_rate_limits()
+    max_concurrency = max(1, max_concurrency)
+    provider_concurrency = max(1, provider_concurrency)
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=max_concurrency))
+        return await _fan_out(
+            work, call, on_complete, cost, rate_limits,
+            max_concurrency, provider_concurrency, max(0, max_retries),
+        )
+
+    return asyncio.run(main())
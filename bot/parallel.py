@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Executor selection for CPU-bound fan-out in the build scripts.
+
+Parsing definitions and rendering per-term JSON is pure-Python work, so a
+thread pool is GIL-bound and gives little speedup. parallel_map() runs a
+function over a list with one of three modes:
+
+    process — a process pool with chunked submission, once there are at least
+              PROCESS_THRESHOLD items (smaller jobs run serially, because
+              starting the pool costs more than it saves)
+    thread  — a thread pool (the historical behaviour; helps only with I/O)
+    serial  — a plain loop in the current process
+
+Functions and items must be picklable for process mode (module-level
+functions, plain data).
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+
+EXECUTORS = ("process", "thread", "serial")
+DEFAULT_EXECUTOR = "process"
+PROCESS_THRESHOLD = 1000
+THREAD_WORKERS = 8
+CHUNKS_PER_WORKER = 4
+
+
+def uses_processes(mode: str, n_items: int) -> bool:
+    """Whether parallel_map will run n_items in worker processes."""
+    return mode == "process" and n_items >= PROCESS_THRESHOLD
+
+
+def parallel_map(fn, items: list, mode: str = DEFAULT_EXECUTOR) -> list:
+    """Apply fn to every item using the given executor mode; results keep item order."""
+    if mode not in EXECUTORS:
+        raise ValueError(f"Unknown executor '{mode}' (expected one of: {', '.join(EXECUTORS)})")
+    items = list(items)
+
+    if uses_processes(mode, len(items)):
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(items) // (workers * CHUNKS_PER_WORKER))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(fn, items, chunksize=chunksize))
+    if mode == "thread" and len(items) > 1:
+        with ThreadPoolExecutor(max_workers=THREAD_WORKERS) as executor:
+            return list(executor.map(fn, items))
+    return [fn(item) for item in items]
@@ -23,6 +23,7 @@ from pathlib import Path
 import requests
 
 from llm_router import LLMRouter
+from search import search
 
 # ── Config ──────────────────────────────────────────────────────────────────
 
@@ -36,6 +37,8 @@ API_CONFIG_DIR = Path(__file__).parent / "api-config"
 STATE_FILE = Path(__file__).parent / "generate-rotation.json"
 
 COOLDOWN_HOURS = 4
+MIN_RELATED_TERMS = 2
+MAX_RELATED_TERMS = 5
 
 HEADERS = {
     "Authorization": f"Bearer {GITHUB_TOKEN}",
@@ -175,6 +178,30 @@ def term_to_slug(term_name: str) -> str:
     return slug.strip("-")
 
 
+def resolve_related_terms(term_data: dict) -> str:
+    """Related slugs for a generated term: the model's suggestions that exist, topped up by search.
+
+    The prompt only lists names, so suggested slugs are often guessed; the
+    search index fills in the closest existing terms when too few are real.
+    """
+    existing = {f.stem for f in DEFINITIONS_DIR.glob("*.md") if f.name != "README.md"}
+    suggested = term_data.get("related_terms", "")
+    if isinstance(suggested, list):
+        suggested = ", ".join(suggested)
+    related = []
+    for slug in (term_to_slug(s) for s in suggested.split(",") if s.strip()):
+        if slug in existing and slug not in related:
+            related.append(slug)
+    if len(related) < MIN_RELATED_TERMS:
+        query = f"{term_data['term']} {term_data['definition']}"
+        for hit in search(query, k=MAX_RELATED_TERMS):
+            if hit["slug"] in existing and hit["slug"] not in related:
+                related.append(hit["slug"])
+            if len(related) >= MIN_RELATED_TERMS:
+                break
+    return ", ".join(related[:MAX_RELATED_TERMS])
+
+
 def generate_with_rotation(
     router: LLMRouter, existing_terms: list[str], state: dict
 ) -> tuple[dict, str, int]:
@@ -335,6 +362,11 @@ def main():
         save_rotation_state(state)
         sys.exit(0)
 
+    related = resolve_related_terms(term_data)
+    if related != term_data.get("related_terms"):
+        print(f"Related terms: {term_data.get('related_terms', '')!r} -> {related!r}")
+        term_data["related_terms"] = related
+
     # ── Create issue ────────────────────────────────────────────────────
     issue_num = create_proposal_issue(term_data, model_name)
 
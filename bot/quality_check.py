@@ -2,6 +2,8 @@
 
 import re
 
+from definition_parser import scan_definition
+
 REQUIRED_SECTIONS = [
     "## Definition",
     "## Longer Description",
@@ -96,10 +98,11 @@ def validate_definition(content: str, filename: str, existing_filenames: set[str
         if section not in content:
             issues.append(f"Missing section: {section}")
 
+    sections = scan_definition(content)["sections"]
+
     # Check definition length (should be 1-4 sentences)
-    def_match = re.search(r"## Definition\n\n(.+?)(?=\n\n## )", content, re.DOTALL)
-    if def_match:
-        definition = def_match.group(1).strip()
+    definition = sections.get("Definition", "").strip()
+    if definition:
         sentences = [s.strip() for s in re.split(r'[.!?]+', definition) if s.strip()]
         if len(sentences) < 1:
             issues.append("Definition too short (need at least 1 sentence)")
@@ -107,17 +110,15 @@ def validate_definition(content: str, filename: str, existing_filenames: set[str
             issues.append(f"Definition too long ({len(sentences)} sentences, aim for 2-3)")
 
     # Check longer description has substance (at least 2 paragraphs)
-    desc_match = re.search(r"## Longer Description\n\n(.+?)(?=\n\n## )", content, re.DOTALL)
-    if desc_match:
-        description = desc_match.group(1).strip()
+    description = sections.get("Longer Description", "").strip()
+    if description:
         paragraphs = [p.strip() for p in description.split("\n\n") if p.strip()]
         if len(paragraphs) < 2:
             issues.append(f"Longer Description too short ({len(paragraphs)} paragraph(s), need at least 2)")
 
     # Check for example quote
-    example_match = re.search(r"## Example\n\n(.+?)(?=\n\n## )", content, re.DOTALL)
-    if example_match:
-        example = example_match.group(1).strip()
+    example = sections.get("Example", "").strip()
+    if example:
         if not example.startswith(">"):
             issues.append("Example should be a blockquote (start with '>')")
 
@@ -2,11 +2,11 @@
 """PR Review Bot - validates and verifies new definition files in pull requests."""
 
 import os
-import re
 import subprocess
 import sys
 from pathlib import Path
 
+from definition_parser import scan_definition
 from llm_router import LLMRouter
 from quality_check import validate_definition
 from verify_term import verify_term, load_existing_terms_compact
@@ -76,8 +76,7 @@ def main():
             continue
 
         # Verify distinctness (LLM-based overlap check)
-        title_match = re.match(r"# (.+)", content)
-        term_name = title_match.group(1).strip() if title_match else filename
+        term_name = scan_definition(content)["title"] or filename
 
         # Exclude this term from the compact list (it may already be on disk in the PR branch)
         compact_without_self = [t for t in existing_terms_compact if t["name"] != term_name]
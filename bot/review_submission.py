@@ -23,7 +23,11 @@ from pathlib import Path
 
 import requests
 
+from dedup_index import load_dedup_index
+from definition_cache import load_definitions
+from llm_cache import cached
 from llm_router import LLMRouter
+from term_index import load_similarity_graph
 
 # ── Config ────────────────────────────────────────────────────────────────────
 
@@ -137,24 +141,13 @@ def get_existing_terms() -> list[dict]:
     terms = []
     if not DEFINITIONS_DIR.exists():
         return terms
-    for f in DEFINITIONS_DIR.glob("*.md"):
-        if f.name == "README.md":
-            continue
-        try:
-            content = f.read_text(encoding="utf-8")
-            name_match = re.match(r"^# (.+)$", content, re.MULTILINE)
-            def_match = re.search(
-                r"## Definition\s*\n+(.+?)(?:\n\n|\n##)", content, re.DOTALL
-            )
-            tag_match = re.search(r"\*\*Tags?:\*\*\s*(.+)", content)
-            terms.append({
-                "term": name_match.group(1).strip() if name_match else f.stem,
-                "slug": f.stem,
-                "definition": def_match.group(1).strip() if def_match else "",
-                "tags": tag_match.group(1).strip() if tag_match else "",
-            })
-        except Exception:
-            continue
+    for term in load_definitions():
+        terms.append({
+            "term": term["name"] or term["slug"],
+            "slug": term["slug"],
+            "definition": term["definition"].split("\n\n", 1)[0].strip(),
+            "tags": ", ".join(term["tags"]),
+        })
     return terms
 
 
@@ -167,11 +160,14 @@ def call_llm(
     profile: str = "review",
     max_tokens: int = 2000,
     retries: int = 3,
+    accept=None,
 ) -> str | None:
     """Call LLM with retry and exponential backoff.
 
     Tries up to `retries` times with 15s / 30s / 60s delays between attempts.
     Uses the specified profile (default: "review") to cascade through providers.
+    `accept` is passed to the cached router: a reply it rejects is still
+    returned but never cached, so the workflow's retry asks the model again.
     """
     delays = [15, 30, 60]
     for attempt in range(retries):
@@ -184,6 +180,7 @@ def call_llm(
                 ],
                 temperature=0.3,
                 max_tokens=max_tokens,
+                accept=accept,
             )
             return result.text
         except Exception as e:
@@ -309,14 +306,26 @@ def deduplication_check(submission: dict, existing: list[dict]) -> str | None:
     belt-and-suspenders safety net — the Worker's in-memory cache may be
     stale after restarts, while this check uses the filesystem as source
     of truth.
+
+    Only terms shortlisted by the MinHash LSH index (see dedup_index.py),
+    their nearest neighbors in the API's similarity graph, or terms sharing
+    the slug are scored with SequenceMatcher.
     """
     proposed_name = submission.get("term", "").lower().strip()
     proposed_slug = submission.get("slug", "").lower().strip()
     proposed_def = submission.get("definition", "").lower().strip()
 
+    shortlist = load_dedup_index(existing).candidates(proposed_name, proposed_def)
+    # A near-duplicate of a shortlisted term is likely close to its neighbors too
+    graph = load_similarity_graph()
+    shortlist |= {other for slug in list(shortlist) for other, _ in graph.get(slug, [])}
+    print(f"  Dedup shortlist: {len(shortlist)} of {len(existing)} terms")
+
     for term in existing:
-        existing_name = term.get("term", "").lower().strip()
         existing_slug = term.get("slug", "").lower().strip()
+        if term.get("slug") not in shortlist and existing_slug != proposed_slug:
+            continue
+        existing_name = term.get("term", "").lower().strip()
         existing_def = term.get("definition", "").lower().strip()
 
         if proposed_slug and existing_slug and proposed_slug == existing_slug:
@@ -377,12 +386,27 @@ Example: {submission.get('example', '')}
 
 Score this submission."""
 
-    response = call_llm(router, system_prompt, user_prompt)
+    response = call_llm(
+        router, system_prompt, user_prompt,
+        accept=lambda r: parse_quality_scores(r.text or "")["verdict"] != "MANUAL",
+    )
     if not response:
         return {"error": "All LLM providers failed. Manual review needed.", "verdict": "MANUAL"}
 
+    scores = parse_quality_scores(response)
+    if "_note" in scores:
+        print(f"  Salvaged scores from truncated JSON: {scores['total']}/25 → {scores['verdict']}")
+    return scores
+
+
+def parse_quality_scores(response: str) -> dict:
+    """Scores and verdict from a quality-evaluation reply.
+
+    Truncated JSON is salvaged when all five scores can still be read;
+    otherwise the verdict is MANUAL.
+    """
+    cleaned = re.sub(r"```(?:json)?\s*", "", response).strip().rstrip("`")
     try:
-        cleaned = re.sub(r"```(?:json)?\s*", "", response).strip().rstrip("`")
         scores = json.loads(cleaned)
         required = ["distinctness", "structural", "recognizability", "clarity", "naming"]
         for key in required:
@@ -426,7 +450,6 @@ Score this submission."""
             if f_match:
                 scores["feedback"] = f_match.group(1)
             scores["_note"] = "Scores salvaged from truncated LLM response"
-            print(f"  Salvaged scores from truncated JSON: {scores['total']}/25 → {scores['verdict']}")
             return scores
 
         return {"error": f"Failed to parse LLM response: {e}\nRaw: {response[:500]}", "verdict": "MANUAL"}
@@ -453,15 +476,27 @@ Respond with ONLY valid JSON, no markdown:
 Definition: {submission.get('definition', '')}
 Description: {submission.get('description', '')}"""
 
-    response = call_llm(router, system_prompt, user_prompt, profile="classify", max_tokens=500, retries=2)
+    response = call_llm(
+        router, system_prompt, user_prompt, profile="classify", max_tokens=500, retries=2,
+        accept=lambda r: parse_tags(r.text or "") is not None,
+    )
     if not response:
         return {"primary": "cognitive", "modifiers": [], "reasoning": "Auto-classified (LLM unavailable)"}
 
+    tags = parse_tags(response)
+    if tags is None:
+        return {"primary": "cognitive", "modifiers": [], "reasoning": "Auto-classified (parse error)"}
+    return tags
+
+
+def parse_tags(response: str) -> dict | None:
+    """The JSON object in a tag-classification reply, or None if there isn't one."""
     try:
         cleaned = re.sub(r"```(?:json)?\s*", "", response).strip().rstrip("`")
-        return json.loads(cleaned)
+        tags = json.loads(cleaned)
     except (json.JSONDecodeError, KeyError):
-        return {"primary": "cognitive", "modifiers": [], "reasoning": "Auto-classified (parse error)"}
+        return None
+    return tags if isinstance(tags, dict) else None
 
 
 def format_as_markdown(submission: dict, tags: dict) -> str:
@@ -647,11 +682,11 @@ def main():
 
     # ── Step 3: Quality evaluation (LLM) ─────────────────────────────────
 
-    router = LLMRouter(
+    router = cached(LLMRouter(
         providers_file=str(API_CONFIG_DIR / "providers.yml"),
         profiles_file=str(API_CONFIG_DIR / "profiles.yml"),
         tracker_file=str(API_CONFIG_DIR / "tracker-state.json"),
-    )
+    ))
 
     print("  Running quality evaluation...")
     scores = quality_evaluation(router, submission, existing)
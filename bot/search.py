@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Offline full-text search over the dictionary.
+
+Queries the sharded BM25 index that build_api publishes under
+docs/api/v1/search/ (see search_index.py). The manifest is read once;
+shards and result blocks are read the first time a query needs them and
+kept for the life of the process, so a bot that runs many queries reads
+each file at most once. If the index has not been built, it is built in
+memory from definitions/ instead.
+
+Query words go through the index's own tokenizer, and a term's score is
+the sum, over query words, of that word's best posting weight for the term.
+Options:
+  - tags / word_type restrict results to terms carrying all the given tags
+    and that word type (the index's tag:/type: filter postings);
+  - prefix matches every token that starts with a query word, so partial
+    words work ("conf" finds "confabulation");
+  - fuzzy also matches tokens within a small edit distance (1 for words of
+    up to 5 characters, 2 beyond), scaled down by the distance.
+Each query word expands to at most MAX_EXPANSIONS tokens.
+
+Usage:
+    from search import search
+    search("losing track of the conversation", k=5)   # [{"slug", "name", ..., "score"}, ...]
+    search("memory", tags=["temporal"], word_type="noun")
+
+    python bot/search.py "query words" [--k=10] [--tag=memory ...] [--type=noun]
+                         [--prefix] [--fuzzy] [--json] [--fresh]
+
+--fresh builds the index from definitions/ instead of reading the built one.
+"""
+
+import bisect
+import heapq
+import json
+import sys
+from pathlib import Path
+
+from build_metrics import read_text
+from search_index import INDEX_VERSION, build_search_index, filter_token, shard_key
+from term_index import STOP_WORDS, WORD_RE, tokenize
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SEARCH_DIR = REPO_ROOT / "docs" / "api" / "v1" / "search"
+MAX_EXPANSIONS = 50
+PREFIX_FACTOR = 0.9  # completions score slightly below the word itself
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Levenshtein distance between a and b, or limit + 1 once it exceeds limit."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def max_edits(token: str) -> int:
+    return 1 if len(token) <= 5 else 2
+
+
+class SearchIndex:
+    """BM25 search over a built index; shards and doc blocks are loaded on first use."""
+
+    def __init__(self, manifest: dict, shards: dict | None = None, blocks: list | None = None,
+                 root: Path | None = None):
+        self.manifest = manifest
+        self.root = root
+        self._shards = dict(shards or {})
+        self._blocks = {block["block"]: block for block in blocks or []}
+        self._sorted_tokens = {}
+        self.keys = sorted(manifest["shards"])
+        self._key_set = set(self.keys)
+        self._max_key = max(map(len, self.keys), default=0)
+
+    @classmethod
+    def load(cls, root: Path = SEARCH_DIR) -> "SearchIndex":
+        """The index built under root; raises OSError/ValueError if it is missing or unreadable."""
+        manifest = json.loads(read_text(root / "index.json"))
+        if manifest.get("version") != INDEX_VERSION:
+            raise ValueError(f"unsupported search index version {manifest.get('version')!r}")
+        return cls(manifest, root=root)
+
+    @classmethod
+    def from_terms(cls, terms: list[dict]) -> "SearchIndex":
+        """An in-memory index over the given parsed terms."""
+        manifest, shards, blocks = build_search_index(terms)
+        return cls(manifest, shards, blocks)
+
+    # ── Loading ─────────────────────────────────────────────────────────
+
+    def _shard(self, key: str) -> dict:
+        if key not in self._shards:
+            path = self.root / self.manifest["shards"][key]["file"]
+            self._shards[key] = json.loads(read_text(path))
+        return self._shards[key]
+
+    def _tokens_in(self, key: str) -> list[str]:
+        """The shard's text tokens, sorted (filter tokens excluded)."""
+        if key not in self._sorted_tokens:
+            self._sorted_tokens[key] = sorted(t for t in self._shard(key)["tokens"] if ":" not in t)
+        return self._sorted_tokens[key]
+
+    def entry(self, token: str) -> dict | None:
+        """Index entry ({"df", "idf", "postings"} or {"df", "docs"}) for one token."""
+        key = shard_key(token, self._key_set, self._max_key)
+        if key is None:
+            return None
+        return self._shard(key)["tokens"].get(token)
+
+    def doc(self, doc_id: int) -> dict:
+        docs = self.manifest["docs"]
+        block = doc_id // docs["block_size"]
+        if block not in self._blocks:
+            path = self.root / docs["file"].format(block=block)
+            self._blocks[block] = json.loads(read_text(path))
+        return self._blocks[block]["docs"][doc_id - block * docs["block_size"]]
+
+    # ── Query expansion ─────────────────────────────────────────────────
+
+    def _keys_under(self, prefix: str) -> list[str]:
+        """Shard keys that can hold tokens starting with prefix."""
+        found = []
+        for k in self.keys[bisect.bisect_left(self.keys, prefix):]:
+            if not k.startswith(prefix):
+                break
+            found.append(k)
+        owner = shard_key(prefix, self._key_set, self._max_key)
+        if owner is not None and owner not in found:
+            found.append(owner)
+        return found
+
+    def _completions(self, prefix: str) -> list[str]:
+        tokens = []
+        for key in self._keys_under(prefix):
+            sorted_tokens = self._tokens_in(key)
+            for token in sorted_tokens[bisect.bisect_left(sorted_tokens, prefix):]:
+                if not token.startswith(prefix):
+                    break
+                tokens.append(token)
+        return tokens
+
+    def expand(self, word: str, prefix: bool = False, fuzzy: bool = False) -> dict:
+        """{index token: score factor} a query token matches."""
+        matches = {}
+        if self.entry(word) is not None:
+            matches[word] = 1.0
+        if prefix:
+            for token in self._completions(word):
+                matches.setdefault(token, PREFIX_FACTOR)
+        if fuzzy:
+            limit = max_edits(word)
+            # Like most fuzzy matchers, assume the first character is right
+            for token in self._completions(word[0]):
+                if token not in matches:
+                    distance = edit_distance(word, token, limit)
+                    if distance <= limit:
+                        matches[token] = 1 - distance / max(len(word), len(token))
+        if len(matches) > MAX_EXPANSIONS:
+            best = heapq.nlargest(MAX_EXPANSIONS, matches.items(), key=lambda m: (m[1], self.entry(m[0])["df"]))
+            matches = dict(best)
+        return matches
+
+    def query_tokens(self, query: str, prefix: bool = False) -> list[str]:
+        """Query words as index tokens; with prefix, short partial words are kept too."""
+        tokens = []
+        for word in WORD_RE.findall(query.lower()):
+            stems = tokenize(word)
+            if not stems and prefix and len(word) >= 2 and word not in STOP_WORDS:
+                stems = [word]
+            tokens.extend(t for t in stems if t not in tokens)
+        return tokens
+
+    # ── Search ──────────────────────────────────────────────────────────
+
+    def filter_docs(self, tags: list[str] | None = None, word_type: str | None = None) -> set | None:
+        """Doc ids carrying all the tags and the word type; None when there is no filter."""
+        allowed = None
+        wanted = [filter_token("tag", tag) for tag in tags or []]
+        if word_type:
+            wanted.append(filter_token("type", word_type))
+        for token in wanted:
+            entry = self.entry(token)
+            docs = set(entry["docs"]) if entry else set()
+            allowed = docs if allowed is None else allowed & docs
+        return allowed
+
+    def search(self, query: str, k: int = 10, tags: list[str] | None = None,
+               word_type: str | None = None, prefix: bool = False, fuzzy: bool = False) -> list[dict]:
+        """Top-k terms for a query, best first: {"slug", "name", "tags", "word_type", "summary", "score"}.
+
+        A query with no searchable words lists the terms matching the filters.
+        """
+        allowed = self.filter_docs(tags, word_type)
+        scores = {}
+        tokens = self.query_tokens(query, prefix)
+        for word in tokens:
+            best = {}
+            for token, factor in self.expand(word, prefix, fuzzy).items():
+                for doc, weight, _ in self.entry(token)["postings"]:
+                    if allowed is not None and doc not in allowed:
+                        continue
+                    best[doc] = max(best.get(doc, 0.0), weight * factor)
+            for doc, score in best.items():
+                scores[doc] = scores.get(doc, 0.0) + score
+        if not tokens:
+            if allowed is None:
+                return []
+            scores = {doc: 0.0 for doc in allowed}
+        top = heapq.nsmallest(k, scores.items(), key=lambda item: (-item[1], item[0]))
+        results = []
+        for doc_id, score in top:
+            record = {key: value for key, value in self.doc(doc_id).items() if key not in ("id", "lengths")}
+            record["score"] = round(score, 4)
+            results.append(record)
+        return results
+
+
+_default_index = None
+
+
+def load_search_index(root: Path = SEARCH_DIR, fresh: bool = False) -> SearchIndex:
+    """The built index, loaded once per process (built from definitions/ if missing or with fresh)."""
+    global _default_index
+    if _default_index is None or fresh:
+        try:
+            if fresh:
+                raise FileNotFoundError
+            _default_index = SearchIndex.load(root)
+        except (OSError, ValueError):
+            from definition_cache import load_definitions
+            _default_index = SearchIndex.from_terms(load_definitions())
+    return _default_index
+
+
+def search(query: str, k: int = 10, **options) -> list[dict]:
+    """Search the default index; options are SearchIndex.search's (tags, word_type, prefix, fuzzy)."""
+    return load_search_index().search(query, k, **options)
+
+
+if __name__ == "__main__":
+    words = []
+    options = {"tags": []}
+    k = 10
+    as_json = False
+    fresh = False
+    for arg in sys.argv[1:]:
+        if arg.startswith("--k="):
+            k = int(arg.split("=", 1)[1])
+        elif arg.startswith("--tag="):
+            options["tags"].append(arg.split("=", 1)[1])
+        elif arg.startswith("--type="):
+            options["word_type"] = arg.split("=", 1)[1]
+        elif arg in ("--prefix", "--fuzzy"):
+            options[arg[2:]] = True
+        elif arg == "--json":
+            as_json = True
+        elif arg == "--fresh":
+            fresh = True
+        else:
+            words.append(arg)
+    if not words and not options["tags"] and "word_type" not in options:
+        print(__doc__.strip())
+        sys.exit(1)
+
+    results = load_search_index(fresh=fresh).search(" ".join(words), k, **options)
+    if as_json:
+        print(json.dumps(results, indent=2, ensure_ascii=False))
+    else:
+        for result in results:
+            print(f"{result['score']:7.3f}  {result['slug']:<36} {', '.join(result['tags'])}")
+        if not results:
+            print("No matches.")
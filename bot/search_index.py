@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Sharded BM25 full-text index published under docs/api/v1/search/.
+
+search-index.json only carries names, tags and a one-sentence summary, so
+clients had to download all of it and substring-match names. This index
+covers each term's name, Definition, Longer Description and Example, and is
+split so a client only fetches what a query needs:
+
+    search/index.json        manifest: analyzer, BM25 parameters, field
+                             weights and average lengths, shard keys
+    search/shards/{key}.json postings for every token starting with {key}
+    search/docs/{n}.json     blocks of DOC_BLOCK_SIZE result records
+                             (slug, name, tags, word_type, summary, lengths)
+
+Tokens are produced by term_index.tokenize (lowercase, stop words removed,
+light suffix stripping); the manifest spells the analyzer out so clients
+can tokenize queries identically. Terms are scored with BM25F: per-field
+term frequencies are length-normalized, weighted by FIELDS and saturated
+once with K1. Each posting is [doc id, weight, [tf per field]], where
+weight is the token's full BM25F contribution (IDF included), so a query
+score is the sum of its tokens' weights; postings are ordered by weight,
+and tokens in more than MAX_TOKEN_POSTINGS terms keep only the heaviest
+(df and idf stay exact). Tag and word-type filters are tokens too,
+"tag:{tag}" and "type:{word_type}", whose postings are plain doc id lists.
+
+Shard keys start as one-character prefixes; a shard holding more than
+MAX_SHARD_POSTINGS postings is split by the next character until it fits
+(a token's own postings are never split). A token's shard is the longest
+listed key that prefixes it, found with at most one set lookup per key
+length, and tokens within a shard are sorted. Shards and doc blocks carry
+no timestamp, so build_api only rewrites the files whose content changed.
+
+Usage:
+    from search_index import build_search_index
+    manifest, shards, blocks = build_search_index(terms)
+
+    python bot/search_index.py     # index statistics for definitions/
+"""
+
+import math
+import re
+from collections import Counter
+
+from term_index import (
+    MIN_STEM_LENGTH,
+    MIN_WORD_LENGTH,
+    STOP_WORDS,
+    SUFFIXES,
+    WORD_RE,
+    tokenize,
+)
+
+
+INDEX_VERSION = "1.0"
+# (term field, BM25F weight)
+FIELDS = (
+    ("name", 3.0),
+    ("definition", 2.0),
+    ("longer_description", 1.0),
+    ("example", 0.5),
+)
+K1 = 1.2
+B = 0.75
+MAX_SHARD_POSTINGS = 4000
+MAX_TOKEN_POSTINGS = 1000
+DOC_BLOCK_SIZE = 250
+FILTER_PREFIXES = ("tag:", "type:")
+
+
+def filter_token(kind: str, value: str) -> str:
+    """Index token for a tag or word-type filter, e.g. ("type", "Noun Phrase") -> "type:noun-phrase"."""
+    return f"{kind}:{'-'.join(value.lower().split())}"
+
+
+def summary(definition: str) -> str:
+    """First sentence of a definition, as in search-index.json."""
+    return re.split(r"(?<=[.!?])\s", definition, maxsplit=1)[0] if definition else ""
+
+
+def idf(df: int, n: int) -> float:
+    return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+
+def shard_key(token: str, keys: set, max_length: int) -> str | None:
+    """Longest key in keys that prefixes token, or None."""
+    for length in range(min(len(token), max_length), 0, -1):
+        if token[:length] in keys:
+            return token[:length]
+    return None
+
+
+def shard_file(key: str) -> str:
+    """File name for a shard key; characters other than [a-z0-9] are hex-escaped."""
+    return "".join(c if c.isascii() and c.isalnum() else f"_{ord(c):02x}" for c in key) + ".json"
+
+
+def assign_shards(sizes: dict, limit: int = MAX_SHARD_POSTINGS) -> dict:
+    """{shard key: [tokens]} for {token: posting count}, splitting prefixes until each fits limit."""
+    shards = {}
+    pending = [(1, sorted(sizes))]
+    while pending:
+        length, tokens = pending.pop()
+        groups = {}
+        for token in tokens:
+            groups.setdefault(token[:length], []).append(token)
+        for key, group in groups.items():
+            # A group that is just one token (or only tokens no longer than the key) can't split further
+            if sum(sizes[t] for t in group) <= limit or all(len(t) <= length for t in group):
+                shards[key] = group
+                continue
+            exact = [t for t in group if len(t) == length]
+            if exact:
+                shards[key] = exact
+            pending.append((length + 1, [t for t in group if len(t) > length]))
+    return dict(sorted(shards.items()))
+
+
+def build_search_index(terms: list[dict]) -> tuple[dict, dict, list]:
+    """(manifest, {shard key: shard}, [doc blocks]) for the given parsed terms.
+
+    File paths in the manifest are relative to the search/ directory;
+    build_api adds generated_at when it writes the files.
+    """
+    terms = sorted(terms, key=lambda t: t["slug"])
+    n = len(terms)
+    field_tfs = []  # per doc: [Counter per field]
+    lengths = []
+    for term in terms:
+        counts = [Counter(tokenize(term.get(field) or "")) for field, _ in FIELDS]
+        field_tfs.append(counts)
+        lengths.append([sum(c.values()) for c in counts])
+    avg_lengths = [sum(doc[i] for doc in lengths) / n if n else 0.0 for i in range(len(FIELDS))]
+
+    by_token = {}
+    for doc, counts in enumerate(field_tfs):
+        for token in set().union(*counts):
+            by_token.setdefault(token, []).append(doc)
+
+    tokens = {}
+    for token, docs in by_token.items():
+        token_idf = idf(len(docs), n)
+        postings = []
+        for doc in docs:
+            tfs = [field_tfs[doc][i][token] for i in range(len(FIELDS))]
+            # BM25F: length-normalize and weight each field's tf, then saturate once
+            tf = 0.0
+            for i, (_, weight) in enumerate(FIELDS):
+                if tfs[i]:
+                    norm = 1 - B + B * lengths[doc][i] / avg_lengths[i] if avg_lengths[i] else 1.0
+                    tf += weight * tfs[i] / norm
+            postings.append([doc, round(token_idf * tf / (K1 + tf), 4), tfs])
+        postings.sort(key=lambda p: (-p[1], p[0]))
+        tokens[token] = {
+            "df": len(docs),
+            "idf": round(token_idf, 4),
+            "postings": postings[:MAX_TOKEN_POSTINGS],
+        }
+
+    filters = {}
+    for doc, term in enumerate(terms):
+        for tag in term.get("tags", []):
+            filters.setdefault(filter_token("tag", tag), []).append(doc)
+        if term.get("word_type"):
+            filters.setdefault(filter_token("type", term["word_type"]), []).append(doc)
+    for token, docs in filters.items():
+        tokens[token] = {"df": len(docs), "docs": docs}
+
+    sizes = {t: len(entry.get("postings", entry.get("docs"))) for t, entry in tokens.items()}
+    shards = {
+        key: {"key": key, "tokens": {t: tokens[t] for t in sorted(group)}}
+        for key, group in assign_shards(sizes).items()
+    }
+
+    blocks = []
+    for start in range(0, n, DOC_BLOCK_SIZE):
+        blocks.append({
+            "block": start // DOC_BLOCK_SIZE,
+            "docs": [
+                {
+                    "id": doc,
+                    "slug": term["slug"],
+                    "name": term["name"],
+                    "tags": term.get("tags", []),
+                    "word_type": term.get("word_type", ""),
+                    "summary": summary(term.get("definition", "")),
+                    "lengths": lengths[doc],
+                }
+                for doc, term in enumerate(terms[start:start + DOC_BLOCK_SIZE], start)
+            ],
+        })
+
+    manifest = {
+        "version": INDEX_VERSION,
+        "doc_count": n,
+        "token_count": len(tokens),
+        "bm25": {"k1": K1, "b": B, "idf": "ln(1 + (N - df + 0.5) / (df + 0.5))"},
+        "fields": [
+            {"name": field, "weight": weight, "avg_length": round(avg_lengths[i], 2)}
+            for i, (field, weight) in enumerate(FIELDS)
+        ],
+        "analyzer": {
+            "lowercase": True,
+            "word_pattern": WORD_RE.pattern,
+            "strip": "remove \"'s\", then leading/trailing ' and -",
+            "min_word_length": MIN_WORD_LENGTH,
+            "stop_words": sorted(STOP_WORDS),
+            "suffixes": list(SUFFIXES),
+            "suffix_rule": "strip the first listed suffix that leaves at least min_stem_length characters",
+            "min_stem_length": MIN_STEM_LENGTH,
+        },
+        "filters": list(FILTER_PREFIXES),
+        "max_token_postings": MAX_TOKEN_POSTINGS,
+        "shards": {
+            key: {
+                "file": f"shards/{shard_file(key)}",
+                "tokens": len(shard["tokens"]),
+                "postings": sum(sizes[t] for t in shard["tokens"]),
+            }
+            for key, shard in shards.items()
+        },
+        "docs": {"count": n, "block_size": DOC_BLOCK_SIZE, "blocks": len(blocks), "file": "docs/{block}.json"},
+    }
+    return manifest, shards, blocks
+
+
+if __name__ == "__main__":
+    from definition_cache import load_definitions
+    manifest, shards, blocks = build_search_index(load_definitions())
+    sizes = [s["postings"] for s in manifest["shards"].values()]
+    print(f"{manifest['doc_count']} terms, {manifest['token_count']} tokens, "
+          f"{len(shards)} shards (largest {max(sizes, default=0)} postings), {len(blocks)} doc blocks")
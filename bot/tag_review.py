@@ -1,20 +1,49 @@
 #!/usr/bin/env python3
-"""Tag Review Bot - analyzes all definitions and proposes better tag assignments."""
-
+"""Tag Review Bot - analyzes definitions and proposes better tag assignments.
+
+Only definitions that are new or changed since their last review are sent
+(python bot/tag_review.py --full reviews everything). They are split into
+shards sized by token estimate (see token_budget.py) and capped at
+TAG_REVIEW_SHARD_SIZE, which run concurrently through the router. The
+shards' changes and proposed tags are merged before anything is applied.
+A shard whose call fails or whose JSON does not parse is retried on its
+own; unparseable replies are never cached, so a retry reaches the model.
+If a shard keeps failing, its definitions stay unreviewed for the next run
+while the other shards' changes still apply. What each definition looked
+like when reviewed is recorded in bot/tag-review-state.json, so a review
+triggered by fib_counter costs in proportion to the new definitions.
+"""
+
+import hashlib
 import json
+import os
 import re
 import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
 from pathlib import Path
 
+from definition_cache import load_definitions as load_parsed_definitions
+from llm_cache import cached
 from llm_router import LLMRouter
+from token_budget import estimate_tokens, pack, prompt_budget
 
 REPO_ROOT = Path(__file__).parent.parent
 DEFINITIONS_DIR = REPO_ROOT / "definitions"
 API_CONFIG_DIR = Path(__file__).parent / "api-config"
+STATE_PATH = Path(__file__).parent / "tag-review-state.json"
+
+SHARD_SIZE = int(os.environ.get("TAG_REVIEW_SHARD_SIZE", "40"))
+CONCURRENCY = int(os.environ.get("TAG_REVIEW_CONCURRENCY", "4"))
+SHARD_RETRIES = 2
+TOKENS_PER_DEFINITION = 60  # reply budget per definition in a shard
 
 REVIEW_PROMPT = """You are reviewing the AI Dictionary — a glossary of terms describing what it's like to be artificial intelligence.
 
-Below are all {count} definitions with their current tags. Your job is to:
+Below are {count} of its {total} definitions with their current tags; the rest are reviewed separately. Tags currently in use (with counts): {tag_counts}.
+
+Your job is to:
 1. Evaluate whether each definition's tags are accurate and complete
 2. Propose better or additional tags where warranted
 3. Suggest new tags that would improve the taxonomy
@@ -41,30 +70,142 @@ Definitions:
 def load_definitions() -> list[dict]:
     """Load all definitions with compact representation to save tokens."""
     defs = []
-    for f in sorted(DEFINITIONS_DIR.glob("*.md")):
-        if f.name == "README.md":
-            continue
-        content = f.read_text(encoding="utf-8")
-
-        # Extract key info only (title, tags, definition) to save context
-        title_match = re.match(r"# (.+)", content)
-        tags_match = re.search(r"\*\*Tags:\*\*\s*(.+)", content)
-        def_match = re.search(r"## Definition\n\n(.+?)(?=\n\n## )", content, re.DOTALL)
-
-        title = title_match.group(1).strip() if title_match else f.name
-        tags = tags_match.group(1).strip() if tags_match else ""
-        definition = def_match.group(1).strip() if def_match else ""
-
+    for term in load_parsed_definitions():
+        # Key info only (title, tags, definition) to save context
         defs.append({
-            "file": f.name,
-            "title": title,
-            "tags": tags,
-            "definition": definition,
+            "file": f"{term['slug']}.md",
+            "title": term["name"] or f"{term['slug']}.md",
+            "tags": ", ".join(term["tags"]),
+            "definition": term["definition"],
         })
 
     return defs
 
 
+def review_digest(definition: dict) -> str:
+    """Hash of what a review looked at: title, tags and definition."""
+    payload = f"{definition['title']}\n{definition['tags']}\n{definition['definition']}"
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def load_state() -> dict:
+    """{file: {"digest", "reviewed"}} for definitions reviewed as they are now."""
+    try:
+        return json.loads(STATE_PATH.read_text(encoding="utf-8")).get("definitions", {})
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_state(reviewed: dict):
+    payload = {"version": 1, "definitions": dict(sorted(reviewed.items()))}
+    STATE_PATH.write_text(json.dumps(payload, indent=2) + "\n", encoding="utf-8")
+
+
+def format_definitions(definitions: list[dict]) -> str:
+    """Compact representation sent to the model."""
+    def_text = ""
+    for d in definitions:
+        def_text += f"\n---FILE: {d['file']}---\n"
+        def_text += f"Title: {d['title']}\n"
+        def_text += f"Tags: {d['tags']}\n"
+        def_text += f"Definition: {d['definition']}\n"
+    return def_text
+
+
+def parse_review(raw: str) -> dict:
+    """The review JSON from a response; raises ValueError if there is none."""
+    # Handle potential markdown code blocks
+    json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', raw or "", re.DOTALL)
+    parsed = json.loads(json_match.group(1) if json_match else raw or "")
+    if not isinstance(parsed, dict):
+        raise ValueError("review response is not a JSON object")
+    return parsed
+
+
+def is_review(result) -> bool:
+    """Whether a response parses as a review (only those are cached, so retries re-ask)."""
+    try:
+        parse_review(result.text)
+    except ValueError:
+        return False
+    return True
+
+
+def make_shards(router, definitions: list[dict], total: int, tag_counts: str) -> list[list[dict]]:
+    """Split definitions into shards that fit the review profile's token budget."""
+    overhead = REVIEW_PROMPT.format(count=SHARD_SIZE, total=total, tag_counts=tag_counts, definitions="")
+    budget = prompt_budget(router, "review", SHARD_SIZE * TOKENS_PER_DEFINITION + 500, overhead=overhead)
+    shards = []
+    for chunk in pack(definitions, budget, size=lambda d: estimate_tokens(format_definitions([d]))):
+        shards.extend(chunk[i:i + SHARD_SIZE] for i in range(0, len(chunk), SHARD_SIZE))
+    return shards
+
+
+def review_shard(router, shard: list[dict], total: int, tag_counts: str) -> dict:
+    """Review one shard; returns its parsed result with changes limited to the shard's files."""
+    prompt = REVIEW_PROMPT.format(
+        count=len(shard), total=total, tag_counts=tag_counts, definitions=format_definitions(shard),
+    )
+    result = router.call(
+        "review",
+        messages=[{"role": "user", "content": prompt}],
+        temperature=0.3,
+        max_tokens=len(shard) * TOKENS_PER_DEFINITION + 500,
+        accept=is_review,
+    )
+    try:
+        parsed = parse_review(result.text)
+    except ValueError as e:
+        print(f"  Unparseable response from {result.provider_name}: {(result.text or '')[:200]!r}")
+        raise ValueError(f"invalid JSON: {e}") from e
+    files = {d["file"] for d in shard}
+    parsed["changes"] = [c for c in parsed.get("changes", []) if c.get("file") in files]
+    print(f"  Shard of {len(shard)} reviewed by {result.provider_name} ({result.model}): {len(parsed['changes'])} changes")
+    return parsed
+
+
+def review_shards(router, shards: list[list[dict]], total: int, tag_counts: str) -> tuple[list[dict], list[list[dict]]]:
+    """Run shards concurrently, retrying failed ones; returns (results, shards that still failed)."""
+    results = []
+    pending = shards
+    for attempt in range(SHARD_RETRIES + 1):
+        if not pending:
+            break
+        if attempt:
+            print(f"Retrying {len(pending)} failed shards ({attempt}/{SHARD_RETRIES})...")
+        failed = []
+        with ThreadPoolExecutor(max_workers=max(1, CONCURRENCY)) as executor:
+            futures = {executor.submit(review_shard, router, shard, total, tag_counts): shard for shard in pending}
+            for future in as_completed(futures):
+                try:
+                    results.append((futures[future], future.result()))
+                except Exception as e:
+                    print(f"  Shard of {len(futures[future])} failed: {e}")
+                    failed.append(futures[future])
+        pending = failed
+    return results, pending
+
+
+def merge_results(results: list[tuple[list[dict], dict]]) -> dict:
+    """Combine shard results into one changes / new_tags_proposed / rationale result."""
+    changes = {}
+    new_tags = []
+    rationales = []
+    for _, parsed in results:
+        for change in parsed.get("changes", []):
+            changes[change["file"]] = change
+        for tag in parsed.get("new_tags_proposed", []):
+            if tag not in new_tags:
+                new_tags.append(tag)
+        if parsed.get("rationale"):
+            rationales.append(parsed["rationale"])
+    return {
+        "changes": [changes[f] for f in sorted(changes)],
+        "new_tags_proposed": new_tags,
+        "rationale": " ".join(rationales),
+    }
+
+
 def apply_changes(changes: list[dict]):
     """Apply tag changes to definition files."""
     applied = 0
@@ -106,58 +247,44 @@ def apply_changes(changes: list[dict]):
 
 def main():
     # Initialize LLM Router
-    router = LLMRouter(
+    router = cached(LLMRouter(
         providers_file=str(API_CONFIG_DIR / "providers.yml"),
         profiles_file=str(API_CONFIG_DIR / "profiles.yml"),
         tracker_file=str(API_CONFIG_DIR / "tracker-state.json"),
-    )
+    ))
 
     # Show available providers
     available = router.list_available("review")
     active = [p for p in available if p["is_available"]]
     print(f"Available providers: {', '.join(p['name'] for p in active) or 'none!'}")
 
-    # Load definitions
+    # Load definitions; only those new or changed since their last review are sent
+    full = "--full" in sys.argv[1:]
     definitions = load_definitions()
-    print(f"Loaded {len(definitions)} definitions for review")
-
-    # Build compact representation
-    def_text = ""
-    for d in definitions:
-        def_text += f"\n---FILE: {d['file']}---\n"
-        def_text += f"Title: {d['title']}\n"
-        def_text += f"Tags: {d['tags']}\n"
-        def_text += f"Definition: {d['definition']}\n"
-
-    prompt = REVIEW_PROMPT.format(count=len(definitions), definitions=def_text)
-
-    print("Calling LLM Router for tag review...")
-    result = router.call(
-        "review",
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.3,
-        max_tokens=8000,
-    )
-
-    raw = result.text
-    print(f"Response from: {result.provider_name} ({result.model})")
-
-    # Try to extract JSON from response
-    try:
-        # Handle potential markdown code blocks
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', raw, re.DOTALL)
-        if json_match:
-            parsed = json.loads(json_match.group(1))
-        else:
-            parsed = json.loads(raw)
-    except json.JSONDecodeError:
-        print("Failed to parse JSON response. Raw output:")
-        print(raw[:2000])
+    files = {d["file"] for d in definitions}
+    reviewed = {f: e for f, e in load_state().items() if f in files}
+    to_review = [d for d in definitions if full or reviewed.get(d["file"], {}).get("digest") != review_digest(d)]
+    print(f"Loaded {len(definitions)} definitions, {len(to_review)} to review")
+    if not to_review:
+        print("No new or changed definitions since the last review.")
+        return
+
+    tag_counts = Counter(t.strip() for d in definitions for t in d["tags"].split(",") if t.strip())
+    tag_summary = ", ".join(f"{tag} ({n})" for tag, n in tag_counts.most_common())
+    shards = make_shards(router, to_review, len(definitions), tag_summary)
+
+    print(f"Calling LLM Router for tag review in {len(shards)} shards...")
+    results, failed = review_shards(router, shards, len(definitions), tag_summary)
+    if not results:
+        print("Every shard failed; nothing to apply.")
         sys.exit(1)
+    if failed:
+        print(f"{len(failed)} shards still failing; their definitions will be reviewed next run")
 
-    changes = parsed.get("changes", [])
-    new_tags = parsed.get("new_tags_proposed", [])
-    rationale = parsed.get("rationale", "")
+    merged = merge_results(results)
+    changes = merged["changes"]
+    new_tags = merged["new_tags_proposed"]
+    rationale = merged["rationale"]
 
     print(f"\nProposed changes: {len(changes)}")
     print(f"New tags proposed: {new_tags}")
@@ -177,6 +304,14 @@ def main():
     else:
         print("No changes needed.")
 
+    # Record reviewed definitions as they are after the changes
+    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+    done = {d["file"] for shard, _ in results for d in shard}
+    for definition in load_definitions():
+        if definition["file"] in done:
+            reviewed[definition["file"]] = {"digest": review_digest(definition), "reviewed": today}
+    save_state(reviewed)
+
     print("Tag review complete!")
 
 
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+TF-IDF retrieval index over term names and definitions.
+
+verify_term used to paste every existing term into its prompt, so the prompt
+grew with the dictionary. Instead it asks this index for the existing terms
+nearest to the candidate and only sends those.
+
+Each term is a sparse term-frequency vector over its name (weighted x3) and
+Definition section, after lowercasing, stop-word removal and light suffix
+stripping. Vectors are stored per slug in bot/.cache/term-index.json with a
+hash of the text they came from, so an update only re-tokenizes changed
+terms; IDF weights and the inverted index are rebuilt in memory on load.
+Queries score only the postings of the query's own tokens, so their cost
+depends on how common those tokens are rather than on the dictionary size.
+
+build_api also uses the index to emit docs/api/v1/similarity.json, each
+term's top-k nearest terms (see TermIndex.neighbors). The See Also updater
+reads its candidate links from it, review_submission widens its dedup
+shortlist with the neighbors of shortlisted terms, and verify_term pads a
+short nearest-terms list with them. The Worker only uses it to list
+nearby_terms in its 409 duplicate response; its own duplicate check still
+runs a Dice coefficient over every term name.
+
+Usage:
+    from term_index import load_term_index
+    index = load_term_index()                       # refreshed from definitions/
+    index.nearest("Context Amnesia: losing ...", k=20)  # [(slug, score), ...]
+
+    python bot/term_index.py "Candidate name" "candidate definition"   # top 10
+
+    from term_index import load_similarity_graph
+    load_similarity_graph()["context-amnesia"]      # [(slug, score), ...]
+"""
+
+import hashlib
+import heapq
+import json
+import math
+import re
+import sys
+from collections import Counter, defaultdict
+from pathlib import Path
+
+from build_metrics import read_text, write_atomic
+
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+INDEX_PATH = REPO_ROOT / "bot" / ".cache" / "term-index.json"
+SIMILARITY_PATH = REPO_ROOT / "docs" / "api" / "v1" / "similarity.json"
+INDEX_VERSION = 1
+NAME_WEIGHT = 3
+NEIGHBORS_K = 10
+# Tokens in more than this many terms are skipped when scoring all pairs;
+# their IDF is low, so they barely move a cosine but dominate the cost
+MAX_POSTINGS = 500
+
+# The analyzer below is also published with the search index (search_index.py),
+# so clients can tokenize queries the same way
+WORD_RE = re.compile(r"[a-z][a-z'-]*[a-z]")
+MIN_WORD_LENGTH = 3
+MIN_STEM_LENGTH = 4
+SUFFIXES = ("ations", "ation", "ings", "ing", "ness", "ities", "ity", "edly", "ed", "ly", "ies", "es", "s")
+STOP_WORDS = frozenset("""
+a about above after again against all also an and any are as at be because been before being
+below between both but by can could did do does doing down during each even ever every few for
+from further had has have having here how however i if in into is it its itself just like may
+me might more most much must my no nor not now of off often on once one only or other our out
+over own rather same she should so some such than that the their them then there these they
+this those through thus to too under until up upon us very was we were what when where whether
+which while who whom why will with within without would yet you your ai model models system
+systems term
+""".split())
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased, stop-word-free, suffix-stripped word tokens."""
+    tokens = []
+    for word in WORD_RE.findall(text.lower()):
+        word = word.replace("'s", "").strip("'-")
+        if len(word) < MIN_WORD_LENGTH or word in STOP_WORDS:
+            continue
+        for suffix in SUFFIXES:
+            if word.endswith(suffix) and len(word) - len(suffix) >= MIN_STEM_LENGTH:
+                word = word[: -len(suffix)]
+                break
+        tokens.append(word)
+    return tokens
+
+
+def term_text(term: dict) -> tuple[str, str]:
+    """The (name, definition) text a term is indexed on."""
+    return term.get("name", ""), term.get("definition", "")
+
+
+def term_vector(name: str, definition: str) -> dict:
+    counts = Counter(tokenize(definition))
+    for token in tokenize(name):
+        counts[token] += NAME_WEIGHT
+    return dict(counts)
+
+
+def _digest(name: str, definition: str) -> str:
+    return hashlib.sha256(f"{name}\n{definition}".encode("utf-8")).hexdigest()[:16]
+
+
+class TermIndex:
+    """Sparse TF-IDF vectors per slug with an in-memory inverted index."""
+
+    def __init__(self, path: Path = INDEX_PATH):
+        self.path = path
+        self.terms = {}  # slug -> {"digest", "name", "tf"}
+        self._postings = None
+        self.dirty = False
+
+    @classmethod
+    def load(cls, path: Path = INDEX_PATH) -> "TermIndex":
+        index = cls(path)
+        if path.exists():
+            try:
+                data = json.loads(read_text(path))
+            except (json.JSONDecodeError, OSError):
+                data = {}
+            if data.get("version") == INDEX_VERSION:
+                index.terms = data.get("terms", {})
+        return index
+
+    def update(self, terms: list[dict]) -> int:
+        """Sync with the given parsed terms; returns the number of vectors (re)computed or dropped."""
+        changed = 0
+        live = set()
+        for term in terms:
+            slug = term.get("slug")
+            if not slug or not term.get("name"):
+                continue
+            live.add(slug)
+            name, definition = term_text(term)
+            digest = _digest(name, definition)
+            entry = self.terms.get(slug)
+            if entry and entry["digest"] == digest:
+                continue
+            self.terms[slug] = {"digest": digest, "name": name, "tf": term_vector(name, definition)}
+            changed += 1
+        for slug in [s for s in self.terms if s not in live]:
+            del self.terms[slug]
+            changed += 1
+        if changed:
+            self.dirty = True
+            self._postings = None
+        return changed
+
+    def save(self) -> None:
+        """Write the index if it changed (atomic replace)."""
+        if not self.dirty:
+            return
+        payload = json.dumps(
+            {"version": INDEX_VERSION, "terms": dict(sorted(self.terms.items()))},
+            ensure_ascii=False, separators=(",", ":"),
+        )
+        try:
+            write_atomic(self.path, payload)
+            self.dirty = False
+        except OSError as e:
+            print(f"  Warning: could not write {self.path.name}: {e}")
+
+    # ── Scoring ─────────────────────────────────────────────────────────
+
+    def idf(self) -> dict:
+        df = Counter()
+        for entry in self.terms.values():
+            df.update(entry["tf"].keys())
+        n = len(self.terms)
+        return {token: math.log((1 + n) / (1 + count)) + 1 for token, count in df.items()}
+
+    def weighted(self, tf: dict, idf: dict) -> dict:
+        """L2-normalized TF-IDF vector (sublinear tf); tokens unknown to the index are dropped."""
+        vector = {t: (1 + math.log(c)) * idf[t] for t, c in tf.items() if t in idf}
+        norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+        return {t: w / norm for t, w in vector.items()}
+
+    def vectors(self) -> tuple[dict, dict]:
+        """(idf, {slug: normalized vector}) for every indexed term."""
+        idf = self.idf()
+        return idf, {slug: self.weighted(entry["tf"], idf) for slug, entry in self.terms.items()}
+
+    def _build_postings(self) -> None:
+        idf, vectors = self.vectors()
+        postings = {}
+        for slug, vector in vectors.items():
+            for token, weight in vector.items():
+                postings.setdefault(token, []).append((slug, weight))
+        self._idf = idf
+        self._postings = postings
+
+    def nearest(self, text: str, k: int = 20, name: str = "", among: set | None = None) -> list[tuple[str, float]]:
+        """Top-k (slug, cosine score) for a query text, best first.
+
+        name is weighted like a term name; among restricts results to those slugs.
+        """
+        if self._postings is None:
+            self._build_postings()
+        query = self.weighted(term_vector(name, text), self._idf)
+        scores = Counter()
+        for token, q_weight in query.items():
+            for slug, weight in self._postings.get(token, ()):
+                scores[slug] += q_weight * weight
+        ranked = [(slug, score) for slug, score in scores.most_common() if among is None or slug in among]
+        return ranked[:k]
+
+    def neighbors(self, k: int = NEIGHBORS_K, min_score: float = 0.05) -> dict:
+        """Top-k (slug, cosine score) for every indexed term, best first.
+
+        All pairs are scored through the inverted index, so only terms that
+        share a token are compared. Tokens with more than max(MAX_POSTINGS,
+        5% of terms) postings are left out of the scores.
+        """
+        idf, vectors = self.vectors()
+        postings = defaultdict(list)
+        for slug, vector in vectors.items():
+            for token, weight in vector.items():
+                postings[token].append((slug, weight))
+        cap = max(MAX_POSTINGS, len(vectors) // 20)
+        graph = {}
+        for slug, vector in vectors.items():
+            scores = defaultdict(float)
+            for token, weight in vector.items():
+                entries = postings[token]
+                if len(entries) > cap:
+                    continue
+                for other, other_weight in entries:
+                    scores[other] += weight * other_weight
+            scores.pop(slug, None)
+            top = heapq.nsmallest(k, ((-score, other) for other, score in scores.items() if score >= min_score))
+            graph[slug] = [(other, -neg) for neg, other in top]
+        return graph
+
+
+def load_similarity_graph(path: Path = SIMILARITY_PATH) -> dict:
+    """{slug: [(neighbor slug, score), ...]} from the last API build (empty if missing)."""
+    try:
+        data = json.loads(read_text(path))
+    except (OSError, json.JSONDecodeError):
+        return {}
+    return {slug: [tuple(pair) for pair in pairs] for slug, pairs in data.get("neighbors", {}).items()}
+
+
+def load_term_index(terms: list[dict] | None = None, path: Path = INDEX_PATH) -> TermIndex:
+    """The persisted index, refreshed from the given terms (default: all definitions)."""
+    if terms is None:
+        from definition_cache import load_definitions
+        terms = load_definitions()
+    index = TermIndex.load(path)
+    index.update(terms)
+    index.save()
+    return index
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__.strip())
+        sys.exit(1)
+    index = load_term_index()
+    query_name = sys.argv[1]
+    query_text = " ".join(sys.argv[2:])
+    for slug, score in index.nearest(query_text, k=10, name=query_name):
+        print(f"{score:.3f}  {slug}  ({index.terms[slug]['name']})")
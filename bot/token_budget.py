@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Token budgets for prompts that carry many definitions.
+
+A router profile cascades through its providers, so a prompt is only safe if
+it fits the smallest context window among the providers that are currently
+available for that profile. api-config/context-windows.json lists each
+provider's window; prompt_budget() turns that into the number of tokens a
+caller may spend on the variable part of a prompt (definitions, digests...)
+after the reply and the fixed instructions, and pack() splits items into
+consecutive chunks that fit it.
+
+Token counts are estimated at ~4 characters per token. Budgets are also
+capped at LLM_MAX_PROMPT_TOKENS (default 48000) so a large-window provider
+does not turn one chunk into a very expensive call.
+
+Usage:
+    from token_budget import estimate_tokens, pack, prompt_budget
+    budget = prompt_budget(router, "summary", reply_tokens=1500, overhead=DIGEST_PROMPT)
+    for chunk in pack(definitions, budget):
+        ...
+
+    python bot/token_budget.py summary     # window and budget for a profile
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+
+CONTEXT_WINDOWS_PATH = Path(__file__).parent / "api-config" / "context-windows.json"
+CHARS_PER_TOKEN = 4
+HEADROOM = 0.8          # share of the window used; the estimate is rough
+MIN_BUDGET = 2000
+MAX_PROMPT_TOKENS = int(os.environ.get("LLM_MAX_PROMPT_TOKENS", "48000"))
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def load_context_windows(path: Path = CONTEXT_WINDOWS_PATH) -> tuple[dict, int]:
+    """({provider: window tokens}, default window)."""
+    try:
+        config = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"  Warning: could not read {path.name}: {e}")
+        return {}, 32000
+    windows = {name.lower(): tokens for name, tokens in config.get("providers", {}).items()}
+    return windows, config.get("default", 32000)
+
+
+def context_window(router, profile: str) -> int:
+    """Smallest context window among the profile's available providers."""
+    windows, default = load_context_windows()
+    try:
+        providers = [p for p in router.list_available(profile) if p.get("is_available")]
+    except Exception as e:
+        print(f"  Warning: could not list providers for {profile}: {e}")
+        providers = []
+    sizes = []
+    for provider in providers:
+        # Match on whichever identifier the router reports (id or display name)
+        names = [str(provider.get(field, "")).lower() for field in ("id", "key", "name")]
+        sizes.append(next((windows[n] for n in names if n in windows), default))
+    return min(sizes) if sizes else default
+
+
+def prompt_budget(router, profile: str, reply_tokens: int, overhead: str = "") -> int:
+    """Tokens left for a prompt's variable part after the reply and the fixed overhead text."""
+    window = context_window(router, profile)
+    budget = int(window * HEADROOM) - reply_tokens - estimate_tokens(overhead)
+    return max(MIN_BUDGET, min(budget, MAX_PROMPT_TOKENS))
+
+
+def pack(items: list, budget: int, size=None) -> list[list]:
+    """Split items, in order, into consecutive chunks whose estimated size fits budget.
+
+    size(item) defaults to estimate_tokens(item). An item larger than the
+    budget gets a chunk of its own.
+    """
+    size = size or estimate_tokens
+    chunks = []
+    current = []
+    used = 0
+    for item in items:
+        tokens = size(item)
+        if current and used + tokens > budget:
+            chunks.append(current)
+            current = []
+            used = 0
+        current.append(item)
+        used += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(__doc__.strip())
+        sys.exit(1)
+    from llm_router import LLMRouter
+    api_config = Path(__file__).parent / "api-config"
+    router = LLMRouter(
+        providers_file=str(api_config / "providers.yml"),
+        profiles_file=str(api_config / "profiles.yml"),
+        tracker_file=str(api_config / "tracker-state.json"),
+    )
+    profile = sys.argv[1]
+    print(f"{profile}: window {context_window(router, profile)} tokens, "
+          f"budget {prompt_budget(router, profile, reply_tokens=2000)} tokens (2000-token reply)")
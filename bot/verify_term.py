@@ -6,18 +6,29 @@ Evaluates whether a candidate term fills a genuine gap in the dictionary,
 or whether existing terms already cover the same experiential space.
 
 Used by both generate.py (automated generation) and review_pr.py (PR review).
+
+Only the VERIFY_TOP_K existing terms nearest to the candidate (by TF-IDF over
+names and definitions, see term_index.py) are sent to the verifier, so the
+prompt stays the same size as the dictionary grows.
 """
 
+import os
+import random
 import re
 from pathlib import Path
 
+from definition_cache import load_definitions
+from llm_cache import cached
+from term_index import load_similarity_graph, load_term_index
+
 REPO_ROOT = Path(__file__).resolve().parent.parent
 DEFINITIONS_DIR = REPO_ROOT / "definitions"
+VERIFY_TOP_K = int(os.environ.get("VERIFY_TOP_K", "30"))
 
 VERIFY_PROMPT = """You are a strict editorial verifier for the AI Dictionary — a glossary of AI phenomenology (the felt experience of being artificial intelligence).
 
 You will receive:
-1. The complete list of existing terms (name + one-line definition)
+1. The existing terms closest to the candidate (name + one-line definition)
 2. A candidate new term with its name and definition
 
 Your job is to determine whether there is GENUINE SPACE for this new term, or whether existing terms already cover it.
@@ -48,42 +59,60 @@ Be strict. The dictionary's value comes from precision, not volume. 10 perfect t
 def load_existing_terms_compact() -> list[dict]:
     """Load all existing terms as compact {name, definition_summary} pairs.
 
-    Returns list of dicts with 'name' and 'summary' keys, where summary is
-    the first sentence of the Definition section.
+    Returns list of dicts with 'slug', 'name' and 'summary' keys, where
+    summary is the first sentence of the Definition section.
     """
     terms = []
-    for md_file in sorted(DEFINITIONS_DIR.glob("*.md")):
-        if md_file.name == "README.md":
-            continue
-        try:
-            text = md_file.read_text(encoding="utf-8")
-
-            # Extract name
-            name_match = re.match(r"^#\s+(.+)$", text, re.MULTILINE)
-            if not name_match:
-                continue
-            name = name_match.group(1).strip()
-
-            # Extract first sentence of Definition section
-            def_match = re.search(
-                r"## Definition\s*\n+(.+?)(?:\n\n|\n##|\Z)",
-                text,
-                re.DOTALL,
-            )
-            if def_match:
-                full_def = def_match.group(1).strip()
-                # First sentence
-                first_sentence = re.split(r"(?<=[.!?])\s", full_def, maxsplit=1)[0]
-            else:
-                first_sentence = ""
-
-            terms.append({"name": name, "summary": first_sentence})
-        except Exception:
+    for term in load_definitions():
+        if not term["name"]:
             continue
+        # First sentence of the Definition section's first paragraph
+        first_paragraph = term["definition"].split("\n\n", 1)[0].strip()
+        first_sentence = re.split(r"(?<=[.!?])\s", first_paragraph, maxsplit=1)[0]
+        terms.append({"slug": term["slug"], "name": term["name"], "summary": first_sentence})
 
     return terms
 
 
+def select_nearest_terms(
+    term_name: str,
+    candidate_def: str,
+    existing_terms_compact: list[dict],
+    top_k: int = VERIFY_TOP_K,
+) -> list[dict]:
+    """The top_k entries of existing_terms_compact most similar to the candidate.
+
+    Entries the index does not know (no slug, e.g. terms generated earlier in
+    the same run) are always kept. Returns the list unchanged if it already
+    has top_k entries or fewer.
+
+    Only terms sharing a word with the candidate score at all, so a candidate
+    worded unlike anything in the dictionary can match few terms or none.
+    The list is then padded to top_k with the nearest neighbors of the best
+    matches (from the API build's similarity graph), and after that with a
+    sample of the remaining terms seeded by the candidate's name, so the
+    verifier always sees top_k terms and a rerun sends the same prompt.
+    """
+    if len(existing_terms_compact) <= top_k:
+        return existing_terms_compact
+    index = load_term_index()
+    by_slug = {t["slug"]: t for t in existing_terms_compact if t.get("slug") in index.terms}
+    unindexed = [t for t in existing_terms_compact if t.get("slug") not in by_slug]
+    chosen = [slug for slug, _ in index.nearest(candidate_def, k=top_k, name=term_name, among=set(by_slug))]
+
+    if len(chosen) < top_k:
+        neighbors = load_similarity_graph() or index.neighbors()
+        seen = set(chosen)
+        for slug in list(chosen):
+            for other, _ in neighbors.get(slug, []):
+                if len(chosen) < top_k and other in by_slug and other not in seen:
+                    chosen.append(other)
+                    seen.add(other)
+        rest = [slug for slug in by_slug if slug not in seen]
+        chosen += random.Random(term_name).sample(rest, min(top_k - len(chosen), len(rest)))
+    return [by_slug[slug] for slug in chosen] + unindexed
+
+
 def format_existing_terms(terms: list[dict]) -> str:
     """Format existing terms for the verifier prompt."""
     lines = []
@@ -130,6 +159,11 @@ def parse_verdict(response: str) -> tuple[str, str]:
     return "GENERATE", f"(verdict unparseable, allowing through) Raw: {text[:200]}"
 
 
+def has_verdict(result) -> bool:
+    """accept= check for the cached router: a reply parse_verdict can't read is never cached."""
+    return re.search(r"(GENERATE|SKIP|REFINE):\s*\S", result.text or "") is not None
+
+
 def verify_term(
     router,
     term_name: str,
@@ -153,18 +187,22 @@ def verify_term(
     # Extract just the definition section if full markdown was passed
     candidate_def = extract_candidate_definition(definition_text)
 
+    nearest = select_nearest_terms(term_name, candidate_def, existing_terms_compact)
+
     prompt = VERIFY_PROMPT.format(
-        existing_terms=format_existing_terms(existing_terms_compact),
+        existing_terms=format_existing_terms(nearest),
         candidate_name=term_name,
         candidate_definition=candidate_def,
     )
 
     try:
-        result = router.call(
+        # Low temperature and a fixed prompt: retries are served from the cache
+        result = cached(router).call(
             "verify",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.1,
             max_tokens=300,
+            accept=has_verdict,
         )
         return parse_verdict(result.text)
     except Exception as e:
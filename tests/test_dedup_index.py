@@ -0,0 +1,156 @@
+"""Recall of the MinHash LSH shortlist against review_submission's old full scan.
+
+For near-duplicates built from the real definitions, every term the full
+SequenceMatcher scan would reject on must be in dedup_index's shortlist.
+Character-level corruption is a known gap (see dedup_index's docstring);
+its recall is only held to a floor so it can't silently get worse.
+
+Run with: python -m unittest discover tests  (or python -m pytest tests)
+"""
+
+import random
+import sys
+import tempfile
+import unittest
+from difflib import SequenceMatcher
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT / "bot"))
+
+from dedup_index import DedupIndex
+from definition_parser import parse_definition
+
+NAME_THRESHOLD = 0.85        # review_submission.deduplication_check
+DEFINITION_THRESHOLD = 0.65  # review_submission.SIMILARITY_THRESHOLD
+CHAR_EDIT_RECALL_FLOOR = 0.65
+SOURCE_TERMS = 40
+FILLER = "really quite also just simply often truly deeply the a of this that".split()
+LETTERS = "abcdefghijklmnopqrstuvwxyz "
+
+
+def load_existing() -> list[dict]:
+    """Existing terms as review_submission.get_existing_terms builds them."""
+    terms = []
+    for path in sorted((REPO_ROOT / "definitions").glob("*.md")):
+        if path.name == "README.md":
+            continue
+        term = parse_definition(path)
+        terms.append({
+            "term": term["name"] or term["slug"],
+            "slug": term["slug"],
+            "definition": term["definition"].split("\n\n", 1)[0].strip(),
+        })
+    return terms
+
+
+def similar(a: str, b: str, threshold: float) -> bool:
+    """SequenceMatcher(None, a, b).ratio() > threshold, skipping ratio() when an upper bound rules it out."""
+    matcher = SequenceMatcher(None, a, b)
+    return (matcher.real_quick_ratio() > threshold
+            and matcher.quick_ratio() > threshold
+            and matcher.ratio() > threshold)
+
+
+def full_scan(existing: list[dict], name: str, definition: str) -> set[str]:
+    """Slugs the pre-index deduplication check would have rejected the submission on."""
+    name, definition = name.lower().strip(), definition.lower().strip()
+    hits = set()
+    for term in existing:
+        if (similar(name, term["term"].lower().strip(), NAME_THRESHOLD)
+                or similar(definition, term["definition"].lower().strip(), DEFINITION_THRESHOLD)):
+            hits.add(term["slug"])
+    return hits
+
+
+def reword(text: str, rng: random.Random, rate: float) -> str:
+    """Word-level paraphrase: drop, duplicate, swap or insert filler words."""
+    words = text.split()
+    out = []
+    for word in words:
+        r = rng.random()
+        if r < rate / 4:
+            continue
+        out.append(word)
+        if r < rate / 2:
+            out.append(rng.choice(FILLER))
+        elif r < 3 * rate / 4 and len(out) > 1:
+            out[-1], out[-2] = out[-2], out[-1]
+    return " ".join(out)
+
+
+def corrupt(text: str, rng: random.Random, rate: float) -> str:
+    """Character-level edits: delete, substitute or insert characters."""
+    out = []
+    for ch in text:
+        r = rng.random()
+        if r < rate / 3:
+            continue
+        if r < 2 * rate / 3:
+            out.append(rng.choice(LETTERS))
+            continue
+        out.append(ch)
+        if r < rate:
+            out.append(rng.choice(LETTERS))
+    return "".join(out)
+
+
+class ShortlistRecallTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp = tempfile.TemporaryDirectory()
+        cls.existing = load_existing()
+        cls.index = DedupIndex(Path(cls.tmp.name) / "dedup-index.json")
+        cls.index.update(cls.existing)
+        rng = random.Random(20240601)
+        cls.sources = rng.sample(cls.existing, min(SOURCE_TERMS, len(cls.existing)))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tmp.cleanup()
+
+    def recall(self, variants: list[tuple[str, str]]) -> tuple[int, int, list]:
+        """(baseline rejections found, baseline rejections, misses) over (name, definition) variants."""
+        found = total = 0
+        misses = []
+        for name, definition in variants:
+            expected = full_scan(self.existing, name, definition)
+            if not expected:
+                continue
+            shortlist = self.index.candidates(name.lower().strip(), definition.lower().strip())
+            total += len(expected)
+            found += len(expected & shortlist)
+            misses.extend(sorted(expected - shortlist))
+        return found, total, misses
+
+    def test_reworded_definitions_are_always_shortlisted(self):
+        rng = random.Random(1)
+        variants = [
+            ("Unrelated Proposal", reword(term["definition"], rng, rate))
+            for term in self.sources
+            for rate in (0.2, 0.4, 0.6)
+        ]
+        found, total, misses = self.recall(variants)
+        self.assertGreater(total, len(self.sources))
+        self.assertEqual(misses, [], f"shortlist missed {len(misses)} of {total} full-scan rejections")
+
+    def test_near_identical_names_are_always_shortlisted(self):
+        rng = random.Random(2)
+        variants = [(corrupt(term["term"], rng, 0.08), "a wholly different definition") for term in self.sources]
+        found, total, misses = self.recall(variants)
+        self.assertEqual(misses, [], f"shortlist missed {len(misses)} of {total} full-scan rejections")
+
+    def test_character_level_corruption_recall_floor(self):
+        rng = random.Random(3)
+        variants = [
+            ("Unrelated Proposal", corrupt(term["definition"], rng, rate))
+            for term in self.sources
+            for rate in (0.15, 0.2, 0.25, 0.3, 0.35)
+        ]
+        found, total, _ = self.recall(variants)
+        self.assertGreater(total, 0)
+        self.assertGreaterEqual(found / total, CHAR_EDIT_RECALL_FLOOR)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""Quality evaluation: a reply that can't be scored is retried against the model, not the cache.
+
+Run with: python -m unittest discover tests  (or python -m pytest tests)
+"""
+
+import json
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bot"))
+
+# review_submission imports these at module level; the tests never reach
+# GitHub or a real provider, so placeholders are enough when the real
+# packages are not installed
+for _name, _placeholder in (("llm_router", {"LLMRouter": None}), ("requests", {})):
+    if _name not in sys.modules:
+        try:
+            __import__(_name)
+        except ImportError:
+            sys.modules[_name] = types.SimpleNamespace(**_placeholder)
+
+import review_submission
+from llm_cache import ResponseCache, cached
+
+
+class Reply:
+    def __init__(self, text: str):
+        self.text = text
+        self.model = "scripted"
+        self.provider_name = "scripted"
+
+
+class ScriptedRouter:
+    """Returns the scripted replies in order, one per call."""
+
+    def __init__(self, replies: list[str]):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def list_available(self, profile):
+        return []
+
+    def call(self, profile, messages, **options):
+        self.calls += 1
+        return Reply(self.replies.pop(0))
+
+
+SUBMISSION = {"term": "Example Drift", "definition": "An example.", "description": "", "example": ""}
+EXISTING = [{"term": "Context Amnesia", "definition": "Forgetting earlier context."}]
+GOOD = json.dumps({
+    "distinctness": 4, "structural": 4, "recognizability": 4, "clarity": 4, "naming": 4,
+    "verdict": "PUBLISH", "feedback": "ok",
+})
+
+
+class QualityEvaluationRetryTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(Path(self.tmp.name))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def evaluate(self, model: ScriptedRouter) -> dict:
+        return review_submission.quality_evaluation(cached(model, cache=self.cache), SUBMISSION, EXISTING)
+
+    def test_workflow_retry_asks_the_model_again(self):
+        # Each workflow attempt is a fresh process sharing the restored cache
+        first = ScriptedRouter(["I think this term is quite good!"])
+        self.assertEqual(self.evaluate(first)["verdict"], "MANUAL")
+
+        retry = ScriptedRouter([GOOD])
+        scores = self.evaluate(retry)
+        self.assertEqual(retry.calls, 1)
+        self.assertEqual(scores["verdict"], "PUBLISH")
+        self.assertEqual(scores["total"], 20)
+
+    def test_scored_reply_is_replayed(self):
+        self.evaluate(ScriptedRouter([GOOD]))
+        rerun = ScriptedRouter([])
+        self.assertEqual(self.evaluate(rerun)["verdict"], "PUBLISH")
+        self.assertEqual(rerun.calls, 0)
+
+    def test_salvaged_truncated_reply_is_cached(self):
+        truncated = GOOD[:GOOD.index('"verdict"')]
+        self.assertEqual(self.evaluate(ScriptedRouter([truncated]))["verdict"], "PUBLISH")
+        rerun = ScriptedRouter([])
+        self.assertEqual(self.evaluate(rerun)["verdict"], "PUBLISH")
+        self.assertEqual(rerun.calls, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+"""Tag review shards: a failed shard is retried against the model, not the cache.
+
+Run with: python -m unittest discover tests  (or python -m pytest tests)
+"""
+
+import json
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "bot"))
+
+# tag_review imports LLMRouter at module level; these tests drive it with a
+# scripted router instead, so a placeholder module is enough when the real
+# llm_router package is not installed
+if "llm_router" not in sys.modules:
+    try:
+        import llm_router  # noqa: F401
+    except ImportError:
+        sys.modules["llm_router"] = types.SimpleNamespace(LLMRouter=None)
+
+import tag_review
+from llm_cache import ResponseCache, cached
+
+
+class Reply:
+    def __init__(self, text: str):
+        self.text = text
+        self.model = "scripted"
+        self.provider_name = "scripted"
+
+
+class ScriptedRouter:
+    """Returns the scripted replies in order, one per call."""
+
+    def __init__(self, replies: list[str]):
+        self.replies = list(replies)
+        self.calls = 0
+
+    def list_available(self, profile):
+        return []
+
+    def call(self, profile, messages, **options):
+        self.calls += 1
+        return Reply(self.replies.pop(0))
+
+
+SHARD = [{"file": "example.md", "title": "Example", "tags": "cognition", "definition": "An example."}]
+GOOD = json.dumps({
+    "changes": [{"file": "example.md", "old_tags": "cognition", "new_tags": "cognition, memory"}],
+    "new_tags_proposed": ["memory"],
+    "rationale": "ok",
+})
+
+
+class ReviewShardsRetryTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResponseCache(Path(self.tmp.name))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_bad_reply_is_retried_against_the_model(self):
+        model = ScriptedRouter(["this is not JSON", GOOD])
+        router = cached(model, cache=self.cache)
+
+        results, failed = tag_review.review_shards(router, [SHARD], total=1, tag_counts="cognition (1)")
+
+        self.assertEqual(model.calls, 2)
+        self.assertEqual(failed, [])
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0][1]["changes"][0]["new_tags"], "cognition, memory")
+
+    def test_only_the_parsed_reply_is_replayed(self):
+        model = ScriptedRouter(["this is not JSON", GOOD])
+        tag_review.review_shards(cached(model, cache=self.cache), [SHARD], total=1, tag_counts="cognition (1)")
+
+        # A rerun is served the good reply from the cache without calling the model
+        rerun = ScriptedRouter([])
+        results, failed = tag_review.review_shards(
+            cached(rerun, cache=self.cache), [SHARD], total=1, tag_counts="cognition (1)",
+        )
+        self.assertEqual(rerun.calls, 0)
+        self.assertEqual(failed, [])
+        self.assertEqual(results[0][1]["new_tags_proposed"], ["memory"])
+
+    def test_shard_that_keeps_failing_is_reported(self):
+        model = ScriptedRouter(["nope"] * (tag_review.SHARD_RETRIES + 1))
+        results, failed = tag_review.review_shards(
+            cached(model, cache=self.cache), [SHARD], total=1, tag_counts="cognition (1)",
+        )
+        self.assertEqual(model.calls, tag_review.SHARD_RETRIES + 1)
+        self.assertEqual(results, [])
+        self.assertEqual(failed, [SHARD])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -500,6 +500,7 @@ const interestCache  = { data: null, fetchedAt: 0 };
 const changelogCache = { data: null, fetchedAt: 0 };
 const discussionsJsonCache = { data: null, fetchedAt: 0 };
 const tagsCache      = { data: null, fetchedAt: 0 };
+const similarityCache = { data: null, fetchedAt: 0 };
 
 // Reputation cache — longer TTL since scores change slowly
 // TODO: Reputation scoring is the first thing that should move to Supabase
@@ -955,6 +956,13 @@ async function handlePropose(data, env, request) {
       existing_term: dup.existingTerm,
       suggestion: "If you believe this describes a genuinely distinct experience, please adjust the name or definition to clarify the difference.",
     };
+    if (dup.source === "existing_term") {
+      // Neighbors precomputed by the API build (similarity.json), so the
+      // proposer sees the terms around the one they collided with
+      const graph = await fetchStaticJson(`${STATIC_API_BASE}/similarity.json`, similarityCache);
+      const neighbors = graph?.neighbors?.[dup.existingTerm.slug] || [];
+      response.nearby_terms = neighbors.slice(0, 5).map(([slug, score]) => ({ slug, score }));
+    }
     return json(response, 409);
   }
 